@@ -0,0 +1,95 @@
+import csv, time, argparse
+from os import path, makedirs, getenv
+from dotenv import load_dotenv
+from Workload import WorkloadRunner, postProcess, tableKeys
+from Datasets import Dataset, datasetSchemas
+
+# Population of a table through each engine's fastest native ingest path, kept out of the CRUD loops, so
+# read workloads (retrieve, load generator) can run against multi-million-row tables:
+#   MongoDB  unordered insert_many of raw BSON with document validation bypassed (what mongoimport does)
+#   Oracle   python-oracledb's Direct Path Load interface (thin mode), else APPEND_VALUES array inserts
+#   Redis    mass insertion: SET commands encoded as raw RESP and streamed over one connection (redis-cli --pipe)
+#   Neo4j    large UNWIND ... CREATE transactions; for a fresh database, neo4jImportFiles() below writes
+#            neo4j-admin import CSVs from the dataset instead
+#   SQLite   every batch in one transaction
+#   others   prepare() + bulkInsert() per batch
+# The table is emptied first and its indexes are built after the rows, the usual order for a bulk import:
+# whatever indexes and constraints reset leaves or creates (MongoDB keeps a collection's indexes, Neo4j's
+# reset creates its key constraint) are dropped before the load, and what the engine still reports during it
+# (e.g. MongoDB's _id index) is stored with the result as indexesDuringLoad.
+# Reading the dataset is part of the load, which is timed once as a whole ("loadTime") and stored as its own
+# result; building the indexes afterwards is reported apart as "indexTime".
+
+
+class BulkLoader(WorkloadRunner):
+    def __init__(self, adapter, **runnerOptions) -> None:
+        super().__init__(adapter, 1, **runnerOptions)
+
+    @postProcess
+    def run(self, documentData:list[dict] | Dataset, tableName:str, rows:int=None):
+        rows = min(rows or len(documentData), len(documentData))
+        batches = documentData.batches(rows) if isinstance(documentData, Dataset) else [documentData[:rows]]
+        print(f"Bulk loading {rows:,} rows into {tableName}")
+
+        self.adapter.instrument = None
+        self.adapter.reset(tableName)
+        self.adapter.dropIndexes(tableName)
+        indexesDuringLoad = self.adapter.describeSchema(tableName)
+        self.adapter.instrument = self.instrument
+        loadStartTime, loadEndTime, loadTime = self.timed("bulkLoad", rows, self.adapter.bulkLoad, tableName, batches)
+
+        self.adapter.instrument = None
+        indexStartNs = time.perf_counter_ns()
+        self.setupSchema(tableName)
+        indexTime = (time.perf_counter_ns() - indexStartNs) / 1e9
+        print(f"Loaded in {loadTime:.1f}s ({rows / loadTime if loadTime else 0:,.0f} rows/sec), indexes built in {indexTime:.1f}s")
+
+        entries = [{"run": 1, "repetition": 1, "qSize": rows, "loadStartTime": loadStartTime, "loadEndTime": loadEndTime,
+                    "loadTime": loadTime, "indexTime": indexTime}]
+        resultInfo = self.resultInfo(tableName, "bulkLoad", entries, [self.aggregate(1, rows, entries, ["loadTime", "indexTime"])])
+        resultInfo["loadMethod"] = self.adapter.loadMethod
+        resultInfo["indexesDuringLoad"] = indexesDuringLoad
+        return resultInfo
+
+
+def neo4jImportFiles(dataset:Dataset, outputDirectory:str):
+    # Header and data files for `neo4j-admin database import full`, one node per row labelled with the table
+    # name. The key column is the node ID (stored as an integer property with --id-type=integer) and dates are
+    # written as local datetimes, matching what the driver stores for naive datetime parameters.
+    schema = datasetSchemas[dataset.tableName]
+    makedirs(outputDirectory, exist_ok=True)
+    headerPath = path.join(outputDirectory, f"{dataset.tableName}_header.csv")
+    dataPath = path.join(outputDirectory, f"{dataset.tableName}.csv")
+
+    columns = None
+    with open(dataPath, "w", newline="") as f:
+        writer = csv.writer(f)
+        for batch in dataset.batches():
+            rows = batch if isinstance(batch, list) else batch.to_pylist()
+            if columns is None and rows:
+                columns = list(rows[0])
+            for row in rows:
+                writer.writerow(["" if row[column] is None else row[column].isoformat() if column in schema["parseDates"] else row[column] for column in columns])
+
+    keyField = tableKeys[dataset.tableName]
+    types = {column: "long" for column, columnType in schema["dtype"].items() if columnType is int}
+    types.update({column: "localdatetime" for column in schema["parseDates"]})
+    header = [f"{column}:ID({dataset.tableName})" if column == keyField else f"{column}:{types[column]}" if column in types else column for column in columns or []]
+    with open(headerPath, "w", newline="") as f:
+        csv.writer(f).writerow(header)
+
+    return f"--nodes={dataset.tableName}={headerPath},{dataPath}"
+
+
+if __name__ == "__main__":
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Write neo4j-admin import files for the benchmark datasets")
+    parser.add_argument("tables", nargs="+", help="dataset names, e.g. loans UserPostComment")
+    parser.add_argument("--output", default=path.join(getenv("saveDataDirectory") or ".", "neo4jImport"), help="directory for the CSV files")
+    parser.add_argument("--database", default="neo4j", help="database to create (must not exist, or be stopped and overwritten)")
+    args = parser.parse_args()
+
+    nodes = [neo4jImportFiles(Dataset(tableName, getenv("dataDirectory"), int(getenv("batchSize", 10000)), getenv("csvReader", "pandas")), args.output)
+             for tableName in args.tables]
+    print(f"neo4j-admin database import full {args.database} --id-type=integer --overwrite-destination {' '.join(nodes)}")
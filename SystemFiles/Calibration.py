@@ -0,0 +1,69 @@
+import time, statistics
+from Metrics import Instrument
+from Workload import postProcess
+
+# Harness-overhead calibration, so engine numbers can be read net of what the harness itself costs.
+#   timer      clock resolution, the cost of reading the clock, of one Instrument.measure and one
+#              Instrument.request around a no-op, and of one loop iteration; stored as the Null
+#              engine's harness/calibration result
+#   workloads  any workload run against the null engine (LocalDBMS.NullDB) goes through the identical
+#              runner and request path with no engine behind it; Report.py subtracts its times from every
+#              engine's at the same table, operation and size and shows both raw and corrected throughput
+# Dataset reads and prepare() are outside the timed window and already reported per run as dataPrep.
+
+def noop(*args):
+    return None
+
+def clockStepNs(samples:int):
+    # Smallest non-zero difference between consecutive perf_counter_ns readings
+    step = None
+    previous = time.perf_counter_ns()
+    for _ in range(samples):
+        now = time.perf_counter_ns()
+        if now != previous:
+            step = now - previous if step is None else min(step, now - previous)
+            previous = now
+    return step or 0
+
+def perCallNs(func, samples:int):
+    startNs = time.perf_counter_ns()
+    for _ in range(samples):
+        func()
+    return (time.perf_counter_ns() - startNs) / samples
+
+def timerRound(samples:int):
+    instrument = Instrument()
+    loopNs = perCallNs(lambda: None, samples)
+
+    def request():
+        instrument.request(noop)
+
+    def measuredRequests():
+        for _ in range(samples):
+            instrument.request(noop)
+
+    requestNs = perCallNs(request, samples)
+    _, _, measuredNs = instrument.measure("calibration", samples, measuredRequests)
+
+    return {
+        "clockResolutionNs": time.get_clock_info("perf_counter").resolution * 1e9,
+        "clockStepNs": clockStepNs(samples),
+        "clockReadNs": perCallNs(time.perf_counter_ns, samples) - loopNs,
+        "loopNs": loopNs,
+        # Outside a phase request() only forwards the call; inside one it also times and records it
+        "requestForwardNs": requestNs - loopNs,
+        "requestRecordedNs": measuredNs / samples - perCallNs(noop, samples),
+        "measureNs": perCallNs(lambda: instrument.measure("calibration", 1, noop), samples) - loopNs,
+    }
+
+@postProcess
+def calibrate(saveDirectory:str, samples:int=200000, repetitions:int=5):
+    print("Calibrating harness overhead")
+    entries = [{"run": 1, "repetition": repetition, **timerRound(samples)} for repetition in range(1, repetitions + 1)]
+    aggregate = {"run": 1, **{metric: statistics.median(entry[metric] for entry in entries) for metric in entries[0] if metric not in ("run", "repetition")}}
+    for metric, value in aggregate.items():
+        if metric != "run":
+            print(f"  {metric}: {value:,.1f} ns")
+
+    return {"saveDirectory": saveDirectory, "tableName": "harness", "dbms": "Null", "variant": "",
+            "operation": "calibration", "samples": samples, "repetitions": repetitions, "result": entries, "aggregate": [aggregate]}
@@ -0,0 +1,44 @@
+import time, atexit, threading
+
+# Connection pools shared by every adapter of a process, so repeated menu passes, sweep cells and load
+# generator workers stop paying connection setup (TCP, TLS, authentication) for each new adapter.
+# An adapter created with a poolSize takes its engine's pool from here instead of connecting itself:
+#   MongoDB  one MongoClient with maxPoolSize
+#   Oracle   one oracledb pool (min 1, max poolSize); each adapter holds one pooled connection until closeConn
+#   Redis    one blocking ConnectionPool with max_connections
+#   Neo4j    one driver with max_connection_pool_size
+# Pools are keyed by engine, connection settings and size, and are closed when the process exits.
+
+
+class ConnectionManager:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.pools = {}
+        self.closers = {}
+
+    def pool(self, key:tuple, create, close):
+        with self.lock:
+            if key not in self.pools:
+                self.pools[key] = create()
+                self.closers[key] = close
+            return self.pools[key]
+
+    def acquire(self, connect, *args):
+        # (connection, nanoseconds until it was usable), pooled or not, so setup cost is reported on its own
+        startNs = time.perf_counter_ns()
+        connection = connect(*args)
+        return connection, time.perf_counter_ns() - startNs
+
+    def closeAll(self):
+        with self.lock:
+            for key, pool in self.pools.items():
+                try:
+                    self.closers[key](pool)
+                except Exception as e:
+                    print(f"Closing pool {key[0]} failed: {e}")
+            self.pools.clear()
+            self.closers.clear()
+
+
+connections = ConnectionManager()
+atexit.register(connections.closeAll)
@@ -1,33 +1,62 @@
-import json, time
-from os import path
+import re, json
 from datetime import datetime
-from neo4j import GraphDatabase
-import redis, cx_Oracle, pymongo
-from faker import Faker
-
-def postProcess(func):
-    def wrapper(*args, **kwargs):
-        # Pre-process inputs
-        print(f"Running CRUD operation")
-
-        # Call the decorated function and get the result
-        resultInfo = func(*args, **kwargs)
-
-        filename = f"{resultInfo['dbms']}_{resultInfo['tableName']}_{resultInfo['operation']}.json"
-        filepath = path.join(resultInfo["saveDirectory"], filename)
-        print(f"Saving Result Data as {filename}")
-
-        # save the resultInfo list to the JSON file
-        with open(filepath, "w") as f:
-            json.dump(resultInfo, f, indent=4)
-
-        return resultInfo
-    return wrapper
+from Workload import DBMSAdapter, tableKeys, tableIndexes, queryIndexes, fullTextIndexes, wordPattern
+from Connections import connections
+from Schema import indexName
+
+# Drivers are optional, so a machine with only some of them (or none, using the stand-ins in LocalDBMS.py)
+# can still run the harness; connecting an adapter whose driver is missing raises the original ImportError
+missingDrivers = {}
+try:
+    import pymongo
+    from pymongo import InsertOne, WriteConcern
+    from bson import encode
+    from bson.raw_bson import RawBSONDocument
+except ImportError as e:
+    missingDrivers["MongoDB"] = e
+try:
+    import oracledb
+except ImportError as e:
+    missingDrivers["Oracle"] = e
+try:
+    import redis
+except ImportError as e:
+    missingDrivers["Redis"] = e
+try:
+    from neo4j import GraphDatabase, AsyncGraphDatabase
+except ImportError as e:
+    missingDrivers["Neo4j"] = e
+
+def requireDriver(name:str):
+    if name in missingDrivers:
+        raise missingDrivers[name]
 
 # MongoDB
-class MongoDB:
-    def __init__(self, connUrl:str, dbName:str, sdDirectory:str,  dDirectory: str, user="", passw="") -> None:
+class MongoDB(DBMSAdapter):
+    # Selectable write variants, so the cost of each durability/transport setting can be measured:
+    #   ordered       insert_many/bulk_write ordered flag
+    #   batchSize     documents per client-side batch (None lets the driver split by maxWriteBatchSize)
+    #   useBulkWrite  explicit bulk_write of InsertOne requests instead of insert_many
+    #   writeConcern  WriteConcern arguments, e.g. {"w": "majority", "j": True}
+    #   compressors   wire compression negotiated with the server ("zstd", "snappy", "zlib")
+    variantPresets = {
+        "default": {},
+        "unordered": {"ordered": False},
+        "bulkWrite": {"ordered": False, "batchSize": 10000, "useBulkWrite": True},
+        "w0": {"writeConcern": {"w": 0}},
+        "w1": {"writeConcern": {"w": 1}},
+        "w1Journaled": {"writeConcern": {"w": 1, "j": True}},
+        "majority": {"writeConcern": {"w": "majority"}},
+        "majorityJournaled": {"writeConcern": {"w": "majority", "j": True}},
+        "zstd": {"compressors": "zstd"},
+        "snappy": {"compressors": "snappy"}
+    }
+
+    def __init__(self, connUrl:str, dbName:str, sdDirectory:str,  dDirectory: str, user="", passw="",
+                 variant:str="default", ordered:bool=True, batchSize:int=None, useBulkWrite:bool=False, writeConcern:dict=None, compressors:str=None,
+                 poolSize:int=None) -> None:
         self.name = "MongoDB"
+        self.variant = variant
 
         self.connUrl = connUrl
         self.user = user
@@ -35,194 +64,235 @@ class MongoDB:
         self.saveDataDirectory = sdDirectory
         self.dataDirectory = dDirectory
 
-        # Establish a connection to the local MongoDB server
-        self.client = pymongo.MongoClient(self.connUrl)
+        self.ordered = ordered
+        self.batchSize = batchSize
+        self.useBulkWrite = useBulkWrite
+        self.writeConcern = WriteConcern(**writeConcern) if writeConcern else None
+
+        # Establish a connection to the local MongoDB server; with poolSize the process-wide pooled client is reused
+        self.poolSize = poolSize
+        clientOptions = {"compressors": compressors} if compressors else {}
+        self.client, self.acquireNs = connections.acquire(self.connect, clientOptions)
 
         # Access the database
+        self.dbName = dbName
         self.db = self.client[dbName]
+        self.asyncClient = None
 
         if dbName.lower() == 'library':
-            self.collections = {
-                "members": self.db["members"],
-                "books": self.db["books"],
-                "loans": self.db["loans"]
-            }
+            collectionNames = ["members", "books", "loans"]
         elif dbName.lower() == 'socialmedia':
-            self.collections = {
-                "UserPostComment": self.db["UserPostComment"]
-            }
-
-    def closeConn(self):
-        # Close the client
-        self.client.close()
-
-    @postProcess
-    def libraryRunTest(self, documentData:list[dict], collectionName:str, iterations:int):
-        # note dData should be translated to bJSON if that matters for MongoDB
-        dataToStore = []
-
-        mainCollection = self.collections[collectionName]
-        mainCollection.delete_many({}) # reset
-
-        divisionFactor = len(documentData) // iterations
-        iterSize = 0
-
-        for i in range(iterations):
-            run = i + 1
-            print(f"Run {run}")
-            
-            iterSize += divisionFactor
-            dataToInsert = documentData[:iterSize]
-
-            inStartTime = time.time()
-            result = mainCollection.insert_many(dataToInsert)
-            inEndTime = time.time()
-
-            update_query = {
-                "$set": {
-                    "ReturnDate": datetime.utcnow()
-                }
-            }
-
-            upStartTime = time.time()
-            mainCollection.update_many({}, update_query)
-            upEndTime = time.time()
-
-            delStartTime = time.time()
-            result = mainCollection.delete_many({})
-            delEndTime = time.time()
-
-            dataToStore.append({
-                "run":run, "qSize":iterSize,
-                "inStartTime": inStartTime, "inEndTime": inEndTime, "inTime":round(abs(inEndTime - inStartTime), 2), 
-                "upStartTime": upStartTime, "upEndTime": upEndTime, "upTime":round(abs(upStartTime - upEndTime), 2), 
-                "delStartTime": delStartTime, "delEndTime": delEndTime, "delTime":round(abs(delStartTime - delEndTime), 2),                     
-            })
-
-        if result.acknowledged:
-            print(f"Inserted")
+            collectionNames = ["UserPostComment"]
         else:
-            print("Insert operation failed")
+            collectionNames = []
+        self.collections = {name: self.db.get_collection(name, write_concern=self.writeConcern) for name in collectionNames}
 
-        return {"saveDirectory":self.saveDataDirectory, "tableName": collectionName, "dbms": self.name, "operation":"runTest", "result":dataToStore}
-    
-    @postProcess
-    def libraryRetrieveTest(self, collectionName:str, sizeOfData:int, iterations:int):
-        dataToStore = []
-        divisionFactor = sizeOfData // iterations
+        # Collections that currently have the query suite's full-text index
+        self.fullTextIndexed = set()
 
-        startID = 1
-        endID = 0
-        iterSize = 0
-
-        collection = self.db[collectionName]
-
-        for i in range(iterations):
-            run = i + 1
-            iterSize += divisionFactor
-            print(f"Run {run}")
-
-            endID += divisionFactor
-            print(startID, endID)
-
-            # Retrieval Test 1: ID Range Query
-            q1StartTime = time.time()
-            query1 = {"LoanID": {"$gte": startID, "$lte": endID}}
-            rows = list(collection.find(query1))  # to actually parse all data into system
-            q1EndTime = time.time()
-
-            # Retrieval Test 2: Title Search
-            # q2StartTime = time.time()
-            # pipeline = [
-            #     {
-            #         "$lookup": {
-            #             "from": "books",
-            #             "localField": "BookID",
-            #             "foreignField": "BookID",
-            #             "as": "book_details"
-            #         }
-            #     },
-            #     {"$unwind": "$book_details"},
-            #     {"$match": {"book_details.Title": {"$regex": "the", "$options": "i"}}}
-            # ]
-            # rows = list(collection.aggregate(pipeline))  # to actually parse all data into system
-            # q2EndTime = time.time()
-
-            dataToStore.append({
-                "run": run,
-                "qSize": iterSize,
-                "q1StartTime": q1StartTime,
-                "q1EndTime": q1EndTime,
-                "q1Time": round(abs(q1StartTime - q1EndTime), 5),
-                # "q2StartTime": q2StartTime,
-                # "q2EndTime": q2EndTime,
-                # "q2Time": round(abs(q2StartTime - q2EndTime), 2)
-            })
-
-        return {"saveDirectory": self.saveDataDirectory, "tableName": collectionName, "dbms": self.name, "operation": "search", "result": dataToStore}
-
-    @postProcess
-    def socialMediaRunTest(self, documentData:list[dict], collectionName:str, iterations:int):
-        fake = Faker()
-
-        # note dData should be translated to bJSON if that matters for MongoDB
-        dataToStore = []
-
-        mainCollection = self.collections[collectionName]
-        mainCollection.delete_many({}) # reset
-
-        divisionFactor = len(documentData) // iterations
-        userIDs = list(range(1, len(documentData) + 1))
-
-        text = fake.text(max_nb_chars=500 + 50)
-        newText = text[:500].ljust(500)  
-        
-        iterSize = 0
-
-        for i in range(iterations):
-            run = i + 1
-            print(f"Run {run}")
-            
-            iterSize += divisionFactor
-            dataToInsert = documentData[:iterSize]
-            
-            update_query = {
-                "$set": {
-                    "Content": newText
-                }
-            }
-
-            inStartTime = time.time()
-            result = mainCollection.insert_many(dataToInsert)
-            inEndTime = time.time()
-
-            # Perform the bulk update
-            upStartTime = time.time()
-            mainCollection.update_many({}, update_query)
-            upEndTime = time.time()
-
-            delStartTime = time.time()
-            result = mainCollection.delete_many({})
-            delEndTime = time.time()
-
-            dataToStore.append({
-                "run":run, "qSize":iterSize,
-                "inStartTime": inStartTime, "inEndTime": inEndTime, "inTime":round(abs(inEndTime - inStartTime), 2), 
-                "upStartTime": upStartTime, "upEndTime": upEndTime, "upTime":round(abs(upStartTime - upEndTime), 2), 
-                "delStartTime": delStartTime, "delEndTime": delEndTime, "delTime":round(abs(delStartTime - delEndTime), 2),                     
-            })
-
-        if result.acknowledged:
-            print(f"Inserted")
+    def connect(self, clientOptions:dict):
+        requireDriver("MongoDB")
+        if self.poolSize:
+            client = connections.pool(("mongodb", self.connUrl, json.dumps(clientOptions), self.poolSize),
+                                      lambda: pymongo.MongoClient(self.connUrl, maxPoolSize=self.poolSize, **clientOptions), lambda client: client.close())
         else:
-            print("Insert operation failed")
+            client = pymongo.MongoClient(self.connUrl, **clientOptions)
 
-        return {"saveDirectory":self.saveDataDirectory, "tableName": collectionName, "dbms": self.name, "operation":"runTest", "result":dataToStore}
-    
+        # MongoClient connects lazily; the ping makes the handshake (or pool checkout) part of the acquisition
+        client.admin.command("ping")
+        return client
 
-class Oracle:
-    def __init__(self, dsn:str, dbName:str, sdDirectory:str,  dDirectory: str, user="", passw="", tableSchema=""):
+    def closeConn(self):
+        # Close the client; a pooled one stays open for the next adapter
+        if not self.poolSize:
+            self.client.close()
+
+    def serverStats(self):
+        status = self.client.admin.command("serverStatus")
+        stats = {f"opcounters.{name}": count for name, count in status["opcounters"].items()}
+        stats.update({f"network.{name}": status["network"][name] for name in ("bytesIn", "bytesOut", "numRequests")})
+        stats.update({"connections.current": status["connections"]["current"], "mem.residentMB": status["mem"]["resident"]})
+        cache = status.get("wiredTiger", {}).get("cache", {})
+        for name in ("bytes currently in the cache", "pages read into cache", "pages written from cache"):
+            if name in cache:
+                stats[f"wiredTiger.{name}"] = cache[name]
+        return stats
+
+    def collection(self, collectionName:str):
+        # Timed operations use the variant's write concern; setup and resets always use the default (acknowledged) one
+        if collectionName not in self.collections:
+            self.collections[collectionName] = self.db.get_collection(collectionName, write_concern=self.writeConcern)
+        return self.collections[collectionName]
+
+    def setupSchema(self, collectionName:str):
+        if self.schemaVariant is None:
+            for field in tableIndexes.get(collectionName, []):
+                self.db[collectionName].create_index(field)
+
+    def reset(self, collectionName:str):
+        self.db[collectionName].delete_many({})
+
+    def prepare(self, collectionName:str, documentData:list[dict]):
+        # Encoded to BSON once, outside the timed window; RawBSONDocuments are sent as-is and reused
+        # across iterations (the server assigns _id, so the prepared batch is never mutated)
+        documents = [RawBSONDocument(encode(row)) for row in documentData]
+        if self.useBulkWrite:
+            return [InsertOne(document) for document in documents]
+        return documents
+
+    def payloadEncoding(self):
+        return "MongoDB:bulkWrite" if self.useBulkWrite else "MongoDB:rawBson"
+
+    def bulkInsert(self, collectionName:str, rows:list):
+        collection = self.collection(collectionName)
+        batchSize = self.batchSize or max(len(rows), 1)
+
+        for i in range(0, len(rows), batchSize):
+            if self.useBulkWrite:
+                result = self.request(collection.bulk_write, rows[i:i + batchSize], ordered=self.ordered)
+            else:
+                result = self.request(collection.insert_many, rows[i:i + batchSize], ordered=self.ordered)
+
+            # w:0 writes are never acknowledged by design
+            if not result.acknowledged and collection.write_concern.acknowledged:
+                print("Insert operation failed")
+
+    def bulkUpdate(self, collectionName:str, changes:dict):
+        self.request(self.collection(collectionName).update_many, {}, {"$set": changes})
+
+    def bulkDelete(self, collectionName:str):
+        self.request(self.collection(collectionName).delete_many, {})
+
+    def bulkLoad(self, collectionName:str, batches):
+        # mongoimport's path: unordered raw BSON batches, acknowledged, with document validation bypassed
+        self.loadMethod = "insert_many(ordered=False, rawBson)"
+        collection = self.db[collectionName]
+        for batch in batches:
+            rows = batch if isinstance(batch, list) else batch.to_pylist()
+            self.request(collection.insert_many, [RawBSONDocument(encode(row)) for row in rows], ordered=False, bypass_document_validation=True)
+
+    def updateRecord(self, collectionName:str, keyField:str, recordID:int, changes:dict):
+        self.request(self.collection(collectionName).update_one, {keyField: recordID}, {"$set": changes})
+
+    def rangeRead(self, collectionName:str, keyField:str, startID:int, endID:int):
+        query = {keyField: {"$gte": startID, "$lte": endID}}
+        return self.request(lambda: list(self.collection(collectionName).find(query)))  # to actually parse all data into system
+
+    def createQueryIndexes(self, collectionName:str):
+        collection = self.collection(collectionName)
+        for field in queryIndexes.get(collectionName, []):
+            collection.create_index(field, name=f"{field}_query")
+        if collectionName in fullTextIndexes:
+            # Language "none": no stemming or stop words, so $text matches the same words as the regex scan
+            collection.create_index([(fullTextIndexes[collectionName], pymongo.TEXT)], name=f"{fullTextIndexes[collectionName]}_text", default_language="none")
+            self.fullTextIndexed.add(collectionName)
+
+    def dropQueryIndexes(self, collectionName:str):
+        collection = self.collection(collectionName)
+        existing = collection.index_information()
+        names = [f"{field}_query" for field in queryIndexes.get(collectionName, [])]
+        if collectionName in fullTextIndexes:
+            names.append(f"{fullTextIndexes[collectionName]}_text")
+        for name in names:
+            if name in existing:
+                collection.drop_index(name)
+        self.fullTextIndexed.discard(collectionName)
+
+    def createIndex(self, collectionName:str, kind:str, fields:list[str]):
+        keys = [(field, pymongo.TEXT if kind == "text" else pymongo.ASCENDING) for field in fields]
+        options = {"default_language": "none"} if kind == "text" else {}
+        self.db[collectionName].create_index(keys, name=indexName(collectionName, kind, fields), unique=kind == "primary", **options)
+        if kind == "text":
+            self.fullTextIndexed.add(collectionName)
+
+    def dropIndexes(self, collectionName:str):
+        # Everything but the implicit _id index; a collection that does not exist yet has nothing to drop
+        if collectionName in self.db.list_collection_names():
+            self.db[collectionName].drop_indexes()
+        self.fullTextIndexed.discard(collectionName)
+
+    def describeSchema(self, collectionName:str):
+        return [{"name": name, "fields": [field for field, _ in info["key"]], "unique": bool(info.get("unique"))}
+                for name, info in self.db[collectionName].index_information().items()]
+
+    def query(self, name:str, parameters:dict):
+        loans = self.collection("loans")
+        match name:
+            case "pointLookup":
+                return self.request(lambda: list(loans.find({"LoanID": parameters["loanID"]})))
+            case "memberLoans":
+                return self.request(lambda: list(loans.find({"MemberID": parameters["memberID"]})))
+            case "loanDateRange":
+                return self.request(lambda: list(loans.find({"LoanDate": {"$gte": parameters["start"], "$lt": parameters["end"]}})))
+            case "titleJoin":
+                pipeline = [
+                    {"$match": {"Title": {"$regex": re.escape(parameters["keyword"]), "$options": "i"}}},
+                    {"$lookup": {"from": "loans", "localField": "BookID", "foreignField": "BookID", "as": "loan"}},
+                    {"$unwind": "$loan"}
+                ]
+                return self.request(lambda: list(self.collection("books").aggregate(pipeline)))
+            case "loansPerMember":
+                pipeline = [
+                    {"$group": {"_id": "$MemberID", "loans": {"$sum": 1}}},
+                    {"$lookup": {"from": "members", "localField": "_id", "foreignField": "MemberID", "as": "member"}},
+                    {"$project": {"_id": 0, "MemberID": "$_id", "Name": {"$first": "$member.Name"}, "loans": 1}}
+                ]
+                return self.request(lambda: list(loans.aggregate(pipeline)))
+            case "overdueCount":
+                overdue = {"$or": [{"ReturnDate": None, "DueDate": {"$lt": parameters["asOf"]}}, {"$expr": {"$gt": ["$ReturnDate", "$DueDate"]}}]}
+                return self.request(loans.count_documents, overdue)
+            case "topBooks":
+                pipeline = [{"$group": {"_id": "$BookID", "loans": {"$sum": 1}}}, {"$sort": {"loans": -1}}, {"$limit": parameters["k"]}]
+                return self.request(lambda: list(loans.aggregate(pipeline)))
+            case "contentSearch":
+                comments = self.collection("UserPostComment")
+                # $text needs the text index; without it the same whole word is matched with a regex scan
+                if "UserPostComment" in self.fullTextIndexed:
+                    query = {"$text": {"$search": parameters["term"]}}
+                else:
+                    query = {"Content": {"$regex": wordPattern(parameters["term"])}}
+                return self.request(lambda: list(comments.find(query)))
+        raise ValueError(f"Unknown query {name}")
+
+    async def asyncRangeRead(self, collectionName:str, keyField:str, startID:int, endID:int):
+        if self.asyncClient is None:
+            # motor is only needed for the asyncio load generator
+            from motor.motor_asyncio import AsyncIOMotorClient
+            self.asyncClient = AsyncIOMotorClient(self.connUrl)
+
+        query = {keyField: {"$gte": startID, "$lte": endID}}
+        return await self.asyncClient[self.dbName][collectionName].find(query).to_list(None)
+
+    async def asyncClose(self):
+        if self.asyncClient is not None:
+            self.asyncClient.close()
+            self.asyncClient = None
+
+
+class Oracle(DBMSAdapter):
+    # Selectable tuning variants, so each knob can be measured on its own:
+    #   batchSize     rows per executemany call (None sends the whole slice at once)
+    #   arraysize / prefetchrows  rows per fetch round trip for range reads
+    #   resetMode     "delete" (DELETE FROM) or "truncate" (TRUNCATE TABLE)
+    #   directPath    INSERT /*+ APPEND_VALUES */, committed after every batch
+    variantPresets = {
+        "default": {},
+        "batched": {"batchSize": 10000},
+        "fetchTuned": {"arraysize": 5000, "prefetchrows": 5001},
+        "truncate": {"resetMode": "truncate"},
+        "directPath": {"batchSize": 10000, "directPath": True, "resetMode": "truncate"}
+    }
+
+    # V$SYSSTAT counters read around each phase when telemetry is enabled
+    sysstatNames = ["user commits", "execute count", "parse count (hard)", "session logical reads", "physical reads",
+                    "physical writes", "redo size", "CPU used by this session", "bytes received via SQL*Net from client",
+                    "bytes sent via SQL*Net to client", "SQL*Net roundtrips to/from client"]
+
+    def __init__(self, dsn:str, dbName:str, sdDirectory:str,  dDirectory: str, user="", passw="", tableSchema="",
+                 variant:str="default", batchSize:int=None, arraysize:int=100, prefetchrows:int=2, resetMode:str="delete", directPath:bool=False, clientLibDir:str=None,
+                 poolSize:int=None):
         self.name = "Oracle"
+        self.variant = variant
 
         self.dsn = dsn
         self.user = user
@@ -231,522 +301,921 @@ class Oracle:
         self.tableSchema = tableSchema
         self.dbName = dbName
 
-        self.saveDataDirectory = sdDirectory 
+        self.saveDataDirectory = sdDirectory
         self.dataDirectory = dDirectory
 
+        self.batchSize = batchSize
+        self.arraysize = arraysize
+        self.prefetchrows = prefetchrows
+        self.resetMode = resetMode
+        self.directPath = directPath
+
         self.connection = None
         self.cursor = None
 
-        # Establish connection to the Oracle DB
-        self.connection = cx_Oracle.connect(user=self.user, password=self.password, dsn=self.dsn)
-        self.cursor = self.connection.cursor()
+        # Column order of the tuples produced by prepare(), and the matching setinputsizes() arguments, per table
+        self.columns = {}
+        self.inputSizes = {}
+
+        # Tables that currently have the query suite's Oracle Text index
+        self.fullTextIndexed = set()
+
+        requireDriver("Oracle")
+
+        # python-oracledb runs in thin mode (no Instant Client) unless a client library directory is given
+        if clientLibDir and oracledb.is_thin_mode():
+            oracledb.init_oracle_client(lib_dir=clientLibDir)
+
+        # Establish connection to the Oracle DB, or take one from the process-wide pool when poolSize is set
+        self.poolSize = poolSize
+        self.connection, self.acquireNs = connections.acquire(self.connect)
+        self.cursor = self.readCursor()
+
+    def connect(self):
+        if self.poolSize:
+            pool = connections.pool(("oracle", self.dsn, self.user, self.poolSize),
+                                    lambda: oracledb.create_pool(user=self.user, password=self.password, dsn=self.dsn, min=1, max=self.poolSize, increment=1),
+                                    lambda pool: pool.close(force=True))
+            return pool.acquire()
+        return oracledb.connect(user=self.user, password=self.password, dsn=self.dsn)
 
     def closeConn(self):
-        # Close the cursor and connection
+        # Close the cursor and connection (a pooled connection goes back to the pool)
         if self.cursor:
             self.cursor.close()
         if self.connection:
             self.connection.close()
 
-    @postProcess
-    def libraryRunTest(self, documentData:list[dict], tableName:str, iterations:int):
-        newDocumentData = [(row['LoanID'], row['BookID'], row['MemberID'], row['LoanDate'], row['DueDate'], row['ReturnDate']) for row in documentData]
-        dataToStore = []
-
-        newTableName = f"{self.tableSchema}.{tableName}"
-
-        # Reset the table by deleting all rows
-        reset_query = f"DELETE FROM {newTableName}"
-        # reset_query = f"TRUNCATE TABLE {newTableName}"
-
-        self.cursor.execute(reset_query)
-        self.connection.commit()
-
-        divisionFactor = len(newDocumentData) // iterations
-        iterSize = 0
-
-        for i in range(iterations):
-            run = i + 1
-            print(f"Run {run}")
-
-            iterSize += divisionFactor
-            dataToInsert = newDocumentData[:iterSize]
-
-            insertQuery = f"""
-                INSERT INTO {newTableName} (LoanID, BookID, MemberID, LoanDate, DueDate, ReturnDate)
-                VALUES (:LoanID, :BookID, :MemberID, :LoanDate, :DueDate, :ReturnDate)
-            """
-
-            # Insert data
-            inStartTime = time.time()
-            self.cursor.executemany(insertQuery, dataToInsert)
-            self.connection.commit()
-            inEndTime = time.time()
-
-            # updateQuery = f"""
-            #     UPDATE {newTableName}
-            #     SET ReturnDate = CASE 
-            #         WHEN ReturnDate IS NULL THEN NULL
-            #         ELSE ReturnDate + INTERVAL '1' DAY
-            #     END
-            # """
-
-            updateQuery = f"""
-                UPDATE {newTableName}
-                SET returnDate = SYSDATE
-            """
-
-            # Update records
-            upStartTime = time.time()
-            self.cursor.execute(updateQuery)
-            self.connection.commit()
-            upEndTime = time.time()
-
-            time.sleep(1)
-
-            # Delete all records
-            delStartTime = time.time()
-            self.cursor.execute(reset_query)
-            self.connection.commit()
-            delEndTime = time.time()
-
-            dataToStore.append({
-                "run": run,
-                "qSize": iterSize,
-                "inStartTime": inStartTime,
-                "inEndTime": inEndTime,
-                "inTime": round(abs(inEndTime - inStartTime), 2),
-                "upStartTime": upStartTime,
-                "upEndTime": upEndTime,
-                "upTime": round(abs(upEndTime - upStartTime), 2),
-                "delStartTime": delStartTime,
-                "delEndTime": delEndTime,
-                "delTime": round(abs(delEndTime - delStartTime), 2),
-            })
-
-        return {"saveDirectory": self.saveDataDirectory, "tableName": tableName, "dbms": self.name, "operation":"runTest", "result": dataToStore}
-
-    @postProcess
-    def libraryRetrieveTest(self, tableName:str, sizeOfData:int, iterations:int):
-        print(sizeOfData)
-        dataToStore = []
-        divisionFactor = sizeOfData // iterations
-
-        newTableName = f"{self.tableSchema}.{tableName}"
-
-        startID = 1
-        endID = 0
-        iterSize = 0
-
-        query1 = f"""
-            SELECT * FROM {newTableName}
-            WHERE LoanID BETWEEN :start_id AND :end_id
+    def serverStats(self):
+        # Instance-wide counters; needs SELECT on V$SYSSTAT (e.g. SELECT_CATALOG_ROLE)
+        with self.connection.cursor() as cursor:
+            cursor.execute("SELECT name, value FROM v$sysstat WHERE name IN ("
+                           + ", ".join(f":{i + 1}" for i in range(len(self.sysstatNames))) + ")", self.sysstatNames)
+            return dict(cursor.fetchall())
+
+    def qualifiedName(self, tableName:str):
+        return f"{self.tableSchema}.{tableName}" if self.tableSchema else tableName
+
+    def prepare(self, tableName:str, documentData:list[dict]):
+        # executemany wants positional tuples; build them once outside the timed window
+        columns = list(documentData[0].keys()) if documentData else []
+        self.columns[tableName] = columns
+        rows = [tuple(row[column] for column in columns) for row in documentData]
+
+        # Bind types declared up front so executemany does not re-derive (and re-allocate) them per batch.
+        # String sizes only ever grow, since later streamed batches may hold longer values.
+        sizes = self.inputSizes.get(tableName, [None] * len(columns))
+        for index in range(len(columns)):
+            values = [row[index] for row in rows if row[index] is not None]
+            if not values:
+                continue
+            if isinstance(values[0], str):
+                sizes[index] = max(sizes[index] if isinstance(sizes[index], int) else 0, max(len(value) for value in values))
+            elif isinstance(values[0], datetime):
+                sizes[index] = oracledb.DB_TYPE_DATE
+            elif isinstance(values[0], (int, float)):
+                sizes[index] = oracledb.DB_TYPE_NUMBER
+        self.inputSizes[tableName] = sizes
+        return rows
+
+    def prepareColumns(self, tableName:str, recordBatch):
+        # Tuples are zipped straight from the column arrays and bind sizes come from the Arrow schema,
+        # so no per-row dicts are built and no values are scanned in Python
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        columns = recordBatch.schema.names
+        self.columns[tableName] = columns
+        sizes = self.inputSizes.get(tableName, [None] * len(columns))
+        for index, field in enumerate(recordBatch.schema):
+            column = recordBatch.column(index)
+            if column.null_count == len(column):
+                continue
+            if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+                sizes[index] = max(sizes[index] if isinstance(sizes[index], int) else 0, pc.max(pc.utf8_length(column)).as_py())
+            elif pa.types.is_timestamp(field.type) or pa.types.is_date(field.type):
+                sizes[index] = oracledb.DB_TYPE_DATE
+            elif pa.types.is_integer(field.type) or pa.types.is_floating(field.type):
+                sizes[index] = oracledb.DB_TYPE_NUMBER
+        self.inputSizes[tableName] = sizes
+        return list(zip(*(column.to_pylist() for column in recordBatch.columns)))
+
+    def payloadEncoding(self):
+        return "Oracle:tuples"
+
+    def payloadState(self, tableName:str):
+        # Column order and bind sizes; DbType objects are stored by name so the state can be pickled
+        sizes = [size.name if isinstance(size, oracledb.DbType) else size for size in self.inputSizes[tableName]]
+        return {"columns": self.columns[tableName], "inputSizes": sizes}
+
+    def restorePayloadState(self, tableName:str, state:dict):
+        self.columns[tableName] = state["columns"]
+        sizes = self.inputSizes.get(tableName, [None] * len(state["columns"]))
+        for index, size in enumerate(state["inputSizes"]):
+            if isinstance(size, str):
+                sizes[index] = getattr(oracledb, size)
+            elif isinstance(size, int):
+                sizes[index] = max(sizes[index] if isinstance(sizes[index], int) else 0, size)
+        self.inputSizes[tableName] = sizes
+
+    def reset(self, tableName:str):
+        # Reset the table by deleting all rows, or truncating it (DDL, commits implicitly)
+        if self.resetMode == "truncate":
+            self.request(self.cursor.execute, f"TRUNCATE TABLE {self.qualifiedName(tableName)}")
+        else:
+            self.request(self.cursor.execute, f"DELETE FROM {self.qualifiedName(tableName)}")
+            self.request(self.connection.commit)
+
+    def bulkInsert(self, tableName:str, rows:list[tuple]):
+        columns = self.columns[tableName]
+        hint = "/*+ APPEND_VALUES */" if self.directPath else ""
+        insertQuery = f"""
+            INSERT {hint} INTO {self.qualifiedName(tableName)} ({", ".join(columns)})
+            VALUES ({", ".join(f":{column}" for column in columns)})
         """
 
-        # qKeyWord = "the"
-        # query2 = f"""
-        #     SELECT * FROM {newTableName}
-        #     WHERE BookID IN (
-        #         SELECT BookID FROM SYS.BOOKS WHERE Title LIKE :keyword
-        #     )
-        # """
-
-        for i in range(iterations):
-            run = i + 1
-            iterSize += divisionFactor
-            print(f"Run {run}")
-
-            endID += divisionFactor
-
-            print(startID, endID)
-            q1StartTime = time.time()
-            self.cursor.execute(query1, [startID, endID])
-            rows = self.cursor.fetchall() # to actually parse all data into system
-            q1EndTime = time.time()
-
-            # q2StartTime = time.time()
-            # self.cursor.execute(query2, [f'%{qKeyWord}%'])
-            # rows = self.cursor.fetchall() # to actually parse all data into system
-            # q2EndTime = time.time()
-
-            dataToStore.append({
-                "run": run,
-                "qSize": iterSize,
-                "q1StartTime": q1StartTime,
-                "q1EndTime": q1EndTime,
-                "q1Time": round(abs(q1StartTime - q1EndTime), 5),
-                # "q2StartTime": q2StartTime,
-                # "q2EndTime": q2EndTime,
-                # "q2Time": round(abs(q2StartTime - q2EndTime), 2)
-            })
-
-        return {"saveDirectory": self.saveDataDirectory, "tableName": tableName, "dbms": self.name, "operation":"search", "result": dataToStore}
-
-
-class RedisDB:
-    # Maintaince for redis is halted
-    def __init__(self, connUrl:str, sdDirectory:str) -> None:
-        self.name = "Redis"
-        self.connUrl = connUrl
-        self.saveDataDirectory = sdDirectory
-
-        self.client = redis.Redis.from_url(self.connUrl)
-        self.redisProcesseData = []
-
-    def processRedisData(self, collectionName, jsonData:list[dict]):
-        for i in range(jsonData):
-            row = jsonData[i]
-            self.redisProcesseData.append({"key":f"{collectionName}:{row['ID']}", "value":{
-                        "name": row["name"],
-                        "intakeYear": row["intakeYear"],
-                        "age": row["age"],
-                        "course": row["course"],
-                        "sem": row["sem"]
-                    }
-                }
-            )
-
-    def closeConn(self):
-        self.client.close()
-
-    @postProcess
-    def insertTest(self, documentData:dict, iterations:int):
-        self.processRedisData("student", documentData)
-        dataToStore = []
-
-        self.client.flushdb()  # reset
-
-        divisionFactor = len(documentData) // iterations
-        iterSize = 0
-
-        for i in range(iterations):
-            run = i + 1
-            print(f"Insert Run {run}")
-
-            iterSize += divisionFactor
-            dataToInsert = {str(key): json.dumps(value) for key, value in list(self.redisProcesseData.items())[:iterSize]}
-
-            startTime = time.time()
-            for key, value in dataToInsert.items():
-                self.client.set(key, value)
-            endTime = time.time()
-
-            dataToStore.append({"run": run, "st": startTime, "et": endTime, "ft": round(abs(endTime - startTime), 2), "qSize": iterSize})
-
-            if run != iterations:
-                self.client.flushdb()  # reset
-
-        return {"saveDirectory": self.saveDataDirectory, "op": "Insert", "dbms": self.name, "result": dataToStore}
-
-    @postProcess
-    def retrieveTest(self, documentData:dict, iterations:int):
-        dataToStore = []
-
-        keys = list(documentData.keys())
-        divisionFactor = len(keys) // iterations
-        iterSize = 0
-
-        for i in range(iterations):
-            run = i + 1
-            print(f"Retrieve Run {run}")
-
-            iterSize += divisionFactor
-            keysToRetrieve = keys[:iterSize]
-
-            startTime = time.time()
-            for key in keysToRetrieve:
-                self.client.get(key)
-            endTime = time.time()
-
-            dataToStore.append({"run": run, "st": startTime, "et": endTime, "ft": round(abs(endTime - startTime), 2), "qSize": iterSize})
-
-        return {"saveDirectory": self.saveDataDirectory, "op": "Retrieve", "dbms": self.name, "result": dataToStore}
-
-    @postProcess
-    def updateTest(self, documentData:dict, iterations:int):
-        dataToStore = []
-
-        keys = list(documentData.keys())
-        divisionFactor = len(keys) // iterations
-        iterSize = 0
-
-        for i in range(iterations):
-            run = i + 1
-            print(f"Update Run {run}")
-
-            iterSize += divisionFactor
-            keysToUpdate = keys[:iterSize]
-
-            startTime = time.time()
-            for key in keysToUpdate:
-                new_value = json.dumps(documentData[key]) + "_updated"
-                self.client.set(key, new_value)
-            endTime = time.time()
-
-            dataToStore.append({"run": run, "st": startTime, "et": endTime, "ft": round(abs(endTime - startTime), 2), "qSize": iterSize})
-
-        return {"saveDirectory": self.saveDataDirectory, "op": "Update", "dbms": self.name, "result": dataToStore}
-
-    @postProcess
-    def deleteTest(self, documentData:dict, iterations:int):
-        dataToStore = []
-
-        keys = list(documentData.keys())
-        divisionFactor = len(keys) // iterations
-        iterSize = 0
-
-        for i in range(iterations):
-            run = i + 1
-            print(f"Delete Run {run}")
-
-            iterSize += divisionFactor
-            keysToDelete = keys[:iterSize]
-
-            startTime = time.time()
-            for key in keysToDelete:
-                self.client.delete(key)
-            endTime = time.time()
+        batchSize = self.batchSize or max(len(rows), 1)
+        for i in range(0, len(rows), batchSize):
+            self.cursor.setinputsizes(*self.inputSizes[tableName])
+            self.request(self.cursor.executemany, insertQuery, rows[i:i + batchSize])
+
+            # A direct-path insert must be committed before the table can be touched again
+            if self.directPath:
+                self.request(self.connection.commit)
+
+        if not self.directPath:
+            self.request(self.connection.commit)
+
+    def bulkLoad(self, tableName:str, batches):
+        # Direct Path Load (python-oracledb thin mode) formats blocks client side and writes them above the
+        # high-water mark, bypassing SQL and the buffer cache; otherwise APPEND_VALUES array inserts
+        if not (self.connection.thin and hasattr(self.connection, "direct_path_load")):
+            self.loadMethod = "executemany(APPEND_VALUES)"
+            directPath, self.directPath = self.directPath, True
+            try:
+                DBMSAdapter.bulkLoad(self, tableName, batches)
+            finally:
+                self.directPath = directPath
+            return
+
+        self.loadMethod = "direct_path_load"
+        schemaName = (self.tableSchema or self.connection.username).upper()
+        for batch in batches:
+            # Arrow record batches are passed as they are (the driver reads them through the PyCapsule interface)
+            columns = list(batch[0]) if isinstance(batch, list) else batch.schema.names
+            data = [tuple(row[column] for column in columns) for row in batch] if isinstance(batch, list) else batch
+            self.request(self.connection.direct_path_load, schemaName, tableName.upper(), [column.upper() for column in columns], data)
+        self.request(self.connection.commit)
+
+    def bulkUpdate(self, tableName:str, changes:dict):
+        updateQuery = f"""
+            UPDATE {self.qualifiedName(tableName)}
+            SET {", ".join(f"{column} = :{column}" for column in changes)}
+        """
 
-            dataToStore.append({"run": run, "st": startTime, "et": endTime, "ft": round(abs(endTime - startTime), 2), "qSize": iterSize})
+        self.request(self.cursor.execute, updateQuery, changes)
+        self.request(self.connection.commit)
 
-        return {"saveDirectory": self.saveDataDirectory, "op": "Delete", "dbms": self.name, "result": dataToStore}
+    def bulkDelete(self, tableName:str):
+        self.reset(tableName)
 
-    @postProcess
-    def insertHashTest(self, hashKey:str, documentData:dict, iterations:int):
-        dataToStore = []
+    def updateRecord(self, tableName:str, keyField:str, recordID:int, changes:dict):
+        updateQuery = f"""
+            UPDATE {self.qualifiedName(tableName)}
+            SET {", ".join(f"{column} = :{column}" for column in changes)}
+            WHERE {keyField} = :recordID
+        """
 
-        self.client.flushdb()  # reset
+        self.request(self.cursor.execute, updateQuery, {**changes, "recordID": recordID})
+        self.request(self.connection.commit)
 
-        for i in range(iterations):
-            run = i + 1
-            print(f"Insert Hash Run {run}")
+    def rangeRead(self, tableName:str, keyField:str, startID:int, endID:int):
+        query = f"""
+            SELECT * FROM {self.qualifiedName(tableName)}
+            WHERE {keyField} BETWEEN :start_id AND :end_id
+        """
 
-            startTime = time.time()
-            for field, value in documentData.items():
-                self.client.hset(hashKey, field, value)
-            endTime = time.time()
+        # A cursor per call: asyncRangeRead runs this from several threads at once, and cursors are not thread-safe
+        with self.readCursor() as cursor:
+            self.request(cursor.execute, query, [startID, endID])
+            return self.request(cursor.fetchall) # to actually parse all data into system
+
+    def readCursor(self):
+        cursor = self.connection.cursor()
+        cursor.arraysize = self.arraysize
+        cursor.prefetchrows = self.prefetchrows
+        return cursor
+
+    def indexName(self, tableName:str, field:str, suffix:str):
+        return f"{self.tableSchema}.{tableName}_{field}_{suffix}" if self.tableSchema else f"{tableName}_{field}_{suffix}"
+
+    def createQueryIndexes(self, tableName:str):
+        for field in queryIndexes.get(tableName, []):
+            self.cursor.execute(f"CREATE INDEX {self.indexName(tableName, field, 'qidx')} ON {self.qualifiedName(tableName)} ({field})")
+        if tableName in fullTextIndexes:
+            # Oracle Text CONTEXT index (needs the CTXAPP role); built here, after the load
+            field = fullTextIndexes[tableName]
+            # The empty stoplist indexes every word, so CONTAINS finds whatever the REGEXP_LIKE scan finds
+            self.cursor.execute(f"CREATE INDEX {self.indexName(tableName, field, 'ctx')} ON {self.qualifiedName(tableName)} ({field}) "
+                                "INDEXTYPE IS CTXSYS.CONTEXT PARAMETERS ('STOPLIST CTXSYS.EMPTY_STOPLIST')")
+            self.fullTextIndexed.add(tableName)
+
+    def dropQueryIndexes(self, tableName:str):
+        names = [self.indexName(tableName, field, "qidx") for field in queryIndexes.get(tableName, [])]
+        if tableName in fullTextIndexes:
+            names.append(self.indexName(tableName, fullTextIndexes[tableName], "ctx"))
+        for name in names:
+            try:
+                self.cursor.execute(f"DROP INDEX {name}")
+            except oracledb.DatabaseError:
+                # ORA-01418: the index was never created (e.g. the run failed before indexing)
+                pass
+        self.fullTextIndexed.discard(tableName)
+
+    def createIndex(self, tableName:str, kind:str, fields:list[str]):
+        name = indexName(tableName, kind, fields)
+        columns = ", ".join(fields)
+        match kind:
+            case "primary":
+                self.cursor.execute(f"ALTER TABLE {self.qualifiedName(tableName)} ADD CONSTRAINT {name} PRIMARY KEY ({columns})")
+            case "secondary":
+                self.cursor.execute(f"CREATE INDEX {self.qualifiedIndex(name)} ON {self.qualifiedName(tableName)} ({columns})")
+            case "text":
+                # Synchronised on commit, so timed writes pay for keeping the text index current
+                self.cursor.execute(f"CREATE INDEX {self.qualifiedIndex(name)} ON {self.qualifiedName(tableName)} ({columns}) "
+                                    "INDEXTYPE IS CTXSYS.CONTEXT PARAMETERS ('SYNC (ON COMMIT) STOPLIST CTXSYS.EMPTY_STOPLIST')")
+                self.fullTextIndexed.add(tableName)
+
+    def qualifiedIndex(self, name:str):
+        return f"{self.tableSchema}.{name}" if self.tableSchema else name
+
+    def dropIndexes(self, tableName:str):
+        # Primary key constraints (with their index), then every other index except the LOB segment indexes
+        owner = self.dictionaryBinds(tableName)
+        self.cursor.execute("""
+            SELECT constraint_name FROM all_constraints
+            WHERE owner = NVL(:owner, SYS_CONTEXT('USERENV', 'CURRENT_SCHEMA')) AND table_name = :tableName AND constraint_type = 'P'
+        """, owner)
+        for (name,) in self.cursor.fetchall():
+            self.cursor.execute(f"ALTER TABLE {self.qualifiedName(tableName)} DROP CONSTRAINT {name} DROP INDEX")
+        self.cursor.execute("""
+            SELECT index_name FROM all_indexes
+            WHERE table_owner = NVL(:owner, SYS_CONTEXT('USERENV', 'CURRENT_SCHEMA')) AND table_name = :tableName AND index_type <> 'LOB'
+        """, owner)
+        for (name,) in self.cursor.fetchall():
+            self.cursor.execute(f"DROP INDEX {self.qualifiedIndex(name)}")
+        self.fullTextIndexed.discard(tableName)
+
+    def dictionaryBinds(self, tableName:str):
+        # Unquoted identifiers are stored upper case in the data dictionary
+        return {"owner": self.tableSchema.upper() if self.tableSchema else None, "tableName": tableName.upper()}
+
+    def describeSchema(self, tableName:str):
+        owner = self.dictionaryBinds(tableName)
+        self.cursor.execute("""
+            SELECT i.index_name, i.uniqueness, i.index_type, LISTAGG(c.column_name, ',') WITHIN GROUP (ORDER BY c.column_position)
+            FROM all_indexes i
+            JOIN all_ind_columns c ON c.index_owner = i.owner AND c.index_name = i.index_name
+            WHERE i.table_owner = NVL(:owner, SYS_CONTEXT('USERENV', 'CURRENT_SCHEMA')) AND i.table_name = :tableName AND i.index_type <> 'LOB'
+            GROUP BY i.index_name, i.uniqueness, i.index_type
+        """, owner)
+        return [{"name": name, "fields": columns.split(","), "unique": uniqueness == "UNIQUE", "type": indexType}
+                for name, uniqueness, indexType, columns in self.cursor.fetchall()]
+
+    def query(self, name:str, parameters:dict):
+        loans, books, members, comments = (self.qualifiedName(table) for table in ("loans", "books", "members", "UserPostComment"))
+        match name:
+            case "pointLookup":
+                sql, binds = f"SELECT * FROM {loans} WHERE LoanID = :loanID", {"loanID": parameters["loanID"]}
+            case "memberLoans":
+                sql, binds = f"SELECT * FROM {loans} WHERE MemberID = :memberID", {"memberID": parameters["memberID"]}
+            case "loanDateRange":
+                sql, binds = f"SELECT * FROM {loans} WHERE LoanDate >= :startDate AND LoanDate < :endDate", {"startDate": parameters["start"], "endDate": parameters["end"]}
+            case "titleJoin":
+                sql = f"""
+                    SELECT l.*, b.Title FROM {loans} l JOIN {books} b ON b.BookID = l.BookID
+                    WHERE UPPER(b.Title) LIKE UPPER(:keyword)
+                """
+                binds = {"keyword": f"%{parameters['keyword']}%"}
+            case "loansPerMember":
+                sql = f"""
+                    SELECT l.MemberID, m.Name, COUNT(*) AS loans FROM {loans} l LEFT JOIN {members} m ON m.MemberID = l.MemberID
+                    GROUP BY l.MemberID, m.Name
+                """
+                binds = {}
+            case "overdueCount":
+                sql = f"SELECT COUNT(*) FROM {loans} WHERE (ReturnDate IS NULL AND DueDate < :asOf) OR ReturnDate > DueDate"
+                binds = {"asOf": parameters["asOf"]}
+            case "topBooks":
+                sql = f"SELECT BookID, COUNT(*) AS loans FROM {loans} GROUP BY BookID ORDER BY loans DESC FETCH FIRST :k ROWS ONLY"
+                binds = {"k": parameters["k"]}
+            case "contentSearch":
+                # CONTAINS needs the CONTEXT index; without it the whole word is matched with a full scan. Braces
+                # keep a term such as "near" or "about" from being read as a CONTAINS operator.
+                if "UserPostComment" in self.fullTextIndexed:
+                    sql, binds = f"SELECT * FROM {comments} WHERE CONTAINS(Content, :term) > 0", {"term": "{" + parameters["term"] + "}"}
+                else:
+                    # Oracle regular expressions have no \b, so the word is bounded by non-word characters or the ends
+                    sql = f"SELECT * FROM {comments} WHERE REGEXP_LIKE(Content, :pattern, 'i')"
+                    binds = {"pattern": rf"(^|\W){re.escape(parameters['term'])}(\W|$)"}
+            case _:
+                raise ValueError(f"Unknown query {name}")
+
+        self.request(self.cursor.execute, sql, binds)
+        return self.request(self.cursor.fetchall)
+
+
+class RedisDB(DBMSAdapter):
+    # mode selects how commands reach the server:
+    #   perKey      one SET/GET/DEL round trip per key
+    #   pipeline    batchSize commands per round trip, no MULTI/EXEC
+    #   transaction batchSize commands per round trip wrapped in MULTI/EXEC
+    #   bulk        one MSET/MGET/UNLINK per batchSize keys
+    #   lua         one EVALSHA per batchSize keys running the loop server side
+    modes = ["perKey", "pipeline", "transaction", "bulk", "lua"]
+
+    luaScripts = {
+        "set": "for i, key in ipairs(KEYS) do redis.call('SET', key, ARGV[i]) end return #KEYS",
+        "get": "return redis.call('MGET', unpack(KEYS))",
+        "delete": "return redis.call('UNLINK', unpack(KEYS))"
+    }
+
+    # INFO fields read around each phase when telemetry is enabled
+    infoFields = ["total_commands_processed", "total_net_input_bytes", "total_net_output_bytes", "used_cpu_sys", "used_cpu_user",
+                  "used_memory", "connected_clients", "keyspace_hits", "keyspace_misses", "expired_keys", "evicted_keys"]
+
+    def __init__(self, connUrl:str, sdDirectory:str, mode:str="perKey", batchSize:int=1000, poolSize:int=None) -> None:
+        self.name = "Redis"
+        self.variant = mode
+        self.connUrl = connUrl
+        self.saveDataDirectory = sdDirectory
 
-            dataToStore.append({"run": run, "st": startTime, "et": endTime, "ft": round(abs(endTime - startTime), 2), "qSize": len(documentData)})
+        if mode not in self.modes:
+            raise ValueError(f"Unknown Redis mode {mode}, expected one of {self.modes}")
+        self.mode = mode
+        self.batchSize = batchSize
+
+        self.poolSize = poolSize
+        self.client, self.acquireNs = connections.acquire(self.connect)
+        self.asyncClient = None
+        self.scripts = {name: self.client.register_script(script) for name, script in self.luaScripts.items()}
+
+        # Records currently stored per table, as (key, row) pairs, so bulk updates can rewrite them
+        self.storedRows = {}
+
+        # Tables whose query suite index structures currently exist
+        self.indexedTables = set()
+        # Secondary indexes of the schema variant per table, as field lists; every write keeps them current
+        self.schemaIndexes = {}
+
+    def connect(self):
+        requireDriver("Redis")
+        if self.poolSize:
+            # Blocking, so a worker beyond poolSize waits for a free connection instead of failing
+            pool = connections.pool(("redis", self.connUrl, self.poolSize),
+                                    lambda: redis.BlockingConnectionPool.from_url(self.connUrl, max_connections=self.poolSize), lambda pool: pool.disconnect())
+            client = redis.Redis(connection_pool=pool)
+        else:
+            client = redis.Redis.from_url(self.connUrl)
+        client.ping()
+        return client
 
-            if run != iterations:
-                self.client.flushdb()  # reset
+    def asyncConnect(self):
+        import redis.asyncio
+        return redis.asyncio.Redis.from_url(self.connUrl)
 
-        return {"saveDirectory": self.saveDataDirectory, "op": "InsertHash", "dbms": self.name, "result": dataToStore}
+    def closeConn(self):
+        # A client on the shared pool only hands its connection back
+        self.client.close()
 
-    @postProcess
-    def retrieveHashTest(self, hashKey:str, iterations:int):
-        dataToStore = []
+    def serverStats(self):
+        info = self.client.info()
+        return {name: info[name] for name in self.infoFields if name in info}
+
+    def chunks(self, items:list):
+        for i in range(0, len(items), self.batchSize):
+            yield items[i:i + self.batchSize]
+
+    def pipelined(self, command:str, items:list, transaction:bool):
+        results = []
+        for chunk in self.chunks(items):
+            pipe = self.client.pipeline(transaction=transaction)
+            for item in chunk:
+                match command:
+                    case "set":
+                        pipe.set(*item)
+                    case "get":
+                        pipe.get(item)
+                    case "delete":
+                        pipe.delete(item)
+            results.extend(self.request(pipe.execute))
+        return results
+
+    def execute(self, command:str, items:list):
+        # items are (key, value) pairs for "set" and keys for "get"/"delete"; returns values for "get"
+        match self.mode:
+            case "perKey":
+                match command:
+                    case "set":
+                        return [self.request(self.client.set, key, value) for key, value in items]
+                    case "get":
+                        return [self.request(self.client.get, key) for key in items]
+                    case "delete":
+                        return [self.request(self.client.delete, key) for key in items]
+            case "pipeline" | "transaction":
+                return self.pipelined(command, items, self.mode == "transaction")
+            case "bulk":
+                results = []
+                for chunk in self.chunks(items):
+                    match command:
+                        case "set":
+                            self.request(self.client.mset, dict(chunk))
+                        case "get":
+                            results.extend(self.request(self.client.mget, chunk))
+                        case "delete":
+                            self.request(self.client.unlink, *chunk)
+                return results
+            case "lua":
+                results = []
+                for chunk in self.chunks(items):
+                    if command == "set":
+                        keys, values = zip(*chunk)
+                        self.request(self.scripts["set"], keys=list(keys), args=list(values))
+                    else:
+                        reply = self.request(self.scripts[command], keys=chunk)
+                        if command == "get":
+                            results.extend(reply)
+                return results
+
+    def prepare(self, tableName:str, documentData:list[dict]):
+        # (key, row, JSON value) triples: values are encoded once here instead of inside the timed insert
+        keyField = tableKeys[tableName]
+        return [(f"{tableName}:{row[keyField]}", row, json.dumps(row, default=str)) for row in documentData]
+
+    def payloadEncoding(self):
+        return "Redis:json"
+
+    def reset(self, tableName:str):
+        # Only this table's records and its query/schema index keys; the other tables in the database stay
+        keys = [key for pattern in [f"{tableName}:*", f"idx:{tableName}:*", f"sidx:{tableName}:*"]
+                for key in self.client.scan_iter(match=pattern, count=1000)]
+        for chunk in self.chunks(keys):
+            self.client.unlink(*chunk)
+        self.storedRows[tableName] = []
+        self.indexedTables.discard(tableName)
+
+    def indexSet(self, tableName:str, fields:list[str], row:dict):
+        return f"sidx:{tableName}:{'_'.join(fields)}:{':'.join(str(row.get(field)) for field in fields)}"
+
+    def indexEntries(self, tableName:str, key:str, row:dict):
+        # (set, member) pairs placing one record in each of the table's schema indexes
+        return [(self.indexSet(tableName, fields, row), key) for fields in self.schemaIndexes.get(tableName, [])]
+
+    def maintainIndexes(self, command:str, entries:list):
+        # One SADD/SREM per entry, pipelined per batchSize and timed with the write that caused it
+        for chunk in self.chunks(entries):
+            pipeline = self.client.pipeline(transaction=False)
+            for setKey, member in chunk:
+                getattr(pipeline, command)(setKey, member)
+            self.request(pipeline.execute)
+
+    def reindex(self, tableName:str, key:str, old:dict, new:dict):
+        # Index entries that differ between two versions of a record
+        oldEntries, newEntries = self.indexEntries(tableName, key, old), self.indexEntries(tableName, key, new)
+        return [entry for entry in oldEntries if entry not in newEntries], [entry for entry in newEntries if entry not in oldEntries]
+
+    def bulkInsert(self, tableName:str, rows:list[tuple]):
+        self.execute("set", [(key, value) for key, _, value in rows])
+        self.storedRows.setdefault(tableName, []).extend((key, row) for key, row, _ in rows)
+        if self.schemaIndexes.get(tableName):
+            self.maintainIndexes("sadd", [entry for key, row, _ in rows for entry in self.indexEntries(tableName, key, row)])
+
+    def bulkUpdate(self, tableName:str, changes:dict):
+        self.execute("set", [(key, json.dumps({**row, **changes}, default=str)) for key, row in self.storedRows.get(tableName, [])])
+        if self.schemaIndexes.get(tableName):
+            removed, added = [], []
+            for key, row in self.storedRows[tableName]:
+                oldEntries, newEntries = self.reindex(tableName, key, row, {**row, **changes})
+                removed.extend(oldEntries)
+                added.extend(newEntries)
+            self.maintainIndexes("srem", removed)
+            self.maintainIndexes("sadd", added)
+            self.storedRows[tableName] = [(key, {**row, **changes}) for key, row in self.storedRows[tableName]]
+
+    def bulkDelete(self, tableName:str):
+        self.execute("delete", [key for key, _ in self.storedRows.get(tableName, [])])
+        if self.schemaIndexes.get(tableName):
+            self.maintainIndexes("srem", [entry for key, row in self.storedRows[tableName] for entry in self.indexEntries(tableName, key, row)])
+        self.storedRows[tableName] = []
+
+    def respCommand(self, *parts:str):
+        encoded = [part.encode() for part in parts]
+        return b"*%d\r\n" % len(encoded) + b"".join(b"$%d\r\n%s\r\n" % (len(part), part) for part in encoded)
+
+    def massInsert(self, connection, items:list):
+        # The whole batch is written before any reply is read, like redis-cli --pipe
+        connection.send_packed_command([b"".join(self.respCommand("SET", key, value) for key, value in items)])
+        for _ in items:
+            connection.read_response()
+
+    def bulkLoad(self, tableName:str, batches):
+        # Mass insertion protocol over one pooled connection, whatever the mode. Preloaded rows are not kept in
+        # storedRows (tables may hold millions); workloads that update or delete rows reset the table first
+        self.loadMethod = "resp mass insert"
+        keyField = tableKeys[tableName]
+        connection = self.client.connection_pool.get_connection()
+        try:
+            for batch in batches:
+                rows = batch if isinstance(batch, list) else batch.to_pylist()
+                items = [(f"{tableName}:{row[keyField]}", json.dumps(row, default=str)) for row in rows]
+                self.request(self.massInsert, connection, items)
+                if self.schemaIndexes.get(tableName):
+                    self.maintainIndexes("sadd", [entry for (key, _), row in zip(items, rows) for entry in self.indexEntries(tableName, key, row)])
+        finally:
+            self.client.connection_pool.release(connection)
+
+    def rangeRead(self, tableName:str, keyField:str, startID:int, endID:int):
+        values = self.execute("get", [f"{tableName}:{recordID}" for recordID in range(startID, endID + 1)])
+        return [json.loads(value) for value in values if value is not None]
+
+    def updateRecord(self, tableName:str, keyField:str, recordID:int, changes:dict):
+        # Values are JSON strings, so changing one field is a read-modify-write of the whole record
+        key = f"{tableName}:{recordID}"
+        value = self.execute("get", [key])[0]
+        if value is not None:
+            row = json.loads(value)
+            self.execute("set", [(key, json.dumps({**row, **changes}, default=str))])
+            if self.schemaIndexes.get(tableName):
+                removed, added = self.reindex(tableName, key, row, {**row, **changes})
+                self.maintainIndexes("srem", removed)
+                self.maintainIndexes("sadd", added)
+
+    def scanTable(self, tableName:str):
+        # Every record of a table via SCAN + GET in the selected mode; without secondary structures this is the
+        # only way Redis can answer a predicate, so filters and aggregations run on the client
+        keys = self.request(lambda: list(self.client.scan_iter(match=f"{tableName}:*", count=1000)))
+        return [json.loads(value) for value in self.execute("get", keys) if value is not None]
+
+    def getRecords(self, keys:list):
+        return [json.loads(value) for value in self.execute("get", [key.decode() if isinstance(key, bytes) else key for key in keys]) if value is not None]
+
+    def createQueryIndexes(self, tableName:str):
+        # Secondary indexes are hand-maintained structures: a set of keys per value, and a sorted set for dates.
+        # Plain Redis has no full-text index (that needs RediSearch), so contentSearch always scans.
+        fields = queryIndexes.get(tableName, [])
+        if not fields:
+            return
+        self.indexedTables.add(tableName)
+        pipeline = self.client.pipeline(transaction=False)
+        for row in self.scanTable(tableName):
+            key = f"{tableName}:{row[tableKeys[tableName]]}"
+            for field in fields:
+                if row.get(field) is None:
+                    continue
+                if isinstance(row[field], str):
+                    pipeline.zadd(f"idx:{tableName}:{field}", {key: datetime.fromisoformat(row[field]).timestamp()})
+                else:
+                    pipeline.sadd(f"idx:{tableName}:{field}:{row[field]}", key)
+            if len(pipeline) >= self.batchSize:
+                pipeline.execute()
+        pipeline.execute()
+
+    def dropQueryIndexes(self, tableName:str):
+        keys = list(self.client.scan_iter(match=f"idx:{tableName}:*", count=1000))
+        for chunk in self.chunks(keys):
+            self.client.unlink(*chunk)
+        self.indexedTables.discard(tableName)
+
+    def createIndex(self, tableName:str, kind:str, fields:list[str]):
+        # Keys are unique by construction, so the primary key needs no structure; secondary and compound
+        # indexes are a set of record keys per value (tuple), built here from the records already stored
+        match kind:
+            case "primary":
+                return
+            case "text":
+                raise NotImplementedError("Redis has no full-text index without RediSearch")
+        self.schemaIndexes.setdefault(tableName, []).append(fields)
+        keyField = tableKeys[tableName]
+        self.maintainIndexes("sadd", [(self.indexSet(tableName, fields, row), f"{tableName}:{row[keyField]}") for row in self.scanTable(tableName)])
+
+    def dropIndexes(self, tableName:str):
+        keys = list(self.client.scan_iter(match=f"sidx:{tableName}:*", count=1000))
+        for chunk in self.chunks(keys):
+            self.client.unlink(*chunk)
+        self.schemaIndexes[tableName] = []
+
+    def describeSchema(self, tableName:str):
+        keyField = tableKeys[tableName]
+        return [{"name": f"{tableName}:<{keyField}>", "fields": [keyField], "unique": True, "type": "key"}] + \
+               [{"name": f"sidx:{tableName}:{'_'.join(fields)}", "fields": fields, "unique": False, "type": "set"} for fields in self.schemaIndexes.get(tableName, [])]
+
+    def query(self, name:str, parameters:dict):
+        indexed = "loans" in self.indexedTables
+        match name:
+            case "pointLookup":
+                return self.getRecords([f"loans:{parameters['loanID']}"])
+            case "memberLoans":
+                if indexed:
+                    return self.getRecords(self.request(self.client.smembers, f"idx:loans:MemberID:{parameters['memberID']}"))
+                return [row for row in self.scanTable("loans") if row["MemberID"] == parameters["memberID"]]
+            case "loanDateRange":
+                start, end = parameters["start"], parameters["end"]
+                if indexed:
+                    return self.getRecords(self.request(self.client.zrangebyscore, "idx:loans:LoanDate", start.timestamp(), f"({end.timestamp()}"))
+                return [row for row in self.scanTable("loans") if row["LoanDate"] and start <= datetime.fromisoformat(row["LoanDate"]) < end]
+            case "titleJoin":
+                keyword = parameters["keyword"].lower()
+                titles = {book["BookID"]: book["Title"] for book in self.scanTable("books") if keyword in (book["Title"] or "").lower()}
+                if indexed and titles:
+                    loans = self.getRecords(self.request(self.client.sunion, [f"idx:loans:BookID:{bookID}" for bookID in titles]))
+                else:
+                    loans = [row for row in self.scanTable("loans") if row["BookID"] in titles]
+                return [{**loan, "Title": titles[loan["BookID"]]} for loan in loans]
+            case "loansPerMember":
+                counts = {}
+                for row in self.scanTable("loans"):
+                    counts[row["MemberID"]] = counts.get(row["MemberID"], 0) + 1
+                names = {member["MemberID"]: member["Name"] for member in self.getRecords([f"members:{memberID}" for memberID in counts])}
+                return [{"MemberID": memberID, "Name": names.get(memberID), "loans": count} for memberID, count in counts.items()]
+            case "overdueCount":
+                asOf = parameters["asOf"]
+                overdue = 0
+                for row in self.scanTable("loans"):
+                    dueDate = datetime.fromisoformat(row["DueDate"]) if row["DueDate"] else None
+                    if dueDate is None:
+                        continue
+                    if row["ReturnDate"] is None:
+                        overdue += dueDate < asOf
+                    else:
+                        overdue += datetime.fromisoformat(row["ReturnDate"]) > dueDate
+                return overdue
+            case "topBooks":
+                counts = {}
+                for row in self.scanTable("loans"):
+                    counts[row["BookID"]] = counts.get(row["BookID"], 0) + 1
+                return sorted(counts.items(), key=lambda item: item[1], reverse=True)[:parameters["k"]]
+            case "contentSearch":
+                pattern = re.compile(wordPattern(parameters["term"]))
+                return [row for row in self.scanTable("UserPostComment") if pattern.search(row["Content"] or "")]
+        raise ValueError(f"Unknown query {name}")
+
+    async def asyncRangeRead(self, tableName:str, keyField:str, startID:int, endID:int):
+        if self.asyncClient is None:
+            self.asyncClient = self.asyncConnect()
+
+        rows = []
+        for recordID in range(startID, endID + 1):
+            value = await self.asyncClient.get(f"{tableName}:{recordID}")
+            if value is not None:
+                rows.append(json.loads(value))
+        return rows
+
+    async def asyncClose(self):
+        if self.asyncClient is not None:
+            await self.asyncClient.aclose()
+            self.asyncClient = None
+
+
+class Neo4jDB(DBMSAdapter):
+    # writeMode selects how rows are written:
+    #   perRow  one auto-commit CREATE per row
+    #   unwind  UNWIND $rows AS row CREATE ..., batchSize rows per explicit write transaction
+    #   merge   UNWIND $rows AS row MERGE on the table key, batchSize rows per explicit write transaction
+    writeModes = ["perRow", "unwind", "merge"]
+
+    # JMX beans read around each phase when telemetry is enabled
+    jmxBeans = ["java.lang:type=Memory", "java.lang:type=OperatingSystem", "java.lang:type=GarbageCollector,*"]
+
+    def __init__(self, uri, username, password, dbName, sdDirectory, writeMode:str="unwind", batchSize:int=1000, poolSize:int=None):
+        self.name = "Neo4j"
+        self.variant = writeMode
+        self.uri = uri
+        self.username = username
+        self.password = password
+        self.dbName = dbName
+        self.saveDataDirectory = sdDirectory
 
-        for i in range(iterations):
-            run = i + 1
-            print(f"Retrieve Hash Run {run}")
+        if writeMode not in self.writeModes:
+            raise ValueError(f"Unknown Neo4j write mode {writeMode}, expected one of {self.writeModes}")
+        self.writeMode = writeMode
+        self.batchSize = batchSize
 
-            startTime = time.time()
-            self.client.hgetall(hashKey)
-            endTime = time.time()
+        self.poolSize = poolSize
+        self.driver, self.acquireNs = connections.acquire(self.connect)
+        self.asyncDriver = None
 
-            dataToStore.append({"run": run, "st": startTime, "et": endTime, "ft": round(abs(endTime - startTime), 2), "qSize": 1})
+        # Labels that currently have the query suite's full-text index
+        self.fullTextIndexed = set()
 
-        return {"saveDirectory": self.saveDataDirectory, "op": "RetrieveHash", "dbms": self.name, "result": dataToStore}
-    
-    # # Insert hash data
-    # redis_db.insertHashTest(hash_key, document_data, iterations)
+    def connect(self):
+        requireDriver("Neo4j")
+        if self.poolSize:
+            driver = connections.pool(("neo4j", self.uri, self.username, self.poolSize),
+                                      lambda: GraphDatabase.driver(self.uri, auth=(self.username, self.password), max_connection_pool_size=self.poolSize),
+                                      lambda driver: driver.close())
+        else:
+            driver = GraphDatabase.driver(self.uri, auth=(self.username, self.password))
+        driver.verify_connectivity()
+        return driver
 
-    # # Retrieve hash data
-    # redis_db.retrieveHashTest(hash_key, iterations)
+    def closeConn(self):
+        if not self.poolSize:
+            self.driver.close()
+
+    def serverStats(self):
+        # JVM heap, CPU and GC figures through the JMX procedure (needs dbms.queryJmx to be allowed)
+        stats = {}
+        with self.session() as session:
+            for bean in self.jmxBeans:
+                for record in session.run("CALL dbms.queryJmx($bean) YIELD name, attributes", bean=bean):
+                    for attribute, entry in record["attributes"].items():
+                        value = entry.get("value")
+                        if isinstance(value, dict):
+                            value = value.get("properties", value)
+                            stats.update({f"{record['name']}.{attribute}.{key}": item for key, item in value.items() if isinstance(item, (int, float))})
+                        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                            stats[f"{record['name']}.{attribute}"] = value
+        return stats
+
+    def session(self):
+        return self.driver.session(database=self.dbName)
+
+    def write(self, session, query:str, parameters:dict=None):
+        # One explicit write transaction, fully consumed so the time includes the commit
+        return self.request(session.execute_write, lambda tx: tx.run(query, parameters or {}).consume())
+
+    def setupSchema(self, tableName:str):
+        # Uniqueness constraint (and its backing index) on the lookup key, so MERGE and range reads use an index
+        if self.schemaVariant is not None:
+            return
+        keyField = tableKeys[tableName]
+        with self.session() as session:
+            session.run(f"""
+            CREATE CONSTRAINT {tableName}_{keyField}_unique IF NOT EXISTS
+            FOR (n:{tableName}) REQUIRE n.{keyField} IS UNIQUE
+            """).consume()
+
+    def reset(self, tableName:str):
+        self.setupSchema(tableName)
+        self.bulkDelete(tableName)
+
+    def bulkInsert(self, tableName:str, rows:list[dict]):
+        # Each table maps to a node label, each row to one node
+        with self.session() as session:
+            if self.writeMode == "perRow":
+                for row in rows:
+                    self.request(lambda: session.run(f"CREATE (n:{tableName}) SET n = $props", {"props": row}).consume())
+                return
+
+            if self.writeMode == "merge":
+                keyField = tableKeys[tableName]
+                query = f"UNWIND $rows AS row MERGE (n:{tableName} {{{keyField}: row.{keyField}}}) SET n = row"
+            else:
+                query = f"UNWIND $rows AS row CREATE (n:{tableName}) SET n = row"
+
+            for i in range(0, len(rows), self.batchSize):
+                self.write(session, query, {"rows": rows[i:i + self.batchSize]})
+
+    def bulkLoad(self, tableName:str, batches):
+        # One UNWIND ... CREATE transaction per dataset batch, however the write mode batches timed inserts.
+        # A fresh database loads faster still with neo4j-admin import (BulkLoad.neo4jImportFiles)
+        self.loadMethod = "UNWIND CREATE"
+        query = f"UNWIND $rows AS row CREATE (n:{tableName}) SET n = row"
+        with self.session() as session:
+            for batch in batches:
+                self.write(session, query, {"rows": batch if isinstance(batch, list) else batch.to_pylist()})
+
+    def bulkUpdate(self, tableName:str, changes:dict):
+        with self.session() as session:
+            self.write(session, f"MATCH (n:{tableName}) SET n += $changes", {"changes": changes})
+
+    def bulkDelete(self, tableName:str):
+        # Deleted in batchSize chunks so a large label does not have to fit in one transaction
+        with self.session() as session:
+            while True:
+                deleted = self.request(session.execute_write, lambda tx: tx.run(f"""
+                MATCH (n:{tableName}) WITH n LIMIT $batchSize
+                DETACH DELETE n RETURN count(*) AS deleted
+                """, {"batchSize": self.batchSize}).single()["deleted"])
+                if deleted == 0:
+                    break
+
+    def updateRecord(self, tableName:str, keyField:str, recordID:int, changes:dict):
+        with self.session() as session:
+            self.write(session, f"MATCH (n:{tableName} {{{keyField}: $recordID}}) SET n += $changes", {"recordID": recordID, "changes": changes})
+
+    def rangeRead(self, tableName:str, keyField:str, startID:int, endID:int):
+        query = f"""
+        MATCH (n:{tableName})
+        WHERE n.{keyField} >= $startID AND n.{keyField} <= $endID
+        RETURN n
+        """
 
-class Neo4jDB:
-    def __init__(self, uri, username, password, db_name, sd_directory):
-        self.name = "Neo4j"
-        self.uri = uri
-        self.username = username
-        self.password = password
-        self.db_name = db_name
-        self.save_data_directory = sd_directory
-        self.driver = GraphDatabase.driver(self.uri, auth=(self.username, self.password))
-
-    def close_conn(self):
-        self.driver.close()
-
-    @postProcess
-    def insertTest(self, documentData: list[dict], iterations: int):
-        data_to_store = []
-
-        with self.driver.session(database=self.db_name) as session:
-            # Clear existing data
-            session.run("MATCH (n) DETACH DELETE n")
-
-            division_factor = len(documentData) // iterations
-            iter_size = 0
-
-            for i in range(iterations):
-                run = i + 1
-                print(f"Insert Run {run}")
-
-                iter_size += division_factor
-                data_to_insert = documentData[:iter_size]
-
-                start_time = time.time()
-                for student in data_to_insert:
-                    session.run("""
-                    CREATE (s:Student {
-                        id: $ID,
-                        name: $name,
-                        intake_year: $intakeYear,
-                        age: $age,
-                        course: $course,
-                        sem: $sem
-                    })
-                    """, {
-                        "ID": student["ID"],
-                        "name": student["name"],
-                        "intakeYear": student["intakeYear"],
-                        "age": int(student["age"]),
-                        "course": student["course"],
-                        "sem": int(student["sem"])
-                    })
-                end_time = time.time()
-
-                data_to_store.append({
-                    "run": run,
-                    "st": start_time,
-                    "et": end_time,
-                    "ft": round(abs(end_time - start_time), 2),
-                    "qSize": iter_size
-                })
-
-                if run != iterations:
-                    # Clear data for the next iteration
-                    session.run("MATCH (n) DETACH DELETE n")
-
-        return {
-            "saveDirectory": self.save_data_directory,
-            "op": "Insert",
-            "dbms": self.name,
-            "result": data_to_store
-        }
-
-    @postProcess
-    def retrieveTest(self, documentData: list[dict], iterations: int):
-        data_to_store = []
-
-        with self.driver.session(database=self.db_name) as session:
-            division_factor = len(documentData) // iterations
-            iter_size = 0
-
-            for i in range(iterations):
-                run = i + 1
-                print(f"Retrieve Run {run}")
-
-                iter_size += division_factor
-                ids_to_retrieve = [student['ID'] for student in documentData[:iter_size]]
-
-                start_time = time.time()
-                session.run("""
-                MATCH (s:Student)
-                WHERE s.id IN $ids
-                RETURN s
-                """, {"ids": ids_to_retrieve})
-                end_time = time.time()
-
-                data_to_store.append({
-                    "run": run,
-                    "st": start_time,
-                    "et": end_time,
-                    "ft": round(abs(end_time - start_time), 2),
-                    "qSize": iter_size
-                })
-
-        return {
-            "saveDirectory": self.save_data_directory,
-            "op": "Retrieve",
-            "dbms": self.name,
-            "result": data_to_store
-        }
-
-    @postProcess
-    def updateTest(self, documentData: list[dict], iterations: int):
-        data_to_store = []
-
-        with self.driver.session(database=self.db_name) as session:
-            division_factor = len(documentData) // iterations
-            iter_size = 0
-
-            for i in range(iterations):
-                run = i + 1
-                print(f"Update Run {run}")
-
-                iter_size += division_factor
-                data_to_update = documentData[:iter_size]
-
-                start_time = time.time()
-                for student in data_to_update:
-                    session.run("""
-                    MATCH (s:Student {id: $ID})
-                    SET s.name = $name,
-                        s.intake_year = $intakeYear,
-                        s.age = $age,
-                        s.course = $course,
-                        s.sem = $sem
-                    """, {
-                        "ID": student["ID"],
-                        "name": student["name"],
-                        "intakeYear": student["intakeYear"],
-                        "age": int(student["age"]),
-                        "course": student["course"],
-                        "sem": int(student["sem"])
-                    })
-                end_time = time.time()
-
-                data_to_store.append({
-                    "run": run,
-                    "st": start_time,
-                    "et": end_time,
-                    "ft": round(abs(end_time - start_time), 2),
-                    "qSize": iter_size
-                })
-
-        return {
-            "saveDirectory": self.save_data_directory,
-            "op": "Update",
-            "dbms": self.name,
-            "result": data_to_store
-        }
-
-    @postProcess
-    def deleteTest(self, documentData: list[dict], iterations: int):
-        data_to_store = []
-
-        with self.driver.session(database=self.db_name) as session:
-            division_factor = len(documentData) // iterations
-            iter_size = 0
-
-            for i in range(iterations):
-                run = i + 1
-                print(f"Delete Run {run}")
-
-                iter_size += division_factor
-                ids_to_delete = [student['ID'] for student in documentData[:iter_size]]
-
-                start_time = time.time()
-                session.run("""
-                MATCH (s:Student)
-                WHERE s.id IN $ids
-                DETACH DELETE s
-                """, {"ids": ids_to_delete})
-                end_time = time.time()
-
-                data_to_store.append({
-                    "run": run,
-                    "st": start_time,
-                    "et": end_time,
-                    "ft": round(abs(end_time - start_time), 2),
-                    "qSize": iter_size
-                })
-
-        return {
-            "saveDirectory": self.save_data_directory,
-            "op": "Delete",
-            "dbms": self.name,
-            "result": data_to_store
-        }
\ No newline at end of file
+        # Records are fetched inside the read transaction, so the time covers streaming every row back
+        with self.session() as session:
+            return self.request(session.execute_read, lambda tx: tx.run(query, {"startID": startID, "endID": endID}).data())
+
+    def createQueryIndexes(self, tableName:str):
+        with self.session() as session:
+            for field in queryIndexes.get(tableName, []):
+                session.run(f"CREATE INDEX {tableName}_{field}_query IF NOT EXISTS FOR (n:{tableName}) ON (n.{field})").consume()
+            if tableName in fullTextIndexes:
+                field = fullTextIndexes[tableName]
+                session.run(f"CREATE FULLTEXT INDEX {tableName}_{field}_text IF NOT EXISTS FOR (n:{tableName}) ON EACH [n.{field}]").consume()
+                self.fullTextIndexed.add(tableName)
+            # Index creation is asynchronous; the build counts towards indexTime, not the first query
+            session.run("CALL db.awaitIndexes(3600)").consume()
+
+    def dropQueryIndexes(self, tableName:str):
+        names = [f"{tableName}_{field}_query" for field in queryIndexes.get(tableName, [])]
+        if tableName in fullTextIndexes:
+            names.append(f"{tableName}_{fullTextIndexes[tableName]}_text")
+        with self.session() as session:
+            for name in names:
+                session.run(f"DROP INDEX {name} IF EXISTS").consume()
+        self.fullTextIndexed.discard(tableName)
+
+    def createIndex(self, tableName:str, kind:str, fields:list[str]):
+        name = indexName(tableName, kind, fields)
+        properties = ", ".join(f"n.{field}" for field in fields)
+        with self.session() as session:
+            match kind:
+                case "primary":
+                    session.run(f"CREATE CONSTRAINT {name} IF NOT EXISTS FOR (n:{tableName}) REQUIRE ({properties}) IS UNIQUE").consume()
+                case "secondary":
+                    session.run(f"CREATE INDEX {name} IF NOT EXISTS FOR (n:{tableName}) ON ({properties})").consume()
+                case "text":
+                    session.run(f"CREATE FULLTEXT INDEX {name} IF NOT EXISTS FOR (n:{tableName}) ON EACH [{properties}]").consume()
+                    self.fullTextIndexed.add(tableName)
+            session.run("CALL db.awaitIndexes(3600)").consume()
+
+    def dropIndexes(self, tableName:str):
+        # Constraints first (dropping one drops its backing index), then the remaining indexes on the label
+        with self.session() as session:
+            for record in session.run("SHOW CONSTRAINTS YIELD name, labelsOrTypes WHERE $label IN labelsOrTypes RETURN name", {"label": tableName}).data():
+                session.run(f"DROP CONSTRAINT {record['name']} IF EXISTS").consume()
+            for record in session.run("SHOW INDEXES YIELD name, labelsOrTypes, owningConstraint WHERE $label IN labelsOrTypes AND owningConstraint IS NULL RETURN name",
+                                      {"label": tableName}).data():
+                session.run(f"DROP INDEX {record['name']} IF EXISTS").consume()
+        self.fullTextIndexed.discard(tableName)
+
+    def describeSchema(self, tableName:str):
+        with self.session() as session:
+            records = session.run("""
+            SHOW INDEXES YIELD name, type, labelsOrTypes, properties, owningConstraint
+            WHERE $label IN labelsOrTypes RETURN name, type, properties, owningConstraint IS NOT NULL AS unique
+            """, {"label": tableName}).data()
+        return [{"name": record["name"], "fields": record["properties"], "unique": record["unique"], "type": record["type"]} for record in records]
+
+    def query(self, name:str, parameters:dict):
+        match name:
+            case "pointLookup":
+                cypher = "MATCH (n:loans {LoanID: $loanID}) RETURN n"
+            case "memberLoans":
+                cypher = "MATCH (n:loans) WHERE n.MemberID = $memberID RETURN n"
+            case "loanDateRange":
+                cypher = "MATCH (n:loans) WHERE n.LoanDate >= $start AND n.LoanDate < $end RETURN n"
+            case "titleJoin":
+                # Rows are value-joined on BookID like the other engines; the model has no relationships
+                cypher = """
+                MATCH (b:books) WHERE toLower(b.Title) CONTAINS toLower($keyword)
+                MATCH (n:loans {BookID: b.BookID}) RETURN n, b.Title AS Title
+                """
+            case "loansPerMember":
+                cypher = """
+                MATCH (n:loans) WITH n.MemberID AS memberID, count(*) AS loans
+                OPTIONAL MATCH (m:members {MemberID: memberID}) RETURN memberID AS MemberID, m.Name AS Name, loans
+                """
+            case "overdueCount":
+                cypher = "MATCH (n:loans) WHERE (n.ReturnDate IS NULL AND n.DueDate < $asOf) OR n.ReturnDate > n.DueDate RETURN count(*) AS overdue"
+            case "topBooks":
+                cypher = "MATCH (n:loans) RETURN n.BookID AS BookID, count(*) AS loans ORDER BY loans DESC LIMIT $k"
+            case "contentSearch":
+                # The full-text index matches analysed words; without it the same whole word is matched with a label scan
+                if "UserPostComment" in self.fullTextIndexed:
+                    cypher = "CALL db.index.fulltext.queryNodes('UserPostComment_Content_text', $term) YIELD node RETURN node"
+                else:
+                    cypher = "MATCH (n:UserPostComment) WHERE n.Content =~ $pattern RETURN n"
+                    parameters = {**parameters, "pattern": "(?is).*\\b" + re.escape(parameters["term"]) + "\\b.*"}
+            case _:
+                raise ValueError(f"Unknown query {name}")
+
+        with self.session() as session:
+            return self.request(session.execute_read, lambda tx: tx.run(cypher, parameters).data())
+
+    async def asyncRangeRead(self, tableName:str, keyField:str, startID:int, endID:int):
+        if self.asyncDriver is None:
+            self.asyncDriver = AsyncGraphDatabase.driver(self.uri, auth=(self.username, self.password))
+
+        async with self.asyncDriver.session(database=self.dbName) as session:
+            result = await session.run(f"""
+            MATCH (n:{tableName})
+            WHERE n.{keyField} >= $startID AND n.{keyField} <= $endID
+            RETURN n
+            """, {"startID": startID, "endID": endID})
+            return [record async for record in result]
+
+    async def asyncClose(self):
+        if self.asyncDriver is not None:
+            await self.asyncDriver.close()
+            self.asyncDriver = None
@@ -0,0 +1,143 @@
+import csv
+from os import path
+from datetime import datetime
+
+# Column types and date columns of each benchmark CSV, shared by every reader
+datasetSchemas = {
+    "loans": {
+        "fileName": "loans.csv",
+        "dtype": {"LoanID": int, "BookID": int, "MemberID": int},
+        "parseDates": ["LoanDate", "DueDate", "ReturnDate"]
+    },
+    "members": {
+        "fileName": "members.csv",
+        "dtype": {"MemberID": int, "Name": str},
+        "parseDates": ["JoinDate"]
+    },
+    "books": {
+        "fileName": "books.csv",
+        "dtype": {"BookID": int, "Title": str, "Author": str, "PublishedYear": int},
+        "parseDates": []
+    },
+    "UserPostComment": {
+        "fileName": "user_post_comments.csv",
+        "dtype": {"PostCommentID": int, "UserID": int, "PostID": int, "Content": str},
+        "parseDates": []
+    }
+}
+
+
+class Dataset:
+    # A CSV that is streamed as typed record batches instead of being loaded whole. It can be
+    # iterated any number of times (each call to batches() re-reads the file), so workloads
+    # that need growing prefixes keep memory bounded by batchSize rather than the file size.
+    #   reader: "pandas" (chunked read_csv), "pyarrow" (streaming CSV reader), "csv" (stdlib)
+    #           or "parquet" (row groups of the .parquet file written by Synthetic.py)
+    #   columnar: with the pyarrow/parquet readers, yield pyarrow RecordBatches instead of lists of
+    #           dicts, so adapters can build their driver payload straight from the column buffers
+    def __init__(self, tableName:str, dataDirectory:str, batchSize:int=10000, reader:str="pandas", columnar:bool=False) -> None:
+        if columnar and reader not in ("pyarrow", "parquet"):
+            raise ValueError(f"Columnar batches need the pyarrow or parquet reader, not {reader}")
+        schema = datasetSchemas[tableName]
+        fileName = schema["fileName"].replace(".csv", ".parquet") if reader == "parquet" else schema["fileName"]
+        self.tableName = tableName
+        self.filePath = path.join(dataDirectory, fileName)
+        self.dtype = schema["dtype"]
+        self.parseDates = schema["parseDates"]
+        self.batchSize = batchSize
+        self.reader = reader
+        self.columnar = columnar
+        self.rowCount = None
+
+    def __len__(self):
+        # Counted with the csv module rather than by lines, since Content may hold quoted newlines
+        if self.rowCount is None and self.reader == "parquet":
+            import pyarrow.parquet as pq
+            self.rowCount = pq.ParquetFile(self.filePath).metadata.num_rows
+        if self.rowCount is None:
+            with open(self.filePath, newline="") as f:
+                self.rowCount = max(sum(1 for _ in csv.reader(f)) - 1, 0)
+        return self.rowCount
+
+    def batches(self, limit:int=None):
+        readers = {"pandas": self.pandasBatches, "pyarrow": self.arrowBatches, "csv": self.csvBatches, "parquet": self.parquetBatches}
+        remaining = len(self) if limit is None else limit
+
+        for batch in readers[self.reader]():
+            if remaining <= 0:
+                break
+            if len(batch) > remaining:
+                batch = batch[:remaining]
+            remaining -= len(batch)
+            yield batch
+
+    def pandasBatches(self):
+        import pandas as pd
+
+        with pd.read_csv(self.filePath, dtype=self.dtype, parse_dates=self.parseDates, chunksize=self.batchSize) as chunks:
+            for chunk in chunks:
+                # NaT/NaN become None so every driver sees a proper null
+                chunk = chunk.astype(object).where(chunk.notna(), None)
+                yield chunk.to_dict(orient="records")
+
+    def arrowBatches(self):
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+
+        arrowTypes = {int: pa.int64(), str: pa.string(), float: pa.float64()}
+        columnTypes = {column: arrowTypes[columnType] for column, columnType in self.dtype.items()}
+        columnTypes.update({column: pa.timestamp("us") for column in self.parseDates})
+
+        # Rebatched to batchSize rows; in columnar mode the slices are zero-copy views of the parsed blocks
+        pending = []
+        readOptions = pacsv.ReadOptions(block_size=1 << 24)
+        with pacsv.open_csv(self.filePath, read_options=readOptions, convert_options=pacsv.ConvertOptions(column_types=columnTypes)) as reader:
+            for recordBatch in reader:
+                pending.append(recordBatch if self.columnar else recordBatch.to_pylist())
+                while sum(len(part) for part in pending) >= self.batchSize:
+                    yield from self.rebatch(pending)
+        if pending and sum(len(part) for part in pending):
+            yield self.concat(pending)
+
+    def concat(self, parts:list):
+        if not self.columnar:
+            return [row for part in parts for row in part]
+        import pyarrow as pa
+        return parts[0] if len(parts) == 1 else pa.Table.from_batches(parts).combine_chunks().to_batches()[0]
+
+    def rebatch(self, pending:list):
+        # Emits one batchSize batch from the front of pending, leaving the remainder in place
+        taken, parts = 0, []
+        while taken < self.batchSize:
+            part = pending.pop(0)
+            need = self.batchSize - taken
+            if len(part) > need:
+                pending.insert(0, part[need:])
+                part = part[:need]
+            parts.append(part)
+            taken += len(part)
+        yield self.concat(parts)
+
+    def parquetBatches(self):
+        import pyarrow.parquet as pq
+
+        for recordBatch in pq.ParquetFile(self.filePath).iter_batches(batch_size=self.batchSize):
+            yield recordBatch if self.columnar else recordBatch.to_pylist()
+
+    def csvBatches(self):
+        def convert(column, value):
+            if value == "":
+                return None
+            if column in self.parseDates:
+                return datetime.fromisoformat(value)
+            return self.dtype[column](value) if column in self.dtype else value
+
+        batch = []
+        with open(self.filePath, newline="") as f:
+            for row in csv.DictReader(f):
+                batch.append({column: convert(column, value) for column, value in row.items()})
+                if len(batch) == self.batchSize:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
@@ -0,0 +1,61 @@
+from os import getenv, path
+from functools import partial
+from DBMS import MongoDB, Oracle, RedisDB, Neo4jDB
+from LocalDBMS import LocalMongoDB, SQLiteDB, MemoryGraphDB, LocalRedisDB, NullDB
+
+# Engine names accepted by the menu, spec files and reports; the next four are the server-less stand-ins of the
+# first four, and null is the harness-overhead baseline (Calibration.py)
+engineNames = ["mongodb", "oracle", "neo4j", "redis", "mongomock", "sqlite", "memoryGraph", "fakeredis", "null"]
+
+def engineFactory(engine:str, databaseName:str, saveDataDirectory:str, dataDirectory:str, poolSize:int=None):
+    # Connection settings come from the environment (.env); the factory is picklable so
+    # process-pool load generation can open one connection per worker.
+    # poolSize (default: the poolSize setting, unset for one connection per adapter) makes the server engines
+    # share one pool per process across adapters (Connections.py)
+    poolSize = poolSize or (int(getenv("poolSize")) if getenv("poolSize") else None)
+    match engine:
+        case "mongodb":
+            return partial(MongoDB, getenv("mDBConnectionURL"), databaseName, saveDataDirectory, dataDirectory, poolSize=poolSize)
+        case "oracle":
+            return partial(Oracle, getenv("oracleDns"), databaseName, saveDataDirectory, dataDirectory, getenv("oracleUser"), getenv("oraclePW"), getenv("oracleTableSchema"),
+                           clientLibDir=getenv("oracleClientLibDir"), poolSize=poolSize)
+        case "neo4j":
+            return partial(Neo4jDB,
+                getenv("NEO4J_URI"),
+                getenv("NEO4J_USERNAME"),
+                getenv("NEO4J_PASSWORD"),
+                getenv("NEO4J_DB_NAME"),
+                saveDataDirectory,
+                batchSize=int(getenv("neo4jBatchSize", 1000)),
+                poolSize=poolSize
+            )
+        case "redis":
+            return partial(RedisDB, getenv("rdConnectionURL"), saveDataDirectory, batchSize=int(getenv("redisBatchSize", 1000)), poolSize=poolSize)
+        case "mongomock":
+            return partial(LocalMongoDB, databaseName, saveDataDirectory, dataDirectory)
+        case "sqlite":
+            # sqlitePath defaults to <databaseName>.sqlite next to the results
+            databasePath = getenv("sqlitePath") or path.join(saveDataDirectory, f"{databaseName}.sqlite")
+            return partial(SQLiteDB, databasePath, databaseName, saveDataDirectory, dataDirectory)
+        case "memoryGraph":
+            return partial(MemoryGraphDB, databaseName, saveDataDirectory, batchSize=int(getenv("neo4jBatchSize", 1000)))
+        case "fakeredis":
+            return partial(LocalRedisDB, saveDataDirectory, batchSize=int(getenv("redisBatchSize", 1000)))
+        case "null":
+            return partial(NullDB, saveDataDirectory)
+    raise ValueError(f"Unknown engine {engine}, expected one of {engineNames}")
+
+def engineVariants(engine:str, names:list[str]=None):
+    # Keyword arguments for the factory per variant name; names default to the engine's baseline variant
+    match engine:
+        case "mongodb" | "oracle" | "mongomock" | "sqlite":
+            presets = {"mongodb": MongoDB, "oracle": Oracle, "mongomock": LocalMongoDB, "sqlite": SQLiteDB}[engine].variantPresets
+            names = names or ["default"]
+            return {name: {"variant": name, **presets[name]} for name in names}
+        case "neo4j" | "memoryGraph":
+            return {mode: {"writeMode": mode} for mode in names or ["unwind"]}
+        case "redis" | "fakeredis":
+            return {mode: {"mode": mode} for mode in names or ["perKey"]}
+        case "null":
+            return {"default": {}}
+    raise ValueError(f"Unknown engine {engine}, expected one of {engineNames}")
@@ -0,0 +1,172 @@
+import time, random, asyncio
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from Metrics import LatencyHistogram
+from Workload import postProcess, tableKeys
+
+# Request types a worker can issue; each takes (adapter, tableName, keyField, recordID, scanLength)
+def pointRead(adapter, tableName, keyField, recordID, scanLength):
+    return adapter.rangeRead(tableName, keyField, recordID, recordID)
+
+def scan(adapter, tableName, keyField, recordID, scanLength):
+    return adapter.rangeRead(tableName, keyField, recordID, recordID + scanLength - 1)
+
+operations = {"pointRead": pointRead, "scan": scan}
+
+async def asyncPointRead(adapter, tableName, keyField, recordID, scanLength):
+    return await adapter.asyncRangeRead(tableName, keyField, recordID, recordID)
+
+async def asyncScan(adapter, tableName, keyField, recordID, scanLength):
+    return await adapter.asyncRangeRead(tableName, keyField, recordID, recordID + scanLength - 1)
+
+asyncOperations = {"pointRead": asyncPointRead, "scan": asyncScan}
+
+
+def runWorker(adapterFactory, tableName:str, operation:str, keySpace:int, scanLength:int, duration:float, ratePerWorker:float, seed:int):
+    # Module level so ProcessPoolExecutor can pickle it. Each worker owns its own connection.
+    # Closed loop (ratePerWorker None): next request as soon as the previous one returns.
+    # Open loop: requests are due on a fixed schedule and latency is measured from the due
+    # time, so a slow server is charged for the queueing it causes (no coordinated omission).
+    adapter = adapterFactory()
+    acquireNs = adapter.acquireNs
+    request = operations[operation]
+    keyField = tableKeys[tableName]
+    rng = random.Random(seed)
+    histogram = LatencyHistogram()
+    errors = 0
+
+    intervalNs = int(1e9 / ratePerWorker) if ratePerWorker else 0
+    startNs = time.perf_counter_ns()
+    endNs = startNs + int(duration * 1e9)
+    dueNs = startNs
+
+    try:
+        while True:
+            if intervalNs:
+                now = time.perf_counter_ns()
+                if dueNs > now:
+                    time.sleep((dueNs - now) / 1e9)
+            requestStartNs = dueNs if intervalNs else time.perf_counter_ns()
+            if requestStartNs >= endNs:
+                break
+
+            # Only successful requests count towards latency and throughput, so a failing engine does not look fast
+            try:
+                request(adapter, tableName, keyField, rng.randint(1, keySpace), scanLength)
+            except Exception:
+                errors += 1
+            else:
+                histogram.record(time.perf_counter_ns() - requestStartNs)
+            dueNs += intervalNs
+    finally:
+        adapter.closeConn()
+
+    return histogram, errors, time.perf_counter_ns() - startNs, acquireNs
+
+
+async def runAsyncWorker(adapter, tableName:str, operation:str, keySpace:int, scanLength:int, duration:float, ratePerWorker:float, seed:int):
+    request = asyncOperations[operation]
+    keyField = tableKeys[tableName]
+    rng = random.Random(seed)
+    histogram = LatencyHistogram()
+    errors = 0
+
+    intervalNs = int(1e9 / ratePerWorker) if ratePerWorker else 0
+    startNs = time.perf_counter_ns()
+    endNs = startNs + int(duration * 1e9)
+    dueNs = startNs
+
+    while True:
+        if intervalNs:
+            now = time.perf_counter_ns()
+            if dueNs > now:
+                await asyncio.sleep((dueNs - now) / 1e9)
+        requestStartNs = dueNs if intervalNs else time.perf_counter_ns()
+        if requestStartNs >= endNs:
+            break
+
+        try:
+            await request(adapter, tableName, keyField, rng.randint(1, keySpace), scanLength)
+        except Exception:
+            errors += 1
+        else:
+            histogram.record(time.perf_counter_ns() - requestStartNs)
+        dueNs += intervalNs
+
+    return histogram, errors, time.perf_counter_ns() - startNs, None
+
+
+class LoadGenerator:
+    # Runs K concurrent clients against one engine for each concurrency level and reports
+    # aggregate throughput and latency per level.
+    #   executor: "thread" | "process" (one connection per worker) or "asyncio" (K tasks on one async client)
+    #   targetRate: total requests/sec for open loop, None for closed loop
+    def __init__(self, adapterFactory, tableName:str, keySpace:int, operation:str="pointRead", executor:str="thread",
+                 targetRate:float=None, duration:float=10.0, scanLength:int=100, seed:int=0) -> None:
+        self.adapterFactory = adapterFactory
+        self.tableName = tableName
+        self.keySpace = keySpace
+        self.operation = operation
+        self.executor = executor
+        self.targetRate = targetRate
+        self.duration = duration
+        self.scanLength = scanLength
+        self.seed = seed
+
+    def workerArgs(self, concurrency:int, worker:int):
+        ratePerWorker = (self.targetRate / concurrency) if self.targetRate else None
+        return (self.tableName, self.operation, self.keySpace, self.scanLength, self.duration, ratePerWorker, self.seed + worker)
+
+    def runPool(self, concurrency:int):
+        poolClass = ProcessPoolExecutor if self.executor == "process" else ThreadPoolExecutor
+        with poolClass(max_workers=concurrency) as pool:
+            futures = [pool.submit(runWorker, self.adapterFactory, *self.workerArgs(concurrency, worker)) for worker in range(concurrency)]
+            return [future.result() for future in futures]
+
+    async def runTasks(self, concurrency:int):
+        adapter = self.adapterFactory()
+        try:
+            results = await asyncio.gather(*[runAsyncWorker(adapter, *self.workerArgs(concurrency, worker)) for worker in range(concurrency)])
+            # The tasks share one adapter, so its connection acquisition is counted once
+            return [(*result[:3], adapter.acquireNs if worker == 0 else None) for worker, result in enumerate(results)]
+        finally:
+            await adapter.asyncClose()
+            adapter.closeConn()
+
+    def runLevel(self, concurrency:int):
+        print(f"Concurrency {concurrency}")
+        if self.executor == "asyncio":
+            workerResults = asyncio.run(self.runTasks(concurrency))
+        else:
+            workerResults = self.runPool(concurrency)
+
+        histogram = LatencyHistogram()
+        acquire = LatencyHistogram()
+        errors = 0
+        throughput = 0
+        for workerHistogram, workerErrors, elapsedNs, acquireNs in workerResults:
+            histogram.merge(workerHistogram)
+            errors += workerErrors
+            # Successful requests per second; failed ones are only counted in errors
+            throughput += workerHistogram.totalCount / (elapsedNs / 1e9) if elapsedNs else 0
+            if acquireNs is not None:
+                acquire.record(acquireNs)
+
+        # Connection acquisition of each worker, outside the measured requests
+        return {"concurrency": concurrency, "requests": histogram.totalCount, "errors": errors,
+                "throughput": throughput, "latency": histogram.summary(), "connectionAcquire": acquire.summary(), "histogram": histogram.toDict()}
+
+    @postProcess
+    def run(self, concurrencyLevels:list[int]):
+        probe = self.adapterFactory()
+        dbms, variant, saveDirectory = probe.name, probe.variant, probe.saveDataDirectory
+        probe.closeConn()
+
+        dataToStore = [self.runLevel(concurrency) for concurrency in concurrencyLevels]
+        loop = "openLoop" if self.targetRate else "closedLoop"
+
+        # The variant keeps each variant's load results in their own file and report series
+        return {"saveDirectory": saveDirectory, "tableName": self.tableName, "dbms": dbms, "variant": variant,
+                "operation": f"load_{self.operation}_{self.executor}_{loop}",
+                "executor": self.executor, "targetRate": self.targetRate, "duration": self.duration,
+                "histograms": {str(entry["concurrency"]): entry.pop("histogram") for entry in dataToStore},
+                "result": dataToStore}
@@ -0,0 +1,631 @@
+import re, sqlite3, asyncio, threading
+from bisect import bisect_left
+from datetime import datetime
+from Workload import DBMSAdapter, tableKeys, tableIndexes, queryIndexes, fullTextIndexes, wordPattern
+from Datasets import datasetSchemas
+from DBMS import MongoDB, RedisDB
+from Connections import connections
+from Schema import indexName
+
+# In-process (or local file) stand-ins behind the same adapter surface as DBMS.py, so every workload can be
+# smoke-tested, profiled and have the harness's own per-operation cost measured without any server:
+#   mongomock    MongoDB adapter on a mongomock client (needs mongomock)
+#   sqlite       the Oracle tables, statements and query suite on an SQLite file (standard library)
+#   memoryGraph  the Neo4j node model in a Python dict store with property and word indexes
+#   fakeredis    Redis adapter on a fakeredis server (needs fakeredis; the lua mode also needs lupa)
+#   null         no engine at all, the harness-overhead baseline
+# mongomock, memoryGraph and fakeredis data lives in the process and is shared by every adapter of that
+# process, so thread and asyncio load generation see the loaded data but process pools do not. Their
+# numbers say nothing about the real engines; they are a floor for what the harness itself costs.
+
+mongoStore = None
+fakeServers = {}
+graphs = {}
+storeLock = threading.Lock()
+
+
+class LocalMongoDB(MongoDB):
+    variantPresets = {
+        "default": {},
+        "unordered": {"ordered": False},
+        "batched": {"batchSize": 10000}
+    }
+
+    def __init__(self, dbName:str, sdDirectory:str, dDirectory:str, variant:str="default", ordered:bool=True, batchSize:int=None) -> None:
+        super().__init__(None, dbName, sdDirectory, dDirectory, variant=variant, ordered=ordered, batchSize=batchSize)
+        self.name = "mongomock"
+
+    def connect(self, clientOptions:dict):
+        global mongoStore
+        import mongomock
+        from mongomock.store import ServerStore
+
+        with storeLock:
+            if mongoStore is None:
+                mongoStore = ServerStore()
+        return mongomock.MongoClient(_store=mongoStore)
+
+    def serverStats(self):
+        return {}
+
+    def prepare(self, collectionName:str, documentData:list[dict]):
+        # mongomock only takes dicts and sets _id on them, so the batch is copied rather than BSON-encoded
+        return [dict(row) for row in documentData]
+
+    def payloadEncoding(self):
+        return "mongomock:documents"
+
+    def bulkLoad(self, collectionName:str, batches):
+        # Unordered batches of plain dicts (mongomock takes no RawBSONDocuments)
+        self.loadMethod = "insert_many(ordered=False)"
+        collection = self.db[collectionName]
+        for batch in batches:
+            self.request(collection.insert_many, [dict(row) for row in (batch if isinstance(batch, list) else batch.to_pylist())], ordered=False)
+
+    def createIndex(self, collectionName:str, kind:str, fields:list[str]):
+        if kind == "text":
+            raise NotImplementedError("mongomock has no text indexes")
+        super().createIndex(collectionName, kind, fields)
+
+    def createQueryIndexes(self, collectionName:str):
+        # mongomock has no $text operator, so contentSearch keeps the regex scan
+        collection = self.collection(collectionName)
+        for field in queryIndexes.get(collectionName, []):
+            collection.create_index(field, name=f"{field}_query")
+
+    async def asyncRangeRead(self, collectionName:str, keyField:str, startID:int, endID:int):
+        return await DBMSAdapter.asyncRangeRead(self, collectionName, keyField, startID, endID)
+
+    async def asyncClose(self):
+        pass
+
+
+class LocalRedisDB(RedisDB):
+    def __init__(self, sdDirectory:str, mode:str="perKey", batchSize:int=1000, serverName:str="default") -> None:
+        self.serverName = serverName
+        super().__init__(None, sdDirectory, mode, batchSize)
+        self.name = "fakeredis"
+
+    def server(self):
+        import fakeredis
+
+        with storeLock:
+            if self.serverName not in fakeServers:
+                fakeServers[self.serverName] = fakeredis.FakeServer()
+            return fakeServers[self.serverName]
+
+    def connect(self):
+        import fakeredis
+        return fakeredis.FakeRedis(server=self.server())
+
+    def asyncConnect(self):
+        import fakeredis
+        return fakeredis.FakeAsyncRedis(server=self.server())
+
+    def serverStats(self):
+        # fakeredis does not implement INFO
+        return {}
+
+
+def sqliteValue(value):
+    # Dates are stored as ISO text, which sorts and compares like the dates themselves
+    return value.isoformat(sep=" ") if isinstance(value, datetime) else value
+
+
+class SQLiteDB(DBMSAdapter):
+    # Relational stand-in for Oracle: the same tables and statements on an SQLite file (":memory:" for a
+    # private in-memory database), so the load generator's workers can each open their own connection.
+    #   batchSize     rows per executemany call (None sends the whole slice at once)
+    #   journalMode / synchronous  PRAGMA settings, SQLite's durability knobs
+    variantPresets = {
+        "default": {},
+        "batched": {"batchSize": 10000},
+        "walNormal": {"journalMode": "wal", "synchronous": "normal"}
+    }
+
+    def __init__(self, databasePath:str, dbName:str, sdDirectory:str, dDirectory:str,
+                 variant:str="default", batchSize:int=None, journalMode:str="delete", synchronous:str="full") -> None:
+        self.name = "SQLite"
+        self.variant = variant
+        self.databasePath = databasePath
+        self.dbName = dbName
+        self.saveDataDirectory = sdDirectory
+        self.dataDirectory = dDirectory
+        self.batchSize = batchSize
+
+        self.connection, self.acquireNs = connections.acquire(lambda: sqlite3.connect(databasePath, check_same_thread=False))
+        self.connection.execute(f"PRAGMA journal_mode = {journalMode}")
+        self.connection.execute(f"PRAGMA synchronous = {synchronous}")
+        # SQLite parses REGEXP but leaves the function to the application; contentSearch's scan uses it
+        self.connection.create_function("REGEXP", 2, regexpMatch, deterministic=True)
+        self.cursor = self.connection.cursor()
+        # Serialises asyncRangeRead's threads on the shared connection
+        self.lock = threading.Lock()
+
+        # Column order of the tuples produced by prepare(), per table
+        self.columns = {}
+
+        # Tables that currently have an FTS5 table, and those whose FTS5 table is kept current by triggers
+        # (a schema variant's text index) rather than rebuilt by the query suite
+        existing = {name for (name,) in self.connection.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')")}
+        self.fullTextIndexed = {tableName for tableName, field in fullTextIndexes.items() if self.ftsName(tableName, field) in existing}
+        self.maintainedText = {tableName for tableName, field in fullTextIndexes.items() if f"{self.ftsName(tableName, field)}_insert" in existing}
+
+    def closeConn(self):
+        self.cursor.close()
+        self.connection.close()
+
+    def ftsName(self, tableName:str, field:str):
+        return f"{tableName}_{field}_fts"
+
+    def setupSchema(self, tableName:str):
+        # Column types follow the dataset schema; dates are TEXT (see sqliteValue)
+        schema = datasetSchemas[tableName]
+        columns = [f"{column} {'INTEGER' if columnType is int else 'TEXT'}" for column, columnType in schema["dtype"].items()]
+        columns += [f"{column} TEXT" for column in schema["parseDates"]]
+        self.cursor.execute(f"CREATE TABLE IF NOT EXISTS {tableName} ({', '.join(columns)})")
+        if self.schemaVariant is None:
+            for field in tableIndexes.get(tableName, []):
+                self.cursor.execute(f"CREATE INDEX IF NOT EXISTS {tableName}_{field}_idx ON {tableName} ({field})")
+        self.connection.commit()
+
+    def prepare(self, tableName:str, documentData:list[dict]):
+        columns = list(documentData[0].keys()) if documentData else []
+        self.columns[tableName] = columns
+        return [tuple(sqliteValue(row[column]) for column in columns) for row in documentData]
+
+    def payloadEncoding(self):
+        return "SQLite:tuples"
+
+    def payloadState(self, tableName:str):
+        return {"columns": self.columns[tableName]}
+
+    def restorePayloadState(self, tableName:str, state:dict):
+        self.columns[tableName] = state["columns"]
+
+    def reset(self, tableName:str):
+        # The query suite's FTS5 table is external content and not maintained on writes, so it goes with the
+        # rows; a schema variant's is kept current by triggers and stays
+        self.setupSchema(tableName)
+        if tableName not in self.maintainedText:
+            for field in [fullTextIndexes[tableName]] if tableName in fullTextIndexes else []:
+                self.cursor.execute(f"DROP TABLE IF EXISTS {self.ftsName(tableName, field)}")
+            self.fullTextIndexed.discard(tableName)
+        self.request(self.cursor.execute, f"DELETE FROM {tableName}")
+        self.request(self.connection.commit)
+
+    def bulkInsert(self, tableName:str, rows:list[tuple]):
+        columns = self.columns[tableName]
+        insertQuery = f"INSERT INTO {tableName} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+
+        batchSize = self.batchSize or max(len(rows), 1)
+        for i in range(0, len(rows), batchSize):
+            self.request(self.cursor.executemany, insertQuery, rows[i:i + batchSize])
+        self.request(self.connection.commit)
+
+    def bulkLoad(self, tableName:str, batches):
+        # Every batch in one transaction, committed once
+        self.loadMethod = "executemany, one transaction"
+        for batch in batches:
+            rows = self.prepare(tableName, batch) if isinstance(batch, list) else self.prepareColumns(tableName, batch)
+            columns = self.columns[tableName]
+            self.request(self.cursor.executemany, f"INSERT INTO {tableName} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", rows)
+        self.request(self.connection.commit)
+
+    def bulkUpdate(self, tableName:str, changes:dict):
+        updateQuery = f"UPDATE {tableName} SET {', '.join(f'{column} = ?' for column in changes)}"
+        self.request(self.cursor.execute, updateQuery, [sqliteValue(value) for value in changes.values()])
+        self.request(self.connection.commit)
+
+    def bulkDelete(self, tableName:str):
+        self.request(self.cursor.execute, f"DELETE FROM {tableName}")
+        self.request(self.connection.commit)
+
+    def updateRecord(self, tableName:str, keyField:str, recordID:int, changes:dict):
+        updateQuery = f"UPDATE {tableName} SET {', '.join(f'{column} = ?' for column in changes)} WHERE {keyField} = ?"
+        self.request(self.cursor.execute, updateQuery, [*(sqliteValue(value) for value in changes.values()), recordID])
+        self.request(self.connection.commit)
+
+    def rangeRead(self, tableName:str, keyField:str, startID:int, endID:int):
+        self.request(self.cursor.execute, f"SELECT * FROM {tableName} WHERE {keyField} BETWEEN ? AND ?", [startID, endID])
+        return self.request(self.cursor.fetchall)
+
+    def lockedRangeRead(self, tableName:str, keyField:str, startID:int, endID:int):
+        # asyncio tasks share this adapter from worker threads: a cursor per call, one call at a time
+        with self.lock:
+            cursor = self.connection.cursor()
+            try:
+                self.request(cursor.execute, f"SELECT * FROM {tableName} WHERE {keyField} BETWEEN ? AND ?", [startID, endID])
+                return self.request(cursor.fetchall)
+            finally:
+                cursor.close()
+
+    async def asyncRangeRead(self, tableName:str, keyField:str, startID:int, endID:int):
+        return await asyncio.to_thread(self.lockedRangeRead, tableName, keyField, startID, endID)
+
+    def createQueryIndexes(self, tableName:str):
+        for field in queryIndexes.get(tableName, []):
+            self.cursor.execute(f"CREATE INDEX IF NOT EXISTS {tableName}_{field}_qidx ON {tableName} ({field})")
+        # A schema variant's FTS5 table (kept current by triggers) already serves the suite and is not the suite's to replace
+        if tableName in fullTextIndexes and tableName not in self.maintainedText:
+            # FTS5 over the table's rows, the SQLite counterpart of an Oracle Text CONTEXT index
+            field = fullTextIndexes[tableName]
+            ftsName = self.ftsName(tableName, field)
+            self.cursor.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {ftsName} USING fts5({field}, content='{tableName}', content_rowid='rowid')")
+            self.cursor.execute(f"INSERT INTO {ftsName} ({ftsName}) VALUES ('rebuild')")
+            self.fullTextIndexed.add(tableName)
+        self.connection.commit()
+
+    def dropQueryIndexes(self, tableName:str):
+        for field in queryIndexes.get(tableName, []):
+            self.cursor.execute(f"DROP INDEX IF EXISTS {tableName}_{field}_qidx")
+        if tableName in fullTextIndexes and tableName not in self.maintainedText:
+            self.cursor.execute(f"DROP TABLE IF EXISTS {self.ftsName(tableName, fullTextIndexes[tableName])}")
+            self.fullTextIndexed.discard(tableName)
+        self.connection.commit()
+
+    def createIndex(self, tableName:str, kind:str, fields:list[str]):
+        # A unique index stands in for the primary key (SQLite cannot add one to an existing table)
+        name = indexName(tableName, kind, fields)
+        match kind:
+            case "primary" | "secondary":
+                self.cursor.execute(f"CREATE {'UNIQUE ' if kind == 'primary' else ''}INDEX {name} ON {tableName} ({', '.join(fields)})")
+            case "text":
+                # External-content FTS5 table with triggers, so every timed write also updates the text index
+                field = fields[0]
+                ftsName = self.ftsName(tableName, field)
+                self.cursor.executescript(f"""
+                    CREATE VIRTUAL TABLE {ftsName} USING fts5({field}, content='{tableName}', content_rowid='rowid');
+                    CREATE TRIGGER {ftsName}_insert AFTER INSERT ON {tableName} BEGIN
+                        INSERT INTO {ftsName} (rowid, {field}) VALUES (new.rowid, new.{field});
+                    END;
+                    CREATE TRIGGER {ftsName}_delete AFTER DELETE ON {tableName} BEGIN
+                        INSERT INTO {ftsName} ({ftsName}, rowid, {field}) VALUES ('delete', old.rowid, old.{field});
+                    END;
+                    CREATE TRIGGER {ftsName}_update AFTER UPDATE OF {field} ON {tableName} BEGIN
+                        INSERT INTO {ftsName} ({ftsName}, rowid, {field}) VALUES ('delete', old.rowid, old.{field});
+                        INSERT INTO {ftsName} (rowid, {field}) VALUES (new.rowid, new.{field});
+                    END;
+                    INSERT INTO {ftsName} ({ftsName}) VALUES ('rebuild');
+                """)
+                self.fullTextIndexed.add(tableName)
+                self.maintainedText.add(tableName)
+        self.connection.commit()
+
+    def dropIndexes(self, tableName:str):
+        # Explicit indexes and triggers on the table (automatic ones have no SQL), then its FTS5 table
+        for kind, name in self.connection.execute("SELECT type, name FROM sqlite_master WHERE type IN ('index', 'trigger') AND tbl_name = ? AND sql IS NOT NULL",
+                                                  [tableName]).fetchall():
+            self.cursor.execute(f"DROP {kind.upper()} IF EXISTS {name}")
+        if tableName in fullTextIndexes:
+            self.cursor.execute(f"DROP TABLE IF EXISTS {self.ftsName(tableName, fullTextIndexes[tableName])}")
+        self.connection.commit()
+        self.fullTextIndexed.discard(tableName)
+        self.maintainedText.discard(tableName)
+
+    def describeSchema(self, tableName:str):
+        indexes = [{"name": name, "fields": [column for _, _, column in self.connection.execute(f"PRAGMA index_info({name})")], "unique": bool(unique), "type": "btree"}
+                   for _, name, unique, _, _ in self.connection.execute(f"PRAGMA index_list({tableName})").fetchall()]
+        if tableName in self.maintainedText:
+            field = fullTextIndexes[tableName]
+            indexes.append({"name": self.ftsName(tableName, field), "fields": [field], "unique": False, "type": "fts5"})
+        return indexes
+
+    def query(self, name:str, parameters:dict):
+        match name:
+            case "pointLookup":
+                sql, binds = "SELECT * FROM loans WHERE LoanID = ?", [parameters["loanID"]]
+            case "memberLoans":
+                sql, binds = "SELECT * FROM loans WHERE MemberID = ?", [parameters["memberID"]]
+            case "loanDateRange":
+                sql, binds = "SELECT * FROM loans WHERE LoanDate >= ? AND LoanDate < ?", [sqliteValue(parameters["start"]), sqliteValue(parameters["end"])]
+            case "titleJoin":
+                # LIKE is case-insensitive for ASCII, like the UPPER(...) LIKE UPPER(...) of the Oracle query
+                sql = "SELECT l.*, b.Title FROM loans l JOIN books b ON b.BookID = l.BookID WHERE b.Title LIKE ?"
+                binds = [f"%{parameters['keyword']}%"]
+            case "loansPerMember":
+                sql = "SELECT l.MemberID, m.Name, COUNT(*) AS loans FROM loans l LEFT JOIN members m ON m.MemberID = l.MemberID GROUP BY l.MemberID, m.Name"
+                binds = []
+            case "overdueCount":
+                sql = "SELECT COUNT(*) FROM loans WHERE (ReturnDate IS NULL AND DueDate < ?) OR ReturnDate > DueDate"
+                binds = [sqliteValue(parameters["asOf"])]
+            case "topBooks":
+                sql, binds = "SELECT BookID, COUNT(*) AS loans FROM loans GROUP BY BookID ORDER BY loans DESC LIMIT ?", [parameters["k"]]
+            case "contentSearch":
+                # MATCH needs the FTS5 table; without it the whole word is matched with a full scan
+                if "UserPostComment" in self.fullTextIndexed:
+                    ftsName = self.ftsName("UserPostComment", "Content")
+                    sql = f"SELECT c.* FROM {ftsName} JOIN UserPostComment c ON c.rowid = {ftsName}.rowid WHERE {ftsName} MATCH ?"
+                    binds = ['"' + parameters["term"].replace('"', '""') + '"']
+                else:
+                    sql, binds = "SELECT * FROM UserPostComment WHERE Content REGEXP ?", [wordPattern(parameters["term"])]
+            case _:
+                raise ValueError(f"Unknown query {name}")
+
+        self.request(self.cursor.execute, sql, binds)
+        return self.request(self.cursor.fetchall)
+
+
+def regexpMatch(pattern, value):
+    return value is not None and re.search(pattern, value) is not None
+
+def words(text):
+    # Same word boundaries as wordPattern() and the FTS5 unicode61 tokenizer
+    return set(re.findall(r"\w+", (text or "").lower()))
+
+
+class MemoryGraph:
+    # Nodes per label, unique on the label's key like the Neo4j uniqueness constraint, with optional property
+    # indexes (value -> keys) and word indexes (word -> keys). One lock serialises every read and write.
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.nodes = {}
+        self.indexes = {}
+        self.sortedValues = {}
+        self.textIndexes = {}
+
+    def labelNodes(self, label:str):
+        return self.nodes.setdefault(label, {})
+
+    def fieldValue(self, node:dict, field):
+        # A tuple of fields is a compound index, keyed by the tuple of values (None if any is missing)
+        if isinstance(field, tuple):
+            values = tuple(node.get(name) for name in field)
+            return None if None in values else values
+        return node.get(field)
+
+    def indexNode(self, label:str, key, node:dict):
+        for (indexLabel, field), index in self.indexes.items():
+            value = self.fieldValue(node, field)
+            if indexLabel == label and value is not None:
+                index.setdefault(value, set()).add(key)
+                self.sortedValues.pop((label, field), None)
+        for (indexLabel, field), index in self.textIndexes.items():
+            if indexLabel == label:
+                for word in words(node.get(field)):
+                    index.setdefault(word, set()).add(key)
+
+    def unindexNode(self, label:str, key, node:dict):
+        for (indexLabel, field), index in self.indexes.items():
+            value = self.fieldValue(node, field)
+            if indexLabel == label and value in index:
+                index[value].discard(key)
+        for (indexLabel, field), index in self.textIndexes.items():
+            if indexLabel == label:
+                for word in words(node.get(field)):
+                    index.get(word, set()).discard(key)
+
+    def create(self, label:str, keyField:str, rows:list[dict], merge:bool=False):
+        with self.lock:
+            nodes = self.labelNodes(label)
+            for row in rows:
+                key = row[keyField]
+                if key in nodes:
+                    if not merge:
+                        raise ValueError(f"Node ({label} {{{keyField}: {key}}}) already exists")
+                    self.unindexNode(label, key, nodes[key])
+                nodes[key] = dict(row)
+                self.indexNode(label, key, nodes[key])
+
+    def update(self, label:str, keys, changes:dict):
+        with self.lock:
+            nodes = self.labelNodes(label)
+            for key in list(nodes) if keys is None else [key for key in keys if key in nodes]:
+                self.unindexNode(label, key, nodes[key])
+                nodes[key].update(changes)
+                self.indexNode(label, key, nodes[key])
+
+    def delete(self, label:str, limit:int):
+        with self.lock:
+            nodes = self.labelNodes(label)
+            keys = list(nodes)[:limit]
+            for key in keys:
+                self.unindexNode(label, key, nodes.pop(key))
+            return len(keys)
+
+    def get(self, label:str, keys):
+        # Copies, as a driver would hand back freshly decoded records
+        with self.lock:
+            nodes = self.labelNodes(label)
+            return [dict(nodes[key]) for key in keys if key in nodes]
+
+    def scan(self, label:str, predicate=None):
+        with self.lock:
+            return [dict(node) for node in self.labelNodes(label).values() if predicate is None or predicate(node)]
+
+    def find(self, label:str, field:str, value):
+        # Equality through the property index when there is one, a label scan otherwise
+        with self.lock:
+            if (label, field) in self.indexes:
+                return self.get(label, self.indexes[(label, field)].get(value, ()))
+            return self.scan(label, lambda node: node.get(field) == value)
+
+    def range(self, label:str, field:str, start, end):
+        with self.lock:
+            if (label, field) not in self.indexes:
+                return self.scan(label, lambda node: node.get(field) is not None and start <= node[field] < end)
+            index = self.indexes[(label, field)]
+            if (label, field) not in self.sortedValues:
+                self.sortedValues[(label, field)] = sorted(index)
+            values = self.sortedValues[(label, field)]
+            keys = []
+            for value in values[bisect_left(values, start):bisect_left(values, end)]:
+                keys.extend(index[value])
+            return self.get(label, keys)
+
+    def search(self, label:str, field:str, word:str):
+        with self.lock:
+            if (label, field) in self.textIndexes:
+                return self.get(label, self.textIndexes[(label, field)].get(word.lower(), ()))
+            return self.scan(label, lambda node: word.lower() in words(node.get(field)))
+
+    def createIndex(self, label:str, field:str, text:bool=False):
+        with self.lock:
+            indexes = self.textIndexes if text else self.indexes
+            indexes[(label, field)] = {}
+            for key, node in self.labelNodes(label).items():
+                if text:
+                    for word in words(node.get(field)):
+                        indexes[(label, field)].setdefault(word, set()).add(key)
+                elif self.fieldValue(node, field) is not None:
+                    indexes[(label, field)].setdefault(self.fieldValue(node, field), set()).add(key)
+
+    def dropIndex(self, label:str, field:str):
+        with self.lock:
+            self.indexes.pop((label, field), None)
+            self.sortedValues.pop((label, field), None)
+            self.textIndexes.pop((label, field), None)
+
+    def labelIndexes(self, label:str):
+        with self.lock:
+            return [(field, False) for indexLabel, field in self.indexes if indexLabel == label] + \
+                   [(field, True) for indexLabel, field in self.textIndexes if indexLabel == label]
+
+
+class MemoryGraphDB(DBMSAdapter):
+    # Stand-in for Neo4jDB: every table is a node label and every row a node, with the same write modes
+    # deciding how many rows go into one request (perRow, unwind batches, merge batches).
+    writeModes = ["perRow", "unwind", "merge"]
+
+    def __init__(self, dbName:str, sdDirectory:str, writeMode:str="unwind", batchSize:int=1000) -> None:
+        self.name = "MemoryGraph"
+        self.variant = writeMode
+        self.dbName = dbName
+        self.saveDataDirectory = sdDirectory
+
+        if writeMode not in self.writeModes:
+            raise ValueError(f"Unknown write mode {writeMode}, expected one of {self.writeModes}")
+        self.writeMode = writeMode
+        self.batchSize = batchSize
+
+        with storeLock:
+            self.graph = graphs.setdefault(dbName, MemoryGraph())
+
+    def closeConn(self):
+        pass
+
+    def reset(self, tableName:str):
+        self.bulkDelete(tableName)
+
+    def bulkInsert(self, tableName:str, rows:list[dict]):
+        keyField = tableKeys[tableName]
+        batchSize = 1 if self.writeMode == "perRow" else self.batchSize
+        for i in range(0, len(rows), batchSize):
+            self.request(self.graph.create, tableName, keyField, rows[i:i + batchSize], self.writeMode == "merge")
+
+    def bulkUpdate(self, tableName:str, changes:dict):
+        self.request(self.graph.update, tableName, None, changes)
+
+    def bulkDelete(self, tableName:str):
+        while self.request(self.graph.delete, tableName, self.batchSize):
+            pass
+
+    def updateRecord(self, tableName:str, keyField:str, recordID:int, changes:dict):
+        self.request(self.graph.update, tableName, [recordID], changes)
+
+    def rangeRead(self, tableName:str, keyField:str, startID:int, endID:int):
+        # Keys are unique integers, so a key range is a run of lookups in the constraint's index
+        return self.request(self.graph.get, tableName, range(startID, endID + 1))
+
+    def createQueryIndexes(self, tableName:str):
+        for field in queryIndexes.get(tableName, []):
+            self.graph.createIndex(tableName, field)
+        if tableName in fullTextIndexes:
+            self.graph.createIndex(tableName, fullTextIndexes[tableName], text=True)
+
+    def dropQueryIndexes(self, tableName:str):
+        for field in queryIndexes.get(tableName, []) + ([fullTextIndexes[tableName]] if tableName in fullTextIndexes else []):
+            self.graph.dropIndex(tableName, field)
+
+    def createIndex(self, tableName:str, kind:str, fields:list[str]):
+        # Nodes are unique on the label's key by construction, so the primary key needs no index
+        if kind != "primary":
+            self.graph.createIndex(tableName, fields[0] if len(fields) == 1 else tuple(fields), text=kind == "text")
+
+    def dropIndexes(self, tableName:str):
+        for field, _ in self.graph.labelIndexes(tableName):
+            self.graph.dropIndex(tableName, field)
+
+    def describeSchema(self, tableName:str):
+        keyField = tableKeys[tableName]
+        return [{"name": f"{tableName}.{keyField}", "fields": [keyField], "unique": True, "type": "key"}] + \
+               [{"name": f"{tableName}.{'_'.join(field) if isinstance(field, tuple) else field}", "fields": list(field) if isinstance(field, tuple) else [field],
+                 "unique": False, "type": "text" if text else "property"} for field, text in self.graph.labelIndexes(tableName)]
+
+    def query(self, name:str, parameters:dict):
+        graph = self.graph
+        match name:
+            case "pointLookup":
+                return self.request(graph.get, "loans", [parameters["loanID"]])
+            case "memberLoans":
+                return self.request(graph.find, "loans", "MemberID", parameters["memberID"])
+            case "loanDateRange":
+                return self.request(graph.range, "loans", "LoanDate", parameters["start"], parameters["end"])
+            case "titleJoin":
+                def titleJoin():
+                    keyword = parameters["keyword"].lower()
+                    books = graph.scan("books", lambda book: keyword in (book.get("Title") or "").lower())
+                    return [{**loan, "Title": book["Title"]} for book in books for loan in graph.find("loans", "BookID", book["BookID"])]
+                return self.request(titleJoin)
+            case "loansPerMember":
+                def loansPerMember():
+                    counts = {}
+                    for loan in graph.scan("loans"):
+                        counts[loan["MemberID"]] = counts.get(loan["MemberID"], 0) + 1
+                    names = {member["MemberID"]: member.get("Name") for member in graph.get("members", counts)}
+                    return [{"MemberID": memberID, "Name": names.get(memberID), "loans": count} for memberID, count in counts.items()]
+                return self.request(loansPerMember)
+            case "overdueCount":
+                asOf = parameters["asOf"]
+                overdue = lambda loan: loan["DueDate"] is not None and (loan["DueDate"] < asOf if loan["ReturnDate"] is None else loan["ReturnDate"] > loan["DueDate"])
+                return self.request(lambda: len(graph.scan("loans", overdue)))
+            case "topBooks":
+                def topBooks():
+                    counts = {}
+                    for loan in graph.scan("loans"):
+                        counts[loan["BookID"]] = counts.get(loan["BookID"], 0) + 1
+                    return sorted(counts.items(), key=lambda item: item[1], reverse=True)[:parameters["k"]]
+                return self.request(topBooks)
+            case "contentSearch":
+                return self.request(graph.search, "UserPostComment", "Content", parameters["term"])
+        raise ValueError(f"Unknown query {name}")
+
+
+class NullDB(DBMSAdapter):
+    # No engine at all: every primitive is one no-op request, so a workload run against it costs exactly what
+    # the runner and the instrument cost on the same code path. Its times are the baseline Report.py subtracts
+    # (see Calibration.py).
+    def __init__(self, sdDirectory:str) -> None:
+        self.name = "Null"
+        self.variant = ""
+        self.saveDataDirectory = sdDirectory
+
+    def noop(self, *args):
+        return []
+
+    def closeConn(self):
+        pass
+
+    def reset(self, tableName:str):
+        pass
+
+    def createIndex(self, tableName:str, kind:str, fields:list[str]):
+        pass
+
+    def bulkInsert(self, tableName:str, rows):
+        self.request(self.noop, rows)
+
+    def bulkUpdate(self, tableName:str, changes:dict):
+        self.request(self.noop, changes)
+
+    def bulkDelete(self, tableName:str):
+        self.request(self.noop)
+
+    def updateRecord(self, tableName:str, keyField:str, recordID:int, changes:dict):
+        self.request(self.noop, recordID, changes)
+
+    def rangeRead(self, tableName:str, keyField:str, startID:int, endID:int):
+        return self.request(self.noop, startID, endID)
+
+    def query(self, name:str, parameters:dict):
+        return self.request(self.noop, parameters)
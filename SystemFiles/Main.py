@@ -1,9 +1,13 @@
-import json, time
 from dotenv import load_dotenv
-from os import listdir, getenv
-from DBMS import *
-import pandas as pd
-import csv
+from os import getenv, path
+from functools import partial
+from Engines import engineNames, engineFactory, engineVariants
+from Workload import compareVariants
+from LoadGenerator import LoadGenerator
+from Datasets import Dataset
+from PayloadCache import PayloadCache
+from Calibration import calibrate
+import ResultStore
 
 if __name__ == "__main__":
     databaseName = "SocialMedia"
@@ -12,58 +16,141 @@ if __name__ == "__main__":
     dataDirectory = getenv("dataDirectory")
     saveDataDirectory = getenv("saveDataDirectory")
 
+    # Streaming CSV ingestion: records per batch and reader backend (pandas | pyarrow | csv)
+    batchSize = int(getenv("batchSize", 10000))
+    csvReader = getenv("csvReader", "pandas")
+    # With the pyarrow/parquet readers, keep batches as Arrow record batches all the way to the adapters
+    columnar = getenv("columnarBatches", "false").lower() == "true"
+
+    # Untimed warmup passes and timed repetitions per data size
+    runnerOptions = {
+        "warmup": int(getenv("warmupRuns", 1)),
+        "repetitions": int(getenv("repetitions", 5)),
+        "cvThreshold": float(getenv("cvThreshold", 0.1)),
+        # Seconds between client resource samples during timed phases; unset disables telemetry
+        "telemetryInterval": float(getenv("telemetryInterval")) if getenv("telemetryInterval") else None,
+        # cprofile | pyinstrument to profile every timed phase; unset disables profiling
+        "profiler": getenv("profiler") or None,
+        # none | primaryKey | secondary | compound | text (Schema.py) replaces each engine's own indexes; unset keeps them
+        "schema": getenv("schemaVariant") or None
+    }
+    ResultStore.runConfig.update({"entryPoint": "Main", "batchSize": batchSize, "csvReader": csvReader, "columnar": columnar, **runnerOptions})
+
+    # Prepared batches of streamed datasets kept across iterations and repetitions (in memory, and on disk if a directory is set)
+    if getenv("payloadCacheMB") or getenv("payloadCacheDirectory"):
+        runnerOptions["payloadCache"] = PayloadCache(int(getenv("payloadCacheMB", 2048)) << 20, getenv("payloadCacheDirectory"))
+        ResultStore.runConfig.update({"payloadCacheMB": getenv("payloadCacheMB", 2048), "payloadCacheDirectory": getenv("payloadCacheDirectory")})
+
+    # poolSize: connections per engine pool, reused by every menu pass instead of reconnecting (engineFactory reads it)
+    ResultStore.runConfig["poolSize"] = getenv("poolSize")
+
+    # preload=true fills loans through the engine's bulk load path (BulkLoad.py) before the read-only options 2 and 4
+    preload = getenv("preload", "false").lower() == "true"
+    ResultStore.runConfig["preload"] = preload
+
     run = True
+    calibrated = False
     while run:
         data = None
         DBMS_System = None
-        print("DBMS Options:\n1. MongoDB\n2. Oracle\n3. Neo4j\n4. Redis")
+        print("DBMS Options:\n1. MongoDB\n2. Oracle\n3. Neo4j\n4. Redis\n"
+              "Local stand-ins (no server needed):\n5. mongomock\n6. SQLite\n7. In-memory graph\n8. fakeredis\n9. Null (harness overhead baseline)")
         option = int(input("Selection: "))
 
-        # Initialization of DBMS
-        match option:
-            case 1:
-                DBMS_System = MongoDB(getenv("mDBConnectionURL"), databaseName, saveDataDirectory, dataDirectory)
-            case 2:
-                DBMS_System= Oracle(getenv("oracleDns"), databaseName, saveDataDirectory, dataDirectory, getenv("oracleUser"), getenv("oraclePW"), getenv("oracleTableSchema"))
-            case 3:
-                DBMS_System= RedisDB(getenv("rdConnectionURL"), saveDataDirectory)
-            case 3:
-                DBMS_System = Neo4jDB(
-                    getenv("NEO4J_URI"),
-                    getenv("NEO4J_USERNAME"),
-                    getenv("NEO4J_PASSWORD"),
-                    getenv("NEO4J_DB_NAME"),
-                    saveDataDirectory
-                )
-            
-        print("CRUD Operations:\n1. Test Run Library\n2. Retrieve Library\n3. Test Run Social Media")
+        # Initialization of DBMS. Factories are kept so the load generator can open one connection per worker
+        engine = engineNames[option - 1]
+        adapterFactory = engineFactory(engine, databaseName, saveDataDirectory, dataDirectory)
+
+        # Engine variants to compare side by side, as keyword arguments for the factory.
+        # mongoVariants / oracleVariants: comma separated subsets of MongoDB.variantPresets / Oracle.variantPresets
+        # neo4jWriteModes: comma separated subset of perRow, unwind, merge
+        # redisModes: comma separated subset of perKey, pipeline, transaction, bulk, lua
+        # mongomockVariants / sqliteVariants: subsets of LocalMongoDB.variantPresets / SQLiteDB.variantPresets;
+        # the in-memory graph and fakeredis take neo4jWriteModes and redisModes
+        variantEnv = {"mongodb": "mongoVariants", "oracle": "oracleVariants", "neo4j": "neo4jWriteModes", "redis": "redisModes",
+                      "mongomock": "mongomockVariants", "sqlite": "sqliteVariants", "memoryGraph": "neo4jWriteModes", "fakeredis": "redisModes"}.get(engine)
+        variantNames = getenv(variantEnv) if variantEnv else None
+        variants = engineVariants(engine, variantNames.split(",") if variantNames else None)
+
+        DBMS_System = adapterFactory(**next(iter(variants.values()), {}))
+
+        # The null engine also records timer and instrument costs once per session
+        if engine == "null" and not calibrated:
+            calibrate(saveDataDirectory)
+            calibrated = True
+
+        print("CRUD Operations:\n1. Test Run Library\n2. Retrieve Library\n3. Test Run Social Media\n4. Concurrent Load Library\n5. Grow Library\n6. Grow Social Media\n7. YCSB Mix Library\n8. Query Suite")
         crudOption = int(input("Selection: "))
 
+        workload = None
         match crudOption:
             case 1:
                 # Test run library option. Meaning in this test run it will help cover INSERT, UPDATE (of 1 day increemnt in ReturnDate for all inserted rows), and DELETE
-                data = pd.read_csv(dataDirectory + '/loans.csv', dtype={'LoanID': int, 'BookID': int, 'MemberID': int}, parse_dates=['LoanDate', 'DueDate', 'ReturnDate'])
-                
-                # Reminder: In format [{'column1Name': value, 'column2Name':value, ...}, {}, ...]
-                # The Dates are in TimeStamp format, not STR or VARCHAR. Change it for DBMS requirement should it be necessary accordingly
-                data_dict = data.to_dict(orient='records') 
-
-                DBMS_System.libraryRunTest(data_dict, "loans", 5)
+                # The CSV is streamed in typed batches of batchSize records; dates arrive as datetime, missing values as None
+                data = Dataset("loans", dataDirectory, batchSize, csvReader, columnar)
+                workload = lambda system: system.libraryRunTest(data, "loans", 5, **runnerOptions)
 
             case 2:
-                data = pd.read_csv(dataDirectory + '/loans.csv', dtype={'LoanID': int, 'BookID': int, 'MemberID': int}, parse_dates=['LoanDate', 'DueDate', 'ReturnDate'])
-                data_dict = data.to_dict(orient='records') 
-
-                DBMS_System.libraryRetrieveTest("loans", len(data_dict), 5)       
+                data = Dataset("loans", dataDirectory, batchSize, csvReader, columnar)
+                # Loaded once before the workload; every variant then reads the same table
+                if preload:
+                    DBMS_System.preload(data, "loans", **runnerOptions)
+                workload = lambda system: system.libraryRetrieveTest("loans", len(data), 5, **runnerOptions)
 
             case 3:
-                data = pd.read_csv(dataDirectory + '/user_post_comments.csv', dtype={'PostCommentID': int, 'UserID': int, 'PostID': int, 'Content': str})
-                data_dict = data.to_dict(orient='records') 
+                data = Dataset("UserPostComment", dataDirectory, batchSize, csvReader, columnar)
+                workload = lambda system: system.socialMediaRunTest(data, "UserPostComment", 5, **runnerOptions)
+
+            case 4:
+                # Point reads against an already populated loans table at increasing client counts.
+                # loadExecutor: thread | process | asyncio; loadTargetRate (total req/s) switches to open loop
+                data = Dataset("loans", dataDirectory, batchSize, csvReader, columnar)
+                targetRate = getenv("loadTargetRate")
+                if preload:
+                    DBMS_System.preload(data, "loans", **runnerOptions)
+
+                LoadGenerator(partial(adapterFactory, **next(iter(variants.values()), {})), "loans", len(data),
+                    operation=getenv("loadOperation", "pointRead"),
+                    executor=getenv("loadExecutor", "thread"),
+                    targetRate=float(targetRate) if targetRate else None,
+                    duration=float(getenv("loadDuration", 10))
+                ).run([int(level) for level in getenv("concurrencyLevels", "1,2,4,8,16").split(",")])
+
+            case 5:
+                # Incremental ingest: each step appends only the next slice to the growing table
+                data = Dataset("loans", dataDirectory, batchSize, csvReader, columnar)
+                workload = lambda system: system.growTest(data, "loans", 5, **runnerOptions)
+
+            case 6:
+                data = Dataset("UserPostComment", dataDirectory, batchSize, csvReader, columnar)
+                workload = lambda system: system.growTest(data, "UserPostComment", 5, **runnerOptions)
+
+            case 7:
+                # YCSB-style mixed traffic: ycsbWorkload A-F, ycsbDistribution uniform | zipfian | latest
+                data = Dataset("loans", dataDirectory, batchSize, csvReader, columnar)
+                ycsbOptions = {"distribution": getenv("ycsbDistribution"), "operationCount": int(getenv("ycsbOperationCount", 10000))}
+                workload = lambda system: system.ycsbTest(data, "loans", getenv("ycsbWorkload", "A"), **ycsbOptions, **runnerOptions)
+
+            case 8:
+                # Read queries over loans (with members and books for the joins) and UserPostComment, run
+                # without and then with secondary / full-text indexes (only the schema variant's when one is set).
+                # Tables whose file is missing are skipped
+                data = {name: Dataset(name, dataDirectory, batchSize, csvReader, columnar) for name in ["loans", "books", "members", "UserPostComment"]}
+                data = {name: dataset for name, dataset in data.items() if path.exists(dataset.filePath)}
+                modes = [False] if runnerOptions["schema"] else [False, True]
+                workload = lambda system: [system.querySuiteTest(data, 5, indexed, **runnerOptions) for indexed in modes]
 
-                DBMS_System.socialMediaRunTest(data_dict, "UserPostComment", 5)
+        if workload is not None:
+            if len(variants) > 1:
+                DBMS_System.closeConn()
+                DBMS_System = None
+                compareVariants(adapterFactory, variants, workload)
+            else:
+                workload(DBMS_System)
 
         print("Process finished. Closing DBMS Connection.\n")
-        DBMS_System.closeConn()
+        if DBMS_System is not None:
+            DBMS_System.closeConn()
 
         if not input("Continue Testing? (Y/N)\n").strip().capitalize() == "Y":
             run = False
\ No newline at end of file
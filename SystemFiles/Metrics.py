@@ -0,0 +1,199 @@
+import math, time, random, statistics
+
+class LatencyHistogram:
+    # HDR-style log-bucketed histogram over integer nanoseconds. Values below 2**subBucketBits are
+    # stored exactly; above that every power of two is split into 2**(subBucketBits - 1) buckets,
+    # which bounds the relative error of any reported value to 2**-(subBucketBits - 1).
+    def __init__(self, subBucketBits:int=8) -> None:
+        self.subBucketBits = subBucketBits
+        self.subBucketCount = 1 << subBucketBits
+        self.subBucketHalf = self.subBucketCount >> 1
+        self.counts = {}
+        self.totalCount = 0
+        self.totalNs = 0
+        self.minNs = None
+        self.maxNs = 0
+
+    def bucketIndex(self, valueNs:int):
+        if valueNs < self.subBucketCount:
+            return valueNs
+        shift = valueNs.bit_length() - self.subBucketBits
+        top = valueNs >> shift
+        return self.subBucketCount + (shift - 1) * self.subBucketHalf + (top - self.subBucketHalf)
+
+    def bucketValue(self, index:int):
+        # Highest value that maps to the bucket, so percentiles never under-report
+        if index < self.subBucketCount:
+            return index
+        offset = index - self.subBucketCount
+        shift = offset // self.subBucketHalf + 1
+        top = offset % self.subBucketHalf + self.subBucketHalf
+        return ((top + 1) << shift) - 1
+
+    def record(self, valueNs:int, count:int=1):
+        valueNs = max(int(valueNs), 0)
+        index = self.bucketIndex(valueNs)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.totalCount += count
+        self.totalNs += valueNs * count
+        self.minNs = valueNs if self.minNs is None else min(self.minNs, valueNs)
+        self.maxNs = max(self.maxNs, valueNs)
+
+    def merge(self, other:"LatencyHistogram"):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.totalCount += other.totalCount
+        self.totalNs += other.totalNs
+        if other.minNs is not None:
+            self.minNs = other.minNs if self.minNs is None else min(self.minNs, other.minNs)
+        self.maxNs = max(self.maxNs, other.maxNs)
+
+    def percentile(self, p:float):
+        if self.totalCount == 0:
+            return 0
+        target = max(1, -(-self.totalCount * p // 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self.bucketValue(index), self.maxNs)
+        return self.maxNs
+
+    def summary(self, elapsedNs:int=None, ops:int=None):
+        # Latencies in milliseconds; throughput defaults to recorded operations over recorded time
+        elapsedNs = self.totalNs if elapsedNs is None else elapsedNs
+        ops = self.totalCount if ops is None else ops
+        return {
+            "count": self.totalCount,
+            "p50": self.percentile(50) / 1e6,
+            "p90": self.percentile(90) / 1e6,
+            "p99": self.percentile(99) / 1e6,
+            "p999": self.percentile(99.9) / 1e6,
+            "max": self.maxNs / 1e6,
+            "mean": (self.totalNs / self.totalCount / 1e6) if self.totalCount else 0,
+            "opsPerSec": (ops / (elapsedNs / 1e9)) if elapsedNs else 0,
+        }
+
+    def toDict(self):
+        return {
+            "subBucketBits": self.subBucketBits,
+            "unit": "ns",
+            "buckets": {str(self.bucketValue(index)): count for index, count in sorted(self.counts.items())},
+        }
+
+
+class Instrument:
+    # Collects a batch histogram (one sample per timed bulk call) and a request histogram
+    # (one sample per driver round trip made inside it) for each phase of a workload.
+    def __init__(self) -> None:
+        self.phase = None
+        self.batches = {}
+        self.requests = {}
+        self.ops = {}
+        self.elapsedNs = {}
+
+    def histogram(self, store:dict, phase:str):
+        if phase not in store:
+            store[phase] = LatencyHistogram()
+        return store[phase]
+
+    def measure(self, phase:str, ops:int, func, *args):
+        # Wall-clock start for aligning with other data, perf_counter_ns for the duration
+        self.phase = phase
+        startTime = time.time()
+        startNs = time.perf_counter_ns()
+        func(*args)
+        elapsedNs = time.perf_counter_ns() - startNs
+        self.phase = None
+
+        self.histogram(self.batches, phase).record(elapsedNs)
+        self.ops[phase] = self.ops.get(phase, 0) + ops
+        self.elapsedNs[phase] = self.elapsedNs.get(phase, 0) + elapsedNs
+        return startTime, startTime + elapsedNs / 1e9, elapsedNs
+
+    def request(self, func, *args, **kwargs):
+        if self.phase is None:
+            return func(*args, **kwargs)
+        startNs = time.perf_counter_ns()
+        result = func(*args, **kwargs)
+        self.histogram(self.requests, self.phase).record(time.perf_counter_ns() - startNs)
+        return result
+
+    def summary(self):
+        return {phase: {
+            "batch": self.batches[phase].summary(self.elapsedNs[phase], self.ops[phase]),
+            "request": self.histogram(self.requests, phase).summary(),
+        } for phase in self.batches}
+
+    def histograms(self):
+        return {phase: {
+            "batch": self.batches[phase].toDict(),
+            "request": self.histogram(self.requests, phase).toDict(),
+        } for phase in self.batches}
+
+
+def bootstrapInterval(samples:list[float], confidence:float=0.95, resamples:int=1000, seed:int=0):
+    # Percentile bootstrap of the mean; seeded so re-running a report gives the same interval
+    if len(samples) < 2:
+        return (samples[0], samples[0]) if samples else (0, 0)
+    rng = random.Random(seed)
+    means = sorted(statistics.fmean(rng.choices(samples, k=len(samples))) for _ in range(resamples))
+    lowIndex = int((1 - confidence) / 2 * resamples)
+    highIndex = min(resamples - 1, int((1 + confidence) / 2 * resamples))
+    return means[lowIndex], means[highIndex]
+
+def describe(samples:list[float], confidence:float=0.95, cvThreshold:float=0.1):
+    mean = statistics.fmean(samples) if samples else 0
+    stddev = statistics.stdev(samples) if len(samples) > 1 else 0
+    cv = (stddev / mean) if mean else 0
+    ciLow, ciHigh = bootstrapInterval(samples, confidence)
+    return {
+        "n": len(samples),
+        "mean": mean,
+        "stddev": stddev,
+        "median": statistics.median(samples) if samples else 0,
+        "min": min(samples, default=0),
+        "max": max(samples, default=0),
+        "ciLow": ciLow,
+        "ciHigh": ciHigh,
+        "confidence": confidence,
+        "cv": cv,
+        "noisy": cv > cvThreshold,
+    }
+
+def mannWhitney(baseline:dict, candidate:dict):
+    # Two-sided Mann-Whitney U test on weighted samples ({value: count}, e.g. histogram buckets),
+    # using mid-ranks for ties and the tie-corrected normal approximation. Returns the p-value
+    # and the probability that a candidate sample exceeds a baseline sample (0.5 = no shift).
+    n1, n2 = sum(baseline.values()), sum(candidate.values())
+    if not n1 or not n2:
+        return {"pValue": 1.0, "probCandidateGreater": 0.5}
+    total = n1 + n2
+    rankSum, rank, tieTerm = 0.0, 0, 0
+    for value in sorted(set(baseline) | set(candidate)):
+        ties = baseline.get(value, 0) + candidate.get(value, 0)
+        rankSum += baseline.get(value, 0) * (rank + (ties + 1) / 2)
+        rank += ties
+        tieTerm += ties ** 3 - ties
+    u = rankSum - n1 * (n1 + 1) / 2
+    variance = n1 * n2 / 12 * ((total + 1) - tieTerm / (total * (total - 1))) if total > 1 else 0
+    z = (u - n1 * n2 / 2) / math.sqrt(variance) if variance > 0 else 0
+    return {"pValue": math.erfc(abs(z) / math.sqrt(2)), "probCandidateGreater": 1 - u / (n1 * n2)}
+
+def minimumPValue(n1:int, n2:int):
+    # Smallest p-value mannWhitney can return for n1 and n2 samples (every candidate sample above every baseline one)
+    if not n1 or not n2:
+        return 1.0
+    return math.erfc(math.sqrt(3 * n1 * n2 / (n1 + n2 + 1)) / math.sqrt(2))
+
+def bootstrapChange(baseline:list[float], candidate:list[float], confidence:float=0.95, resamples:int=1000, seed:int=0):
+    # Percentile bootstrap of the relative change in means, candidate vs baseline
+    if not baseline or not candidate or not statistics.fmean(baseline):
+        return 0, 0
+    rng = random.Random(seed)
+    changes = []
+    for _ in range(resamples):
+        baseMean = statistics.fmean(rng.choices(baseline, k=len(baseline)))
+        changes.append(statistics.fmean(rng.choices(candidate, k=len(candidate))) / baseMean - 1 if baseMean else 0)
+    changes.sort()
+    return changes[int((1 - confidence) / 2 * resamples)], changes[min(resamples - 1, int((1 + confidence) / 2 * resamples))]
@@ -0,0 +1,78 @@
+import os, mmap, json, pickle, hashlib
+from os import path, makedirs
+from collections import OrderedDict
+
+# Prepared (driver-ready) insert batches of a streamed Dataset, keyed by (dataset, adapter encoding,
+# batch index, batch length), so each batch is read and encoded once per sweep instead of once per
+# iteration and repetition. Batch i of any prefix holds the same rows, so growing prefixes hit too.
+#   maxBytes   bound of the in-memory LRU, measured as the pickled size of each batch (0 disables it)
+#   directory  also keep every batch as a pickle file there; files are memory-mapped on load and
+#              reused by later processes, as long as the dataset file is unchanged
+
+
+class PayloadCache:
+    def __init__(self, maxBytes:int=2 << 30, directory:str=None) -> None:
+        self.maxBytes = maxBytes
+        self.directory = directory
+        self.entries = OrderedDict()
+        self.sizes = {}
+        self.usedBytes = 0
+        self.hits = 0
+        self.misses = 0
+        if directory:
+            makedirs(directory, exist_ok=True)
+
+    def key(self, dataset, adapter, tableName:str, index:int, length:int):
+        stat = os.stat(dataset.filePath)
+        identity = [dataset.filePath, stat.st_size, stat.st_mtime_ns, dataset.reader, dataset.columnar, dataset.batchSize,
+                    adapter.payloadEncoding(), tableName, index, length]
+        return hashlib.sha1(json.dumps(identity).encode()).hexdigest()
+
+    def filePath(self, key:str):
+        return path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key:str):
+        # Returns (payload, adapter state) or None
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+
+        if self.directory and path.exists(self.filePath(key)):
+            with open(self.filePath(key), "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                entry = pickle.loads(mapped)
+            self.remember(key, entry, path.getsize(self.filePath(key)))
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        return None
+
+    def put(self, key:str, payload, state):
+        entry = (payload, state)
+        try:
+            data = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            print(f"Payload not cacheable: {e}")
+            return
+
+        if self.directory:
+            # Written under a temporary name first so a concurrent or interrupted run never reads a partial file
+            temporaryPath = f"{self.filePath(key)}.{os.getpid()}.tmp"
+            with open(temporaryPath, "wb") as f:
+                f.write(data)
+            os.replace(temporaryPath, self.filePath(key))
+        self.remember(key, entry, len(data))
+
+    def remember(self, key:str, entry:tuple, size:int):
+        if size > self.maxBytes:
+            return
+        self.entries[key] = entry
+        self.sizes[key] = size
+        self.usedBytes += size
+        while self.usedBytes > self.maxBytes:
+            evicted, _ = self.entries.popitem(last=False)
+            self.usedBytes -= self.sizes.pop(evicted)
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "memoryBytes": self.usedBytes, "entries": len(self.entries)}
@@ -0,0 +1,98 @@
+import pstats, cProfile
+from os import path, makedirs
+from contextlib import contextmanager
+
+# Optional per-phase profiling, to see how much of a timed phase is Python-side work that differs
+# per adapter rather than time spent in the engine. One profile is kept per phase name and
+# accumulates over runs and repetitions.
+#   cprofile     exact call counts; self time is split into the categories below and a .prof
+#                per phase is saved (open with snakeviz, tuna or flameprof)
+#   pyinstrument statistical sampling with lower overhead; an HTML flamegraph and a speedscope
+#                profile are saved per phase
+# Profiling slows the client down, so the times of a profiled run are not comparable with unprofiled ones.
+
+# Self time is attributed by where a function lives. Drivers implemented in C/Cython (oracledb thin
+# mode, hiredis) do their socket I/O below the profiler, so their server wait is counted as driver time.
+waitModules = ("_socket.", "_ssl.", "select.")
+waitFunctions = ("recv", "recv_into", "send", "sendall", "read", "write", "select", "poll")
+categoryModules = {
+    "serialization": ("bson", "json", "_json", "pickle", "_pickle", "msgpack", "neo4j/_codec"),
+    "driver": ("pymongo", "motor", "oracledb", "redis", "hiredis", "neo4j", "ssl", "_ssl", "socket", "_socket", "selectors", "select"),
+    "dataset": ("pandas", "pyarrow", "numpy", "csv", "_csv", "Datasets"),
+}
+
+
+def category(filename:str, function:str):
+    if filename == "~":
+        # Built-ins look like "<method 'recv_into' of '_socket.socket' objects>" or "<built-in method bson._cbson._dict_to_bson>"
+        words = function.strip("<>").replace("'", "").split()
+        filename = f"{words[-2]}.{words[1]}" if words[0] == "method" and len(words) > 3 else words[-1]
+        if filename.startswith(waitModules) and filename.split(".")[-1] in waitFunctions:
+            return "serverWait"
+    filename = filename.replace("\\", "/")
+    for name, modules in categoryModules.items():
+        if any(f"/{module}/" in filename or filename.endswith(f"/{module}.py") or filename.startswith(f"{module}.") for module in modules):
+            return name
+    return "clientPrep"
+
+
+class PhaseProfiler:
+    def __init__(self, mode:str="cprofile") -> None:
+        if mode not in ("cprofile", "pyinstrument"):
+            raise ValueError(f"Unknown profiler {mode}, expected cprofile or pyinstrument")
+        self.mode = mode
+        self.profiles = {}
+
+    def profiler(self, phase:str):
+        if phase not in self.profiles:
+            if self.mode == "pyinstrument":
+                from pyinstrument import Profiler
+                self.profiles[phase] = Profiler(interval=0.0005)
+            else:
+                self.profiles[phase] = cProfile.Profile()
+        return self.profiles[phase]
+
+    @contextmanager
+    def phase(self, name:str):
+        profiler = self.profiler(name)
+        if self.mode == "pyinstrument":
+            profiler.start()
+        else:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if self.mode == "pyinstrument":
+                profiler.stop()
+            else:
+                profiler.disable()
+
+    def breakdown(self):
+        # Seconds of self time per category and phase (cProfile only)
+        if self.mode != "cprofile":
+            return {}
+        summary = {}
+        for phase, profiler in self.profiles.items():
+            totals = {"clientPrep": 0.0, "serialization": 0.0, "driver": 0.0, "serverWait": 0.0, "dataset": 0.0}
+            for (filename, _, function), (_, _, selfTime, _, _) in pstats.Stats(profiler).stats.items():
+                totals[category(filename, function)] += selfTime
+            summary[phase] = totals
+        return summary
+
+    def save(self, directory:str, prefix:str):
+        makedirs(directory, exist_ok=True)
+        saved = []
+        for phase, profiler in self.profiles.items():
+            base = path.join(directory, f"{prefix}_{phase}")
+            if self.mode == "pyinstrument":
+                from pyinstrument.renderers import SpeedscopeRenderer
+
+                with open(f"{base}.html", "w") as f:
+                    f.write(profiler.output_html())
+                with open(f"{base}.speedscope.json", "w") as f:
+                    f.write(profiler.output(SpeedscopeRenderer()))
+                saved.append(f"{base}.html")
+            else:
+                profiler.dump_stats(f"{base}.prof")
+                saved.append(f"{base}.prof")
+        return saved
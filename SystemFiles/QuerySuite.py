@@ -0,0 +1,142 @@
+import random
+from datetime import datetime, timedelta
+from Workload import WorkloadRunner, postProcess
+from Datasets import Dataset
+
+# Read queries of the suite and the tables each one needs; queries whose tables were not given are skipped.
+#   pointLookup    one loan by LoanID
+#   memberLoans    loans of one member (secondary index on MemberID)
+#   loanDateRange  loans made within a 30 day window (secondary index range scan on LoanDate)
+#   titleJoin      loans of books whose Title contains a keyword (join / $lookup)
+#   loansPerMember loan count per member, with the member's Name (aggregation + join)
+#   overdueCount   loans returned late or still out past DueDate as of a date (aggregation)
+#   topBooks       the k most borrowed books (top-K)
+#   contentSearch  comments whose Content contains a whole word, case-insensitively (full-text index when
+#                  indexed, a word-boundary match otherwise, so both return the same rows)
+suiteQueries = {
+    "pointLookup": ["loans"],
+    "memberLoans": ["loans"],
+    "loanDateRange": ["loans"],
+    "titleJoin": ["loans", "books"],
+    "loansPerMember": ["loans", "members"],
+    "overdueCount": ["loans"],
+    "topBooks": ["loans"],
+    "contentSearch": ["UserPostComment"]
+}
+
+# Tables that grow with each iteration; the others (members, books) are loaded in full every run
+growingTables = ["loans", "UserPostComment"]
+
+
+def plainDatetime(value):
+    # pandas Timestamps and Arrow timestamps become naive datetimes every driver accepts as a parameter
+    return datetime(value.year, value.month, value.day, value.hour, value.minute, value.second) if value is not None else None
+
+
+class QueryRunner(WorkloadRunner):
+    # Loads every table (untimed), optionally builds the secondary and full-text indexes (timed once per run as
+    # indexTime), then times each query `repetitions` times with fresh parameters drawn from the loaded rows.
+    # Growing tables take the same fraction of their dataset at each iteration, so read paths can be compared
+    # as data grows; run once with indexed=False and once with indexed=True to see what the indexes buy.
+    def __init__(self, adapter, iterations:int, topK:int=10, seed:int=0, **runnerOptions) -> None:
+        super().__init__(adapter, iterations, **runnerOptions)
+        self.topK = topK
+        self.rng = random.Random(seed)
+
+    def load(self, datasets:dict, sizes:dict):
+        self.adapter.instrument = None
+        for tableName in datasets:
+            self.adapter.reset(tableName)
+        for tableName, documentData in datasets.items():
+            self.setupSchema(tableName)
+            payload = None if isinstance(documentData, Dataset) else self.prepare(tableName, documentData)
+            for batch in self.insertBatches(tableName, documentData, payload, sizes[tableName]):
+                self.adapter.bulkInsert(tableName, batch)
+        self.adapter.instrument = self.instrument
+
+    def samples(self, datasets:dict):
+        # A batch of rows per table to draw query parameters from, so every parameter hits existing data
+        samples = {}
+        for tableName, documentData in datasets.items():
+            rows = next(documentData.batches(min(len(documentData), 10000))) if isinstance(documentData, Dataset) else documentData[:10000]
+            samples[tableName] = rows if isinstance(rows, list) else rows.to_pylist()
+        return samples
+
+    def parameters(self, samples:dict, sizes:dict):
+        parameters = {"k": self.topK}
+        loans = [row for row in samples.get("loans", []) if row["LoanID"] <= sizes.get("loans", 0)]
+        if loans:
+            loan = self.rng.choice(loans)
+            loanDate = plainDatetime(loan["LoanDate"])
+            parameters.update({"loanID": self.rng.randint(1, sizes["loans"]), "memberID": loan["MemberID"],
+                               "start": loanDate, "end": loanDate + timedelta(days=30), "asOf": loanDate + timedelta(days=60)})
+        if samples.get("books"):
+            words = [word for word in (self.rng.choice(samples["books"])["Title"] or "").split() if len(word) > 3]
+            parameters["keyword"] = self.rng.choice(words) if words else "the"
+        if samples.get("UserPostComment"):
+            # Synthetic Content is sliced from a text pool at any offset, so its first and last tokens may be partial words
+            words = [word.strip(".,;:!?").lower() for word in (self.rng.choice(samples["UserPostComment"])["Content"] or "").split()[1:-1]]
+            words = [word for word in words if len(word) > 3 and word.isalpha()]
+            parameters["term"] = self.rng.choice(words) if words else "lorem"
+        return parameters
+
+    def timedQuery(self, name:str, parameters:dict):
+        rows = []
+
+        def execute():
+            result = self.adapter.query(name, parameters)
+            rows.append(len(result) if isinstance(result, list) else 1)
+
+        _, _, seconds = self.timed(name, 1, execute)
+        return seconds, rows[0]
+
+    @postProcess
+    def run(self, datasets:dict, indexed:bool=False):
+        # Under a schema variant its indexes are the only ones, so the suite adds none of its own
+        indexed = indexed and self.schema is None
+        queries = [name for name, tables in suiteQueries.items() if all(table in datasets for table in tables)]
+        skipped = [name for name in suiteQueries if name not in queries]
+        if skipped:
+            print(f"Skipping {', '.join(skipped)}: needs {sorted({table for name in skipped for table in suiteQueries[name]} - set(datasets))}")
+        samples = self.samples(datasets)
+        dataToStore = []
+        aggregated = []
+
+        for i in range(self.iterations):
+            run = i + 1
+            sizes = {tableName: self.sizes(len(data))[i] if tableName in growingTables else len(data) for tableName, data in datasets.items()}
+            print(f"Run {run}: loading {sizes}")
+            self.load(datasets, sizes)
+
+            indexTime = 0
+            if indexed:
+                for tableName in datasets:
+                    indexTime += self.timed("createIndexes", 1, self.adapter.createQueryIndexes, tableName)[2]
+
+            for _ in range(self.warmup):
+                parameters = self.parameters(samples, sizes)
+                for name in queries:
+                    self.adapter.query(name, parameters)
+
+            entries = []
+            for repetition in range(1, self.repetitions + 1):
+                print(f"Run {run} repetition {repetition}")
+                parameters = self.parameters(samples, sizes)
+                entry = {"run": run, "repetition": repetition, "qSize": sizes.get("loans", sizes.get("UserPostComment")), "tableSizes": sizes}
+                for name in queries:
+                    entry[f"{name}Time"], entry[f"{name}Rows"] = self.timedQuery(name, parameters)
+                entries.append(entry)
+
+            if indexed:
+                self.adapter.instrument = None
+                for tableName in datasets:
+                    self.adapter.dropQueryIndexes(tableName)
+
+            dataToStore.extend(entries)
+            aggregate = self.aggregate(run, entries[0]["qSize"], entries, [f"{name}Time" for name in queries])
+            aggregate["indexTime"] = indexTime
+            aggregated.append(aggregate)
+
+        resultInfo = self.resultInfo("library", f"queries_{'indexed' if indexed else 'noIndex'}", dataToStore, aggregated)
+        resultInfo.update({"queries": queries, "indexed": indexed, "tables": list(datasets)})
+        return resultInfo
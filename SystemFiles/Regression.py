@@ -0,0 +1,173 @@
+import sys, json, argparse, statistics
+from ResultStore import ResultStore
+from Metrics import mannWhitney, minimumPValue, bootstrapChange
+from Report import timeMetrics, stepSizes, rowsTimed
+
+# Compares a candidate run with a baseline run of the same workloads and exits nonzero when any
+# workload regressed, so engine upgrades and config changes can be gated automatically.
+#   throughput  per-repetition rows/sec: Mann-Whitney on the samples plus a bootstrap CI of the change
+#   latency     per-request histograms: Mann-Whitney on the bucketed samples, change in p50 and p99
+# A change is only flagged when it is both statistically significant (p < alpha) and larger than threshold.
+# Comparisons with too few samples for the rank test to ever reach alpha (e.g. repetitions=1) are reported
+# as "insufficient" instead of "unchanged", and the run fails when no comparison had enough.
+#   python Regression.py <saveDataDirectory> [--baseline RUN_ID] [--candidate RUN_ID] [--threshold 0.05] [--alpha 0.05]
+
+
+def bucketPercentile(buckets:dict, p:float):
+    total = sum(buckets.values())
+    target = max(1, -(-total * p // 100))
+    seen = 0
+    for value in sorted(buckets):
+        seen += buckets[value]
+        if seen >= target:
+            return value
+    return 0
+
+
+def classify(change:float, significant:bool, threshold:float, higherIsBetter:bool, testable:bool=True):
+    if not testable:
+        return "insufficient"
+    if not significant or abs(change) <= threshold:
+        return "unchanged"
+    return "improvement" if (change > 0) == higherIsBetter else "regression"
+
+
+class Regression:
+    def __init__(self, baselineStore:ResultStore, baselineRun:str, candidateStore:ResultStore, candidateRun:str,
+                 threshold:float=0.05, alpha:float=0.05, confidence:float=0.95) -> None:
+        self.baseline = (baselineStore, baselineRun)
+        self.candidate = (candidateStore, candidateRun)
+        self.threshold = threshold
+        self.alpha = alpha
+        self.confidence = confidence
+
+    def throughputSamples(self, store:ResultStore, runId:str):
+        # {(dbms, variant, tableName, operation, metric, qSize/concurrency): [rows/sec per repetition]}
+        samples = {}
+        rows = store.latest("metrics", runId)
+        steps = stepSizes(rows)
+        for row in rows:
+            if row["section"] != "result" or not row["value"]:
+                continue
+            if row["metric"] in timeMetrics and row["qSize"]:
+                value, x = rowsTimed(row, steps) / row["value"], row["qSize"]
+            elif row["metric"] == "throughput":
+                value, x = row["value"], row["concurrency"] or row["qSize"]
+            else:
+                continue
+            key = (row["dbms"], row["variant"], row["tableName"], row["operation"], timeMetrics.get(row["metric"], row["metric"]), x)
+            samples.setdefault(key, []).append(value)
+        return samples
+
+    def latencyHistograms(self, store:ResultStore, runId:str):
+        # Per-request histograms only; batch histograms are already covered by the throughput comparison
+        return {(row["dbms"], row["variant"], row["tableName"], row["operation"], row["name"]): {int(value): count for value, count in json.loads(row["buckets"]).items()}
+                for row in store.latest("histograms", runId) if not row["name"].endswith(".batch")}
+
+    def compareThroughput(self):
+        baseline, candidate = self.throughputSamples(*self.baseline), self.throughputSamples(*self.candidate)
+        findings = []
+        for key in sorted(baseline.keys() & candidate.keys(), key=str):
+            before, after = baseline[key], candidate[key]
+            change = statistics.median(after) / statistics.median(before) - 1
+            pValue = mannWhitney({value: before.count(value) for value in before}, {value: after.count(value) for value in after})["pValue"]
+            ciLow, ciHigh = bootstrapChange(before, after, self.confidence)
+            significant = pValue < self.alpha and (ciLow > 0 or ciHigh < 0)
+            dbms, variant, tableName, operation, phase, x = key
+            findings.append({
+                "kind": "throughput", "dbms": dbms, "variant": variant, "tableName": tableName, "operation": operation,
+                "phase": phase, "size": x, "baseline": statistics.median(before), "candidate": statistics.median(after),
+                "change": change, "ciLow": ciLow, "ciHigh": ciHigh, "pValue": pValue, "samples": [len(before), len(after)],
+                "status": classify(change, significant, self.threshold, higherIsBetter=True, testable=minimumPValue(len(before), len(after)) < self.alpha)
+            })
+        return findings
+
+    def compareLatency(self):
+        baseline, candidate = self.latencyHistograms(*self.baseline), self.latencyHistograms(*self.candidate)
+        findings = []
+        for key in sorted(baseline.keys() & candidate.keys(), key=str):
+            before, after = baseline[key], candidate[key]
+            test = mannWhitney(before, after)
+            changes = {p: bucketPercentile(after, p) / bucketPercentile(before, p) - 1 if bucketPercentile(before, p) else 0 for p in (50, 99)}
+            # The larger shift decides, but only in the direction the rank test agrees with
+            worse = test["probCandidateGreater"] > 0.5
+            change = max(changes.values()) if worse else min(changes.values())
+            dbms, variant, tableName, operation, name = key
+            findings.append({
+                "kind": "latency", "dbms": dbms, "variant": variant, "tableName": tableName, "operation": operation,
+                "phase": name, "baselineP50": bucketPercentile(before, 50) / 1e6, "candidateP50": bucketPercentile(after, 50) / 1e6,
+                "baselineP99": bucketPercentile(before, 99) / 1e6, "candidateP99": bucketPercentile(after, 99) / 1e6,
+                "p50Change": changes[50], "p99Change": changes[99], "change": change, "pValue": test["pValue"],
+                "probCandidateSlower": test["probCandidateGreater"], "samples": [sum(before.values()), sum(after.values())],
+                "status": classify(change, test["pValue"] < self.alpha, self.threshold, higherIsBetter=False,
+                                   testable=minimumPValue(sum(before.values()), sum(after.values())) < self.alpha)
+            })
+        return findings
+
+    def run(self):
+        findings = self.compareThroughput() + self.compareLatency()
+        return {
+            "baseline": self.baseline[1], "candidate": self.candidate[1], "threshold": self.threshold, "alpha": self.alpha,
+            "regressions": sum(finding["status"] == "regression" for finding in findings),
+            "improvements": sum(finding["status"] == "improvement" for finding in findings),
+            "insufficient": sum(finding["status"] == "insufficient" for finding in findings),
+            "findings": findings
+        }
+
+
+def printFindings(summary:dict, showAll:bool):
+    print(f"Baseline {summary['baseline']} vs candidate {summary['candidate']} (threshold {summary['threshold']:.0%}, alpha {summary['alpha']})")
+    if summary["insufficient"]:
+        print(f"Warning: {summary['insufficient']} comparisons have too few samples for p < {summary['alpha']} "
+              "(throughput compares repetitions; raise repetitions in both runs)")
+    for finding in summary["findings"]:
+        if finding["status"] in ("unchanged", "insufficient") and not showAll:
+            continue
+        engine = f"{finding['dbms']}[{finding['variant']}]" if finding["variant"] else finding["dbms"]
+        where = f"{engine} {finding['tableName']} {finding['operation']} {finding['phase']}"
+        if finding["kind"] == "throughput":
+            detail = f"size {finding['size']}: {finding['baseline']:,.0f} -> {finding['candidate']:,.0f} rows/sec"
+        else:
+            detail = f"p50 {finding['baselineP50']:.3f} -> {finding['candidateP50']:.3f} ms, p99 {finding['baselineP99']:.3f} -> {finding['candidateP99']:.3f} ms"
+        print(f"{finding['status'].upper():12} {where} {detail} ({finding['change']:+.1%}, p={finding['pValue']:.3g}, n={finding['samples'][0]}/{finding['samples'][1]})")
+    print(f"{summary['regressions']} regressions, {summary['improvements']} improvements, {summary['insufficient']} insufficient, "
+          f"{len(summary['findings'])} comparisons")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Detect performance regressions between two recorded benchmark runs")
+    parser.add_argument("saveDataDirectory", help="directory holding the candidate's results.sqlite")
+    parser.add_argument("--baseline", help="baseline run id (default: the run before the candidate)")
+    parser.add_argument("--candidate", help="candidate run id (default: the latest run)")
+    parser.add_argument("--baseline-directory", help="read the baseline from another results.sqlite directory")
+    parser.add_argument("--threshold", type=float, default=0.05, help="smallest relative change that is flagged")
+    parser.add_argument("--alpha", type=float, default=0.05, help="significance level of the tests")
+    parser.add_argument("--output", help="also write the findings as JSON")
+    parser.add_argument("--all", action="store_true", help="print unchanged comparisons too")
+    args = parser.parse_args()
+
+    candidateStore = ResultStore(args.saveDataDirectory)
+    baselineStore = ResultStore(args.baseline_directory) if args.baseline_directory else candidateStore
+    candidateRuns = [run["runId"] for run in candidateStore.runs()]
+    baselineRuns = [run["runId"] for run in baselineStore.runs()]
+
+    candidateRun = args.candidate or (candidateRuns[-1] if candidateRuns else None)
+    baselineRun = args.baseline or next((runId for runId in reversed(baselineRuns) if runId != candidateRun), None)
+    if candidateRun is None or baselineRun is None:
+        sys.exit("Need a baseline and a candidate run; see Report.py --list-runs")
+
+    summary = Regression(baselineStore, baselineRun, candidateStore, candidateRun, args.threshold, args.alpha).run()
+    printFindings(summary, args.all)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=4)
+
+    candidateStore.close()
+    if baselineStore is not candidateStore:
+        baselineStore.close()
+
+    if not summary["findings"]:
+        sys.exit("No workload was recorded in both runs")
+    if summary["insufficient"] == len(summary["findings"]):
+        sys.exit("No comparison had enough samples to detect a change; rerun both with more repetitions")
+    sys.exit(1 if summary["regressions"] else 0)
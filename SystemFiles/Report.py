@@ -0,0 +1,267 @@
+import csv, argparse, statistics
+from os import path, makedirs
+from ResultStore import ResultStore
+
+# Comparison tables and scaling plots across engines and runs, read from the result store.
+#   python Report.py <saveDataDirectory> [--runs RUN_ID ...] [--baseline-runs RUN_ID ...] [--output DIR] [--no-plots]
+
+timeMetrics = {"inTime": "insert", "upTime": "update", "delTime": "delete", "q1Time": "q1", "loadTime": "bulk load"}
+
+# The null engine's times are the harness overhead (Calibration.py); throughput is also reported net of them
+baselineEngine = "Null"
+
+def entryKey(row:dict):
+    # The metric rows stored from one result entry (one run and repetition of one recorded workload)
+    return (row["runId"], row["recordedAt"], row["dbms"], row["variant"], row["tableName"], row["operation"], row["run"], row["repetition"])
+
+def stepSizes(rows:list[dict]):
+    return {entryKey(row): row["value"] for row in rows if row["section"] == "result" and row["metric"] == "stepSize"}
+
+def rowsTimed(row:dict, steps:dict):
+    # growTest times only one step's insert, with qSize the table size after it; every other workload times qSize rows
+    return steps.get(entryKey(row), row["qSize"])
+
+
+class Report:
+    def __init__(self, store:ResultStore, runIds:list[str]=None, baselineRunIds:list[str]=None) -> None:
+        self.store = store
+        self.runIds = runIds or [run["runId"] for run in store.runs()]
+        self.baselineRunIds = baselineRunIds or self.runIds
+
+    def select(self, where:str, parameters:tuple=(), runIds:list[str]=None):
+        runIds = runIds or self.runIds
+        placeholders = ", ".join("?" for _ in runIds)
+        return self.store.query(f"SELECT * FROM metrics WHERE runId IN ({placeholders}) AND {where}", tuple(runIds) + parameters)
+
+    def label(self, row:dict):
+        name = f"{row['dbms']}[{row['variant']}]" if row["variant"] else row["dbms"]
+        return f"{name}@{row['runId']}" if len(self.runIds) > 1 else name
+
+    def medians(self, rows:list[dict], xKey:str, valueOf):
+        # {(tableName, operation, series): {label: {x: median over repetitions}}}
+        grouped = {}
+        for row in rows:
+            value = valueOf(row)
+            if value is None or row[xKey] is None:
+                continue
+            series = grouped.setdefault((row["tableName"], row["operation"], row["metric"]), {})
+            series.setdefault(self.label(row), {}).setdefault(row[xKey], []).append(value)
+        return {key: {label: {x: statistics.median(values) for x, values in sorted(points.items())} for label, points in series.items()}
+                for key, series in grouped.items()}
+
+    def timeRows(self, runIds:list[str]=None):
+        return self.select(f"section = 'result' AND metric IN ({', '.join(repr(metric) for metric in timeMetrics)}) AND concurrency IS NULL", runIds=runIds)
+
+    def stepSizes(self):
+        return stepSizes(self.select("section = 'result' AND metric = 'stepSize'"))
+
+    def throughputBySize(self):
+        # Rows per second for each timed phase, from per-repetition results; qSize stays the x-axis
+        steps = self.stepSizes()
+        return self.medians(self.timeRows(), "qSize", lambda row: rowsTimed(row, steps) / row["value"] if row["value"] else None)
+
+    def queriesBySize(self):
+        # Milliseconds per execution of each query-suite query (QuerySuite.py), indexed and unindexed runs apart
+        rows = self.select("section = 'result' AND operation LIKE 'queries_%' AND metric LIKE '%Time'")
+        return self.medians(rows, "qSize", lambda row: row["value"] * 1000)
+
+    def overheadBySize(self):
+        # {(tableName, operation, metric): {qSize: median seconds of the null engine}}
+        grouped = {}
+        for row in self.timeRows(self.baselineRunIds):
+            if row["dbms"] == baselineEngine and row["qSize"] is not None:
+                grouped.setdefault((row["tableName"], row["operation"], row["metric"]), {}).setdefault(row["qSize"], []).append(row["value"])
+        return {key: {x: statistics.median(values) for x, values in points.items()} for key, points in grouped.items()}
+
+    def correctedThroughputBySize(self):
+        # Rows per second once the null engine's time for the same workload and size is taken off; only workloads
+        # with a baseline appear, and a phase no slower than the baseline is left out rather than shown as infinite
+        overhead = self.overheadBySize()
+        steps = self.stepSizes()
+
+        def corrected(row):
+            baseline = overhead.get((row["tableName"], row["operation"], row["metric"]), {}).get(row["qSize"])
+            if baseline is None or row["value"] is None or row["value"] <= baseline:
+                return None
+            return rowsTimed(row, steps) / (row["value"] - baseline)
+
+        rows = [row for row in self.timeRows() if row["dbms"] != baselineEngine]
+        return {key: series for key, series in self.medians(rows, "qSize", corrected).items() if series}
+
+    def connectionAcquire(self):
+        # Median time each engine took to hand an adapter a usable connection, per pool size (0: unpooled)
+        grouped = {}
+        for row in self.select("section = 'connection' AND metric IN ('acquireMs', 'poolSize')"):
+            grouped.setdefault((row["recordedAt"], self.label(row)), {})[row["metric"]] = row["value"]
+        acquired = {}
+        for (_, label), values in grouped.items():
+            acquired.setdefault((label, int(values.get("poolSize", 0))), []).append(values["acquireMs"])
+        return {key: statistics.median(values) for key, values in sorted(acquired.items())}
+
+    def schemaBuilds(self):
+        # Median seconds each engine took to drop and build a schema variant's indexes, per table
+        built = {}
+        for row in self.select("section = 'schema' AND metric LIKE '%.seconds'"):
+            built.setdefault((self.label(row), row["metric"].rsplit(".", 1)[0]), []).append(row["value"])
+        return {key: statistics.median(values) for key, values in sorted(built.items())}
+
+    def calibration(self):
+        # Timer and instrument costs (ns) from the last calibration in the baseline runs
+        rows = self.select("section = 'aggregate' AND dbms = ? AND operation = 'calibration' ORDER BY recordedAt", (baselineEngine,), self.baselineRunIds)
+        return {row["metric"]: row["value"] for row in rows if row["metric"] != "run"}
+
+    def loadByConcurrency(self):
+        rows = self.select("section = 'result' AND concurrency IS NOT NULL AND metric IN ('throughput', 'latency.p50', 'latency.p99', 'latency.p999')")
+        return self.medians(rows, "concurrency", lambda row: row["value"])
+
+    def latencySummary(self):
+        # Per-phase request percentiles; the last recorded result wins when a workload was run more than once
+        rows = self.select("section = 'latency' AND metric LIKE '%.request.p%'")
+        table = {}
+        for row in rows:
+            phase, _, stat = row["metric"].split(".")
+            table.setdefault((row["tableName"], row["operation"]), {}).setdefault(self.label(row), {})[f"{phase} {stat}"] = row["value"]
+        return table
+
+    def markdown(self):
+        lines = [f"# Benchmark report\n\nRuns: {', '.join(self.runIds)}\n"]
+
+        for (tableName, operation, metric), series in self.throughputBySize().items():
+            sizes = sorted({x for points in series.values() for x in points})
+            lines.append(f"## {tableName} {operation}: {timeMetrics[metric]} throughput (rows/sec) by size\n")
+            lines.append("| engine | " + " | ".join(str(size) for size in sizes) + " |")
+            lines.append("|---" * (len(sizes) + 1) + "|")
+            for label, points in sorted(series.items()):
+                lines.append(f"| {label} | " + " | ".join(f"{points[size]:,.0f}" if size in points else "" for size in sizes) + " |")
+            lines.append("")
+
+        for (tableName, operation, metric), series in self.correctedThroughputBySize().items():
+            sizes = sorted({x for points in series.values() for x in points})
+            lines.append(f"## {tableName} {operation}: {timeMetrics[metric]} throughput (rows/sec) by size, net of harness overhead\n")
+            lines.append("| engine | " + " | ".join(str(size) for size in sizes) + " |")
+            lines.append("|---" * (len(sizes) + 1) + "|")
+            for label, points in sorted(series.items()):
+                lines.append(f"| {label} | " + " | ".join(f"{points[size]:,.0f}" if size in points else "" for size in sizes) + " |")
+            lines.append("")
+
+        for (tableName, operation, metric), series in self.queriesBySize().items():
+            sizes = sorted({x for points in series.values() for x in points})
+            lines.append(f"## {tableName} {operation}: {metric.removesuffix('Time')} (ms) by size\n")
+            lines.append("| engine | " + " | ".join(str(size) for size in sizes) + " |")
+            lines.append("|---" * (len(sizes) + 1) + "|")
+            for label, points in sorted(series.items()):
+                lines.append(f"| {label} | " + " | ".join(f"{points[size]:,.3f}" if size in points else "" for size in sizes) + " |")
+            lines.append("")
+
+        acquired = self.connectionAcquire()
+        if acquired:
+            lines.append("## Connection acquire (ms, median per workload)\n")
+            lines.append("| engine | pool size | acquire |")
+            lines.append("|---|---|---|")
+            for (label, poolSize), acquireMs in acquired.items():
+                lines.append(f"| {label} | {poolSize or 'unpooled'} | {acquireMs:.3f} |")
+            lines.append("")
+
+        built = self.schemaBuilds()
+        if built:
+            lines.append("## Schema variant index builds (seconds, median per workload)\n")
+            lines.append("| engine | table | build |")
+            lines.append("|---|---|---|")
+            for (label, tableName), seconds in built.items():
+                lines.append(f"| {label} | {tableName} | {seconds:.3f} |")
+            lines.append("")
+
+        calibration = self.calibration()
+        if calibration:
+            lines.append("## Harness calibration (ns per call)\n")
+            lines.append("| " + " | ".join(calibration) + " |")
+            lines.append("|---" * len(calibration) + "|")
+            lines.append("| " + " | ".join(f"{value:,.1f}" for value in calibration.values()) + " |")
+            lines.append("")
+
+        for (tableName, operation, metric), series in self.loadByConcurrency().items():
+            levels = sorted({x for points in series.values() for x in points})
+            lines.append(f"## {tableName} {operation}: {metric} by concurrency\n")
+            lines.append("| engine | " + " | ".join(str(level) for level in levels) + " |")
+            lines.append("|---" * (len(levels) + 1) + "|")
+            for label, points in sorted(series.items()):
+                lines.append(f"| {label} | " + " | ".join(f"{points[level]:,.3f}" if level in points else "" for level in levels) + " |")
+            lines.append("")
+
+        for (tableName, operation), engines in self.latencySummary().items():
+            columns = sorted({column for values in engines.values() for column in values})
+            lines.append(f"## {tableName} {operation}: per-request latency (ms)\n")
+            lines.append("| engine | " + " | ".join(columns) + " |")
+            lines.append("|---" * (len(columns) + 1) + "|")
+            for label, values in sorted(engines.items()):
+                lines.append(f"| {label} | " + " | ".join(f"{values[column]:.3f}" if column in values else "" for column in columns) + " |")
+            lines.append("")
+
+        return "\n".join(lines)
+
+    def writeCsv(self, filePath:str, data:dict, xName:str):
+        with open(filePath, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["tableName", "operation", "metric", "engine", xName, "value"])
+            for (tableName, operation, metric), series in data.items():
+                for label, points in series.items():
+                    for x, value in points.items():
+                        writer.writerow([tableName, operation, metric, label, x, value])
+
+    def plot(self, outputDirectory:str, data:dict, xName:str, yName:str, logX:bool):
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        for (tableName, operation, metric), series in data.items():
+            figure, axis = plt.subplots(figsize=(8, 5))
+            for label, points in sorted(series.items()):
+                axis.plot(list(points), list(points.values()), marker="o", label=label)
+            if logX:
+                axis.set_xscale("log")
+            axis.set_xlabel(xName)
+            axis.set_ylabel(f"{timeMetrics.get(metric, metric)} {yName}")
+            axis.set_title(f"{tableName} {operation}")
+            axis.legend()
+            figure.tight_layout()
+            figure.savefig(path.join(outputDirectory, f"{tableName}_{operation}_{metric}_by_{xName}.png"))
+            plt.close(figure)
+
+    def write(self, outputDirectory:str, plots:bool=True):
+        makedirs(outputDirectory, exist_ok=True)
+        with open(path.join(outputDirectory, "report.md"), "w") as f:
+            f.write(self.markdown())
+
+        throughput, queries, load = self.throughputBySize(), self.queriesBySize(), self.loadByConcurrency()
+        self.writeCsv(path.join(outputDirectory, "throughput_by_size.csv"), throughput, "qSize")
+        self.writeCsv(path.join(outputDirectory, "throughput_by_size_corrected.csv"), self.correctedThroughputBySize(), "qSize")
+        self.writeCsv(path.join(outputDirectory, "queries_by_size.csv"), queries, "qSize")
+        self.writeCsv(path.join(outputDirectory, "load_by_concurrency.csv"), load, "concurrency")
+
+        if plots:
+            self.plot(outputDirectory, throughput, "qSize", "rows/sec", logX=True)
+            self.plot(outputDirectory, queries, "qSize", "ms", logX=True)
+            self.plot(outputDirectory, load, "concurrency", "", logX=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare engines and runs recorded in the result store")
+    parser.add_argument("saveDataDirectory", help="directory holding results.sqlite")
+    parser.add_argument("--runs", nargs="*", help="run ids to include (default: every recorded run)")
+    parser.add_argument("--baseline-runs", nargs="*", help="run ids holding the null engine's baseline (default: the reported runs)")
+    parser.add_argument("--output", help="directory for report.md, CSVs and plots (default: <saveDataDirectory>/report)")
+    parser.add_argument("--no-plots", action="store_true", help="skip matplotlib plots")
+    parser.add_argument("--list-runs", action="store_true", help="print recorded runs and exit")
+    args = parser.parse_args()
+
+    store = ResultStore(args.saveDataDirectory)
+    if args.list_runs:
+        for run in store.runs():
+            print(f"{run['runId']}  {run['startedAt']}  {run['gitSha'] or '-'}  {run['host']}")
+    else:
+        report = Report(store, args.runs, args.baseline_runs)
+        outputDirectory = args.output or path.join(args.saveDataDirectory, "report")
+        report.write(outputDirectory, not args.no_plots)
+        print(report.markdown())
+        print(f"Report written to {outputDirectory}")
+    store.close()
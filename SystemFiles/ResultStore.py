@@ -0,0 +1,116 @@
+import json, socket, sqlite3, platform, subprocess, uuid
+from os import path
+from datetime import datetime
+from importlib import metadata
+
+# Append-only SQLite store of every result postProcess saves, so history survives reruns and
+# engines/runs can be compared with SQL. Results are kept in long format, one row per
+# (result entry, metric), with the dimensions reports group by as columns.
+
+storeFileName = "results.sqlite"
+driverPackages = ["pymongo", "motor", "oracledb", "redis", "neo4j", "pandas", "pyarrow", "numpy"]
+
+# One id per process; Main/Sweep add their configuration to runConfig before results are stored
+runId = f"{datetime.now():%Y%m%dT%H%M%S}_{uuid.uuid4().hex[:8]}"
+runConfig = {}
+
+def gitSha():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, cwd=path.dirname(path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def driverVersions():
+    versions = {}
+    for package in driverPackages:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    return versions
+
+def environment():
+    return {"gitSha": gitSha(), "host": socket.gethostname(), "platform": platform.platform(),
+            "python": platform.python_version(), "drivers": driverVersions()}
+
+def flattenHistograms(histograms:dict, prefix:str=""):
+    # Histogram dicts (anything with "buckets") found in the nested histograms of a result, by dotted name
+    for key, value in histograms.items():
+        if isinstance(value, dict) and "buckets" in value:
+            yield f"{prefix}{key}", value["buckets"]
+        elif isinstance(value, dict):
+            yield from flattenHistograms(value, f"{prefix}{key}.")
+
+def flatten(entry:dict, prefix:str=""):
+    # Numeric leaves of a (possibly nested) result entry as dotted metric names; timestamps are skipped
+    for key, value in entry.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from flatten(value, f"{name}.")
+        elif isinstance(value, (int, float)) and not isinstance(value, bool) and not key.lower().endswith(("starttime", "endtime")):
+            yield name, value
+
+
+class ResultStore:
+    dimensions = ["run", "repetition", "qSize", "concurrency"]
+
+    def __init__(self, saveDirectory:str) -> None:
+        self.connection = sqlite3.connect(path.join(saveDirectory, storeFileName))
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                runId TEXT PRIMARY KEY, startedAt TEXT, gitSha TEXT, host TEXT, environment TEXT, config TEXT
+            );
+            CREATE TABLE IF NOT EXISTS metrics (
+                runId TEXT, recordedAt TEXT, dbms TEXT, variant TEXT, tableName TEXT, operation TEXT,
+                run INTEGER, repetition INTEGER, qSize INTEGER, concurrency INTEGER, section TEXT, metric TEXT, value REAL
+            );
+            CREATE INDEX IF NOT EXISTS metricsByWorkload ON metrics (tableName, operation, dbms, variant, runId);
+            CREATE TABLE IF NOT EXISTS histograms (
+                runId TEXT, recordedAt TEXT, dbms TEXT, variant TEXT, tableName TEXT, operation TEXT, name TEXT, buckets TEXT
+            );
+        """)
+
+    def close(self):
+        self.connection.close()
+
+    def registerRun(self):
+        env = environment()
+        self.connection.execute("INSERT OR IGNORE INTO runs VALUES (?, ?, ?, ?, ?, ?)",
+                                (runId, datetime.now().isoformat(), env["gitSha"], env["host"], json.dumps(env), json.dumps(runConfig, default=str)))
+        self.connection.execute("UPDATE runs SET config = ? WHERE runId = ?", (json.dumps(runConfig, default=str), runId))
+
+    def append(self, resultInfo:dict, histograms:dict=None):
+        self.registerRun()
+        recordedAt = datetime.now().isoformat()
+        key = (runId, recordedAt, resultInfo["dbms"], resultInfo.get("variant", ""), resultInfo["tableName"], resultInfo["operation"])
+
+        rows = []
+        for entry in resultInfo.get("result", []):
+            dims = tuple(entry.get(dimension) for dimension in self.dimensions)
+            rows.extend(key + dims + ("result", metric, value) for metric, value in flatten(entry) if metric not in self.dimensions)
+        for entry in resultInfo.get("aggregate", []):
+            dims = (entry.get("run"), None, entry.get("qSize"), entry.get("concurrency"))
+            rows.extend(key + dims + ("aggregate", metric, value) for metric, value in flatten(entry) if metric not in self.dimensions)
+        for section in ("latency", "profile", "dataPrep", "connection", "schema"):
+            rows.extend(key + (None, None, None, None, section, metric, value) for metric, value in flatten(resultInfo.get(section, {})))
+
+        self.connection.executemany("INSERT INTO metrics VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        self.connection.executemany("INSERT INTO histograms VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                    [key + (name, json.dumps(buckets)) for name, buckets in flattenHistograms(histograms or {})])
+        self.connection.commit()
+
+    def query(self, sql:str, parameters:tuple=()):
+        cursor = self.connection.execute(sql, parameters)
+        columns = [description[0] for description in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def latest(self, table:str, runId:str):
+        # Rows of the last recording of each workload in a run, so a workload repeated within one run is not mixed
+        return self.query(f"""
+            SELECT t.* FROM {table} t JOIN (
+                SELECT dbms, variant, tableName, operation, MAX(recordedAt) AS recordedAt FROM {table} WHERE runId = ?
+                GROUP BY dbms, variant, tableName, operation
+            ) last USING (dbms, variant, tableName, operation, recordedAt) WHERE t.runId = ?""", (runId, runId))
+
+    def runs(self):
+        return self.query("SELECT runId, startedAt, gitSha, host FROM runs ORDER BY startedAt")
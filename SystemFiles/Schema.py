@@ -0,0 +1,64 @@
+import time
+
+# Index and constraint configurations a workload can run under, so insert/update/delete cost (write
+# amplification) and retrieve/query speed (read speedup) are measured against recorded server state
+# instead of whatever indexes happened to exist. Per table, each variant lists (kind, fields):
+#   primary    unique key (Oracle PRIMARY KEY, MongoDB/SQLite unique index, Neo4j uniqueness constraint;
+#              Redis keys and the in-memory graph are unique by construction)
+#   secondary  non-unique index; more than one field makes it a compound index
+#   text       full-text index (Oracle Text, MongoDB text, Neo4j FULLTEXT, SQLite FTS5; not plain Redis)
+# Applying a variant drops every index and constraint the engine reports on the table, then builds the
+# variant's; the build time and what the engine reports afterwards are stored with the result.
+
+primaryKeys = {
+    "loans": [("primary", ["LoanID"])],
+    "members": [("primary", ["MemberID"])],
+    "books": [("primary", ["BookID"])],
+    "UserPostComment": [("primary", ["PostCommentID"])]
+}
+
+schemaVariants = {
+    "none": {},
+    "primaryKey": primaryKeys,
+    "secondary": {
+        **primaryKeys,
+        "loans": primaryKeys["loans"] + [("secondary", ["MemberID"]), ("secondary", ["BookID"])],
+        "UserPostComment": primaryKeys["UserPostComment"] + [("secondary", ["UserID"])]
+    },
+    "compound": {
+        **primaryKeys,
+        "loans": primaryKeys["loans"] + [("secondary", ["MemberID", "LoanDate"])],
+        "UserPostComment": primaryKeys["UserPostComment"] + [("secondary", ["UserID", "PostID"])]
+    },
+    "text": {
+        **primaryKeys,
+        "UserPostComment": primaryKeys["UserPostComment"] + [("text", ["Content"])]
+    }
+}
+
+indexSuffixes = {"primary": "pk", "secondary": "idx", "text": "text"}
+
+def indexName(tableName:str, kind:str, fields:list[str]):
+    return f"{tableName}_{'_'.join(fields)}_{indexSuffixes[kind]}"
+
+def applySchema(adapter, tableName:str, variant:str):
+    if variant not in schemaVariants:
+        raise ValueError(f"Unknown schema variant {variant}, expected one of {list(schemaVariants)}")
+
+    # Built outside any timed phase; the adapter's own setupSchema() stands aside once a variant manages its tables
+    instrument, adapter.instrument = adapter.instrument, None
+    adapter.schemaVariant = variant
+    adapter.schemaTables = {*adapter.schemaTables, tableName}
+    startNs = time.perf_counter_ns()
+    adapter.dropIndexes(tableName)
+    unsupported = []
+    for kind, fields in schemaVariants[variant].get(tableName, []):
+        try:
+            adapter.createIndex(tableName, kind, fields)
+        except NotImplementedError as e:
+            print(e)
+            unsupported.append(indexName(tableName, kind, fields))
+    seconds = (time.perf_counter_ns() - startNs) / 1e9
+    adapter.instrument = instrument
+
+    return {"variant": variant, "seconds": seconds, "indexes": adapter.describeSchema(tableName), "unsupported": unsupported}
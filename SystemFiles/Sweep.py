@@ -0,0 +1,184 @@
+import json, argparse, traceback
+from os import path, makedirs, getenv
+from datetime import datetime
+from functools import partial
+from dotenv import load_dotenv
+from Engines import engineFactory, engineVariants
+from LoadGenerator import LoadGenerator
+from Datasets import Dataset
+from PayloadCache import PayloadCache
+from Calibration import calibrate
+import ResultStore
+
+# Non-interactive runner for a whole benchmark matrix described in a YAML or TOML spec
+# (see sweep.example.yaml). Every (engine, variant, schema, workload) cell is recorded in
+# <outputDirectory>/sweepState.json when it finishes, and a rerun skips recorded cells,
+# so an interrupted overnight sweep resumes where it stopped.
+
+def loadSpec(specPath:str):
+    if specPath.endswith(".toml"):
+        import tomllib
+        with open(specPath, "rb") as f:
+            return tomllib.load(f)
+
+    import yaml
+    with open(specPath) as f:
+        return yaml.safe_load(f)
+
+
+class Sweep:
+    def __init__(self, spec:dict) -> None:
+        self.spec = spec
+        self.outputDirectory = spec.get("outputDirectory") or getenv("saveDataDirectory")
+        self.dataDirectory = spec.get("dataDirectory") or getenv("dataDirectory")
+        self.databaseName = spec.get("databaseName", "SocialMedia")
+        self.runnerOptions = spec.get("runner", {})
+        # Prepared batches shared by every cell of the sweep: payloadCache: {maxMB: 2048, directory: ./cache}
+        cacheSpec = spec.get("payloadCache")
+        self.payloadCache = PayloadCache(int(cacheSpec.get("maxMB", 2048)) << 20, cacheSpec.get("directory")) if cacheSpec else None
+        self.calibrated = False
+        self.statePath = path.join(self.outputDirectory, "sweepState.json")
+        makedirs(self.outputDirectory, exist_ok=True)
+        self.state = self.loadState()
+
+    def loadState(self):
+        if path.exists(self.statePath):
+            with open(self.statePath) as f:
+                return json.load(f)
+        return {"completed": {}, "failed": {}}
+
+    def saveState(self):
+        with open(self.statePath, "w") as f:
+            json.dump(self.state, f, indent=4)
+
+    def dataset(self, workloadSpec:dict, name:str=None):
+        return Dataset(name or workloadSpec["dataset"], self.dataDirectory,
+                       workloadSpec.get("batchSize", self.spec.get("batchSize", 10000)),
+                       workloadSpec.get("csvReader", self.spec.get("csvReader", "pandas")),
+                       workloadSpec.get("columnar", self.spec.get("columnar", False)))
+
+    def workload(self, workloadSpec:dict, schema:str=None):
+        # Returns a callable running the workload against one adapter
+        iterations = workloadSpec.get("iterations", 5)
+        options = {**self.runnerOptions, **workloadSpec.get("runner", {})}
+        if "sizes" in workloadSpec:
+            options["sizes"] = workloadSpec["sizes"]
+        if self.payloadCache is not None:
+            options["payloadCache"] = self.payloadCache
+        if schema is not None:
+            options["schema"] = schema
+
+        if workloadSpec["type"] == "queries":
+            # Several tables at once; indexed: false | true | both (a schema variant brings its own indexes instead)
+            datasets = {name: self.dataset(workloadSpec, name) for name in workloadSpec.get("datasets", ["loans", "books", "members", "UserPostComment"])}
+            suiteOptions = {key: workloadSpec[key] for key in ["topK", "seed"] if key in workloadSpec}
+            modes = [False, True] if workloadSpec.get("indexed", "both") == "both" else [bool(workloadSpec["indexed"])]
+            if schema is not None:
+                modes = [False]
+            return lambda system: [system.querySuiteTest(datasets, iterations, indexed, **suiteOptions, **options) for indexed in modes]
+
+        data = self.dataset(workloadSpec)
+        tableName = workloadSpec["dataset"]
+
+        match workloadSpec["type"]:
+            case "crud":
+                if tableName == "loans":
+                    return lambda system: system.libraryRunTest(data, tableName, iterations, **options)
+                return lambda system: system.socialMediaRunTest(data, tableName, iterations, **options)
+            case "retrieve":
+                # preload: true fills the table through the engine's bulk load path first (BulkLoad.py)
+                if workloadSpec.get("preload"):
+                    return lambda system: [system.preload(data, tableName, **options), system.libraryRetrieveTest(tableName, len(data), iterations, **options)]
+                return lambda system: system.libraryRetrieveTest(tableName, len(data), iterations, **options)
+            case "bulkLoad":
+                return lambda system: system.preload(data, tableName, workloadSpec.get("rows"), **options)
+            case "grow":
+                return lambda system: system.growTest(data, tableName, iterations, **options)
+            case "ycsb":
+                ycsbOptions = {key: workloadSpec[key] for key in ["distribution", "operationCount", "maxScanLength", "seed"] if key in workloadSpec}
+                options.pop("sizes", None)
+                return lambda system: system.ycsbTest(data, tableName, workloadSpec.get("workload", "A"), **ycsbOptions, **options)
+        raise ValueError(f"Unknown workload type {workloadSpec['type']}")
+
+    def cells(self):
+        # schemas (Schema.schemaVariants names) may be set for the whole sweep, per engine or per workload;
+        # load workloads read an already populated table and always keep its indexes
+        for engineSpec in self.spec["engines"]:
+            engine = engineSpec["engine"]
+            for label, variantOptions in engineVariants(engine, engineSpec.get("variants")).items():
+                for workloadSpec in self.spec["workloads"]:
+                    workloadName = workloadSpec.get("name", f"{workloadSpec['type']}_{workloadSpec.get('dataset', 'library')}")
+                    schemas = workloadSpec.get("schemas", engineSpec.get("schemas", self.spec.get("schemas"))) or [None]
+                    for schema in [None] if workloadSpec["type"] == "load" else schemas:
+                        cellId = f"{engine}/{label}/{workloadName}" if schema is None else f"{engine}/{label}+{schema}/{workloadName}"
+                        yield cellId, engine, variantOptions, workloadSpec, schema
+
+    def runCell(self, engine:str, variantOptions:dict, workloadSpec:dict, schema:str=None):
+        adapterFactory = engineFactory(engine, self.databaseName, self.outputDirectory, self.dataDirectory, self.spec.get("poolSize"))
+
+        # The null engine's cells are the harness baseline; timer and instrument costs are recorded once per sweep
+        if engine == "null" and not self.calibrated:
+            calibrate(self.outputDirectory)
+            self.calibrated = True
+
+        if workloadSpec["type"] == "load":
+            data = self.dataset(workloadSpec)
+            if workloadSpec.get("preload"):
+                adapter = adapterFactory(**variantOptions)
+                try:
+                    adapter.preload(data, workloadSpec["dataset"], **self.runnerOptions)
+                finally:
+                    adapter.closeConn()
+            return LoadGenerator(partial(adapterFactory, **variantOptions), workloadSpec["dataset"], len(data),
+                operation=workloadSpec.get("operation", "pointRead"),
+                executor=workloadSpec.get("executor", "thread"),
+                targetRate=workloadSpec.get("targetRate"),
+                duration=workloadSpec.get("duration", 10)
+            ).run(workloadSpec.get("concurrency", [1, 2, 4, 8, 16]))
+
+        adapter = adapterFactory(**variantOptions)
+        try:
+            return self.workload(workloadSpec, schema)(adapter)
+        finally:
+            adapter.closeConn()
+
+    def run(self, listOnly:bool=False):
+        for cellId, engine, variantOptions, workloadSpec, schema in self.cells():
+            if cellId in self.state["completed"]:
+                print(f"Skipping {cellId} (completed {self.state['completed'][cellId]['finishedAt']})")
+                continue
+            if listOnly:
+                print(f"Pending {cellId}")
+                continue
+
+            print(f"Running {cellId}")
+            startedAt = datetime.now().isoformat()
+            try:
+                self.runCell(engine, variantOptions, workloadSpec, schema)
+            except Exception:
+                # One broken engine must not stop an overnight sweep; failed cells are retried on resume
+                self.state["failed"][cellId] = {"startedAt": startedAt, "error": traceback.format_exc()}
+                self.saveState()
+                print(f"Failed {cellId}")
+                continue
+
+            self.state["failed"].pop(cellId, None)
+            self.state["completed"][cellId] = {"startedAt": startedAt, "finishedAt": datetime.now().isoformat()}
+            self.saveState()
+
+
+if __name__ == "__main__":
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Run a benchmark matrix from a YAML/TOML workload spec")
+    parser.add_argument("spec", help="path to the .yaml/.yml/.toml workload spec")
+    parser.add_argument("--restart", action="store_true", help="ignore recorded progress and run every cell again")
+    parser.add_argument("--list", action="store_true", help="only print which cells are completed or pending")
+    args = parser.parse_args()
+
+    spec = loadSpec(args.spec)
+    ResultStore.runConfig.update({"entryPoint": "Sweep", "specFile": args.spec, "spec": spec})
+    sweep = Sweep(spec)
+    if args.restart:
+        sweep.state = {"completed": {}, "failed": {}}
+    sweep.run(args.list)
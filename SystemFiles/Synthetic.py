@@ -0,0 +1,180 @@
+import argparse
+from os import path, makedirs
+import numpy as np
+import pandas as pd
+from Datasets import datasetSchemas
+
+# Schema-compatible synthetic loans, members, books and UserPostComment datasets at any scale. Rows are
+# generated in chunks with NumPy, each chunk from its own generator seeded by (seed, chunk),
+# so the same seed and chunk size always give the same file, and memory stays bounded by
+# chunkSize however many rows are written.
+
+wordPool = ("lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore "
+            "et dolore magna aliqua enim ad minim veniam quis nostrud exercitation ullamco laboris nisi aliquip "
+            "ex ea commodo consequat duis aute irure in reprehenderit voluptate velit esse cillum eu fugiat nulla "
+            "pariatur excepteur sint occaecat cupidatat non proident sunt culpa qui officia deserunt mollit anim id est laborum ")
+
+
+class SkewedIDs:
+    # IDs 1..count where ID k is drawn with probability proportional to 1 / k**skew (0 = uniform).
+    # The CDF is built once and sampled with searchsorted, so each chunk is a single vectorized call.
+    def __init__(self, count:int, skew:float) -> None:
+        self.count = count
+        self.skew = skew
+        self.cdf = None
+        if skew > 0:
+            weights = 1 / np.arange(1, count + 1, dtype=np.float64) ** skew
+            self.cdf = np.cumsum(weights)
+            self.cdf /= self.cdf[-1]
+
+    def sample(self, rng:np.random.Generator, size:int):
+        if self.cdf is None:
+            return rng.integers(1, self.count + 1, size)
+        return np.searchsorted(self.cdf, rng.random(size), side="right") + 1
+
+
+class SyntheticGenerator:
+    #   rows            records to produce (1e3 .. 1e8)
+    #   skew            zipf exponent for foreign keys (MemberID/BookID, UserID/PostID); 0 for uniform
+    #   contentMean/contentSigma/contentMax  lognormal length distribution of Content, in characters
+    #   unreturnedRatio share of loans with an empty ReturnDate
+    def __init__(self, rows:int, seed:int=0, skew:float=1.0, chunkSize:int=1_000_000,
+                 contentMean:float=200, contentSigma:float=0.6, contentMax:int=2000, unreturnedRatio:float=0.1) -> None:
+        self.rows = int(rows)
+        self.seed = seed
+        self.skew = skew
+        self.chunkSize = int(chunkSize)
+        self.contentMean = contentMean
+        self.contentSigma = contentSigma
+        self.contentMax = contentMax
+        self.unreturnedRatio = unreturnedRatio
+
+        # Text pool long enough for the longest Content; rows take slices at random offsets
+        self.textPool = wordPool * (contentMax // len(wordPool) + 2)
+
+    def chunkRanges(self):
+        for chunk, start in enumerate(range(0, self.rows, self.chunkSize)):
+            yield chunk, start, min(start + self.chunkSize, self.rows)
+
+    def loans(self):
+        members = SkewedIDs(max(self.rows // 20, 1), self.skew)
+        books = SkewedIDs(max(self.rows // 10, 1), self.skew)
+        firstDay = np.datetime64("2015-01-01")
+
+        for chunk, start, end in self.chunkRanges():
+            rng = np.random.default_rng([self.seed, chunk])
+            size = end - start
+
+            loanDates = firstDay + rng.integers(0, 365 * 8, size).astype("timedelta64[D]")
+            returnDates = loanDates + rng.integers(1, 31, size).astype("timedelta64[D]")
+            returnDates[rng.random(size) < self.unreturnedRatio] = np.datetime64("NaT")
+
+            yield pd.DataFrame({
+                "LoanID": np.arange(start + 1, end + 1),
+                "BookID": books.sample(rng, size),
+                "MemberID": members.sample(rng, size),
+                "LoanDate": loanDates,
+                "DueDate": loanDates + np.timedelta64(14, "D"),
+                "ReturnDate": returnDates
+            })
+
+    def comments(self):
+        users = SkewedIDs(max(self.rows // 50, 1), self.skew)
+        posts = SkewedIDs(max(self.rows // 10, 1), self.skew)
+        mu = np.log(self.contentMean) - self.contentSigma ** 2 / 2
+
+        for chunk, start, end in self.chunkRanges():
+            rng = np.random.default_rng([self.seed, chunk])
+            size = end - start
+
+            lengths = np.clip(rng.lognormal(mu, self.contentSigma, size).astype(np.int64), 1, self.contentMax)
+            offsets = rng.integers(0, len(self.textPool) - self.contentMax, size)
+            pool = self.textPool
+
+            yield pd.DataFrame({
+                "PostCommentID": np.arange(start + 1, end + 1),
+                "UserID": users.sample(rng, size),
+                "PostID": posts.sample(rng, size),
+                "Content": [pool[offset:offset + length] for offset, length in zip(offsets.tolist(), lengths.tolist())]
+            })
+
+    def words(self, rng:np.random.Generator, size:int, low:int, high:int):
+        # size strings of low..high capitalised words from the pool
+        vocabulary = np.array([word.capitalize() for word in wordPool.split()])
+        counts = rng.integers(low, high + 1, size)
+        picks = vocabulary[rng.integers(0, len(vocabulary), counts.sum())]
+        return [" ".join(words) for words in np.split(picks, np.cumsum(counts)[:-1])]
+
+    def members(self):
+        # Dimension table for loans: a loans file of N rows references MemberIDs 1..N // 20
+        firstDay = np.datetime64("2010-01-01")
+        for chunk, start, end in self.chunkRanges():
+            rng = np.random.default_rng([self.seed, chunk])
+            size = end - start
+            yield pd.DataFrame({
+                "MemberID": np.arange(start + 1, end + 1),
+                "Name": self.words(rng, size, 2, 2),
+                "JoinDate": firstDay + rng.integers(0, 365 * 5, size).astype("timedelta64[D]")
+            })
+
+    def books(self):
+        # Dimension table for loans: a loans file of N rows references BookIDs 1..N // 10
+        for chunk, start, end in self.chunkRanges():
+            rng = np.random.default_rng([self.seed, chunk])
+            size = end - start
+            yield pd.DataFrame({
+                "BookID": np.arange(start + 1, end + 1),
+                "Title": self.words(rng, size, 1, 5),
+                "Author": self.words(rng, size, 2, 2),
+                "PublishedYear": rng.integers(1900, 2024, size)
+            })
+
+    def write(self, tableName:str, outputDirectory:str, fileFormat:str="csv"):
+        # Written under the file name Datasets expects, so the output can be benchmarked directly
+        makedirs(outputDirectory, exist_ok=True)
+        fileName = datasetSchemas[tableName]["fileName"]
+        if fileFormat == "parquet":
+            fileName = fileName.replace(".csv", ".parquet")
+        filePath = path.join(outputDirectory, fileName)
+
+        frames = {"loans": self.loans, "UserPostComment": self.comments, "members": self.members, "books": self.books}[tableName]()
+        writer = None
+        for chunk, frame in enumerate(frames):
+            print(f"Writing rows {chunk * self.chunkSize + 1}-{chunk * self.chunkSize + len(frame)}")
+            if fileFormat == "parquet":
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                table = pa.Table.from_pandas(frame, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(filePath, table.schema)
+                writer.write_table(table)
+            else:
+                frame.to_csv(filePath, mode="w" if chunk == 0 else "a", header=chunk == 0, index=False, date_format="%Y-%m-%d")
+
+        if writer is not None:
+            writer.close()
+        return filePath
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic loans / UserPostComment datasets")
+    parser.add_argument("table", choices=list(datasetSchemas), help="dataset to generate")
+    parser.add_argument("rows", type=float, help="number of records, e.g. 1e6")
+    parser.add_argument("outputDirectory", help="directory to write loans.csv / user_post_comments.csv (or .parquet) into")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skew", type=float, default=1.0, help="zipf exponent of foreign keys, 0 for uniform")
+    parser.add_argument("--chunk-size", type=float, default=1e6)
+    parser.add_argument("--content-mean", type=float, default=200, help="mean Content length in characters")
+    parser.add_argument("--content-sigma", type=float, default=0.6, help="lognormal sigma of Content length")
+    parser.add_argument("--content-max", type=int, default=2000)
+    parser.add_argument("--dimensions", action="store_true", help="with loans, also write the members and books tables it references")
+    args = parser.parse_args()
+
+    generator = SyntheticGenerator(args.rows, args.seed, args.skew, args.chunk_size, args.content_mean, args.content_sigma, args.content_max)
+    print(f"Saved {generator.write(args.table, args.outputDirectory, args.format)}")
+    if args.dimensions and args.table == "loans":
+        for tableName, divisor in [("members", 20), ("books", 10)]:
+            dimension = SyntheticGenerator(max(int(args.rows) // divisor, 1), args.seed, chunkSize=args.chunk_size)
+            print(f"Saved {dimension.write(tableName, args.outputDirectory, args.format)}")
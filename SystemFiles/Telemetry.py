@@ -0,0 +1,80 @@
+import time, threading
+from contextlib import contextmanager
+
+# Resource telemetry around each timed phase, to tell client-side bottlenecks (CPU, memory, network,
+# context switches) from server-side ones. Client samples come from psutil on a background thread
+# every `interval` seconds; engine counters come from adapter.serverStats() just before and after
+# the phase, outside the timed region. Timestamps are time.time(), like the phase start/end times
+# stored in the results, so samples line up with them.
+
+
+class Telemetry:
+    def __init__(self, adapter, interval:float=0.1) -> None:
+        import psutil
+
+        self.psutil = psutil
+        self.process = psutil.Process()
+        self.adapter = adapter
+        self.interval = interval
+        self.serverStatsEnabled = True
+        self.phases = []
+
+    def sample(self):
+        cpu = self.process.cpu_times()
+        memory = self.process.memory_info()
+        switches = self.process.num_ctx_switches()
+        network = self.psutil.net_io_counters()
+        return {
+            "time": time.time(), "cpuUser": cpu.user, "cpuSystem": cpu.system, "rss": memory.rss,
+            "netBytesSent": network.bytes_sent, "netBytesRecv": network.bytes_recv,
+            "ctxVoluntary": switches.voluntary, "ctxInvoluntary": switches.involuntary,
+        }
+
+    def serverStats(self):
+        # Engines without accessible counters (or without the privileges to read them) are skipped after the first failure
+        if not self.serverStatsEnabled:
+            return {}
+        try:
+            return self.adapter.serverStats()
+        except Exception as e:
+            print(f"Server stats unavailable for {self.adapter.name}: {e}")
+            self.serverStatsEnabled = False
+            return {}
+
+    @contextmanager
+    def phase(self, name:str):
+        serverBefore = self.serverStats()
+        samples = [self.sample()]
+        stop = threading.Event()
+
+        def sampler():
+            while not stop.wait(self.interval):
+                samples.append(self.sample())
+
+        thread = threading.Thread(target=sampler, daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+            samples.append(self.sample())
+            serverAfter = self.serverStats()
+            self.phases.append({
+                "phase": name, "startTime": samples[0]["time"], "endTime": samples[-1]["time"],
+                "client": self.summarize(samples), "samples": samples,
+                "server": {"after": serverAfter, "delta": {key: value - serverBefore[key] for key, value in serverAfter.items() if key in serverBefore}},
+            })
+
+    def summarize(self, samples:list[dict]):
+        first, last = samples[0], samples[-1]
+        wall = last["time"] - first["time"]
+        cpu = (last["cpuUser"] + last["cpuSystem"]) - (first["cpuUser"] + first["cpuSystem"])
+        return {
+            "cpuPercent": (cpu / wall * 100) if wall else 0,
+            "peakRss": max(sample["rss"] for sample in samples),
+            "netBytesSent": last["netBytesSent"] - first["netBytesSent"],
+            "netBytesRecv": last["netBytesRecv"] - first["netBytesRecv"],
+            "ctxVoluntary": last["ctxVoluntary"] - first["ctxVoluntary"],
+            "ctxInvoluntary": last["ctxInvoluntary"] - first["ctxInvoluntary"],
+        }
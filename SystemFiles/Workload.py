@@ -0,0 +1,547 @@
+import re, json, time, asyncio
+from contextlib import ExitStack
+from os import path
+from abc import ABC, abstractmethod
+from datetime import datetime
+from faker import Faker
+from Metrics import Instrument, describe
+from Datasets import Dataset
+from ResultStore import ResultStore
+from Telemetry import Telemetry
+from Profiling import PhaseProfiler
+from Schema import applySchema
+
+# Primary key used for range reads and per-record keys on each benchmark table
+tableKeys = {
+    "loans": "LoanID",
+    "members": "MemberID",
+    "books": "BookID",
+    "UserPostComment": "PostCommentID"
+}
+
+# Fields indexed before read tests on engines that do not index them implicitly
+tableIndexes = {
+    "loans": ["LoanID"],
+    "members": ["MemberID"],
+    "books": ["BookID"],
+    "UserPostComment": ["PostCommentID", "UserID"]
+}
+
+# Secondary and full-text indexes the query suite (QuerySuite.py) creates after loading and drops afterwards
+queryIndexes = {
+    "loans": ["MemberID", "BookID", "LoanDate"]
+}
+fullTextIndexes = {
+    "UserPostComment": "Content"
+}
+
+def wordPattern(term:str):
+    # Case-insensitive whole-word match: what contentSearch scans for when the full-text index is absent
+    return rf"(?i)\b{re.escape(term)}\b"
+
+def postProcess(func):
+    def wrapper(*args, **kwargs):
+        # Pre-process inputs
+        print("Running CRUD operation")
+
+        # Call the decorated function and get the result
+        resultInfo = func(*args, **kwargs)
+
+        # Variants of one engine (e.g. Redis_pipeline) get their own file
+        dbms = f"{resultInfo['dbms']}_{resultInfo['variant']}" if resultInfo.get("variant") else resultInfo["dbms"]
+        filename = f"{dbms}_{resultInfo['tableName']}_{resultInfo['operation']}.json"
+        filepath = path.join(resultInfo["saveDirectory"], filename)
+        print(f"Saving Result Data as {filename}")
+
+        # Raw histogram buckets go to a sibling file so the main result stays readable
+        histograms = resultInfo.pop("histograms", None)
+        if histograms is not None:
+            histogramPath = path.join(resultInfo["saveDirectory"], filename.replace(".json", "_histogram.json"))
+            with open(histogramPath, "w") as f:
+                json.dump(histograms, f, indent=4)
+
+        # Per-phase profiles (.prof or flamegraphs) go to a profiles directory next to the results
+        profiler = resultInfo.pop("profiler", None)
+        if profiler is not None:
+            for profilePath in profiler.save(path.join(resultInfo["saveDirectory"], "profiles"), filename.replace(".json", "")):
+                print(f"Saved profile {profilePath}")
+
+        # Resource samples likewise, when telemetry was enabled for the run
+        telemetry = resultInfo.pop("telemetry", None)
+        if telemetry is not None:
+            with open(path.join(resultInfo["saveDirectory"], filename.replace(".json", "_telemetry.json")), "w") as f:
+                json.dump(telemetry, f, indent=4)
+
+        # save the resultInfo list to the JSON file
+        with open(filepath, "w") as f:
+            json.dump(resultInfo, f, indent=4)
+
+        # Every result is also appended to the cross-run store read by Report.py
+        store = ResultStore(resultInfo["saveDirectory"])
+        store.append(resultInfo, histograms)
+        store.close()
+
+        return resultInfo
+    return wrapper
+
+
+class DBMSAdapter(ABC):
+    # Every engine implements these primitives; all timing lives in WorkloadRunner so
+    # the numbers of different engines are produced by the same code path.
+    name = "DBMS"
+    variant = ""
+    saveDataDirectory = ""
+    instrument = None
+    # Pool size the adapter's connection came from (None: its own connection), and how long acquiring it took
+    poolSize = None
+    acquireNs = None
+    # Schema variant (Schema.py) managing the adapter's indexes, and the tables it was applied to; None leaves them to setupSchema()
+    schemaVariant = None
+    schemaTables = ()
+    # Ingest path bulkLoad() takes, recorded with bulk load results
+    loadMethod = "bulkInsert"
+
+    def request(self, func, *args, **kwargs):
+        # Adapters route every driver round trip through here so per-request latency is recorded
+        if self.instrument is None:
+            return func(*args, **kwargs)
+        return self.instrument.request(func, *args, **kwargs)
+
+    def setupSchema(self, tableName:str):
+        # Untimed index/constraint creation before a workload; engines that need none keep this no-op.
+        # Adapters skip their built-in indexes once a schema variant manages the table.
+        pass
+
+    # Schema variants (Schema.py): kind is primary, secondary or text, and several fields make a compound index
+    def createIndex(self, tableName:str, kind:str, fields:list[str]):
+        raise NotImplementedError(f"{self.name} does not support {kind} indexes")
+
+    def dropIndexes(self, tableName:str):
+        # Every index and constraint on the table the engine can drop
+        pass
+
+    def describeSchema(self, tableName:str) -> list:
+        # Indexes and constraints as the engine reports them, stored with results run under a schema variant
+        return []
+
+    def serverStats(self):
+        # Engine-side counters (name -> number) read around each phase when telemetry is enabled
+        return {}
+
+    def prepare(self, tableName:str, documentData:list[dict]):
+        # Untimed conversion of the dataset into whatever the driver consumes (tuples, key/value pairs, ...)
+        return documentData
+
+    def prepareColumns(self, tableName:str, recordBatch):
+        # Same for a pyarrow RecordBatch from a columnar Dataset; engines without a columnar fast path get plain records
+        return self.prepare(tableName, recordBatch.to_pylist())
+
+    def payloadEncoding(self):
+        # Identifies what prepare() produces, so adapters sharing an encoding share PayloadCache entries
+        return f"{self.name}:{self.variant}"
+
+    def payloadState(self, tableName:str):
+        # Side state prepare() leaves on the adapter (e.g. bind sizes), cached with each batch and restored on a hit
+        return None
+
+    def restorePayloadState(self, tableName:str, state):
+        pass
+
+    @abstractmethod
+    def reset(self, tableName:str):
+        pass
+
+    @abstractmethod
+    def bulkInsert(self, tableName:str, rows):
+        pass
+
+    @abstractmethod
+    def bulkUpdate(self, tableName:str, changes:dict):
+        pass
+
+    @abstractmethod
+    def bulkDelete(self, tableName:str):
+        pass
+
+    @abstractmethod
+    def rangeRead(self, tableName:str, keyField:str, startID:int, endID:int) -> list:
+        pass
+
+    @abstractmethod
+    def closeConn(self):
+        pass
+
+    # Single-record operations for mixed workloads (YCSB.py)
+    def readRecord(self, tableName:str, keyField:str, recordID:int):
+        return self.rangeRead(tableName, keyField, recordID, recordID)
+
+    def updateRecord(self, tableName:str, keyField:str, recordID:int, changes:dict):
+        raise NotImplementedError(f"{self.name} does not support single-record updates")
+
+    def ycsbTest(self, documentData:list[dict] | Dataset, tableName:str, workload:str="A", **ycsbOptions):
+        from YCSB import YCSBRunner
+        return YCSBRunner(self, workload, **ycsbOptions).run(documentData, tableName)
+
+    # Read-path query suite (QuerySuite.py). Every engine answers the same named queries; parameters holds
+    # loanID, memberID, start, end, keyword, asOf, k and term, and each query uses the ones it needs.
+    def query(self, name:str, parameters:dict):
+        raise NotImplementedError(f"{self.name} does not implement the query suite")
+
+    def createQueryIndexes(self, tableName:str):
+        pass
+
+    def dropQueryIndexes(self, tableName:str):
+        pass
+
+    def querySuiteTest(self, datasets:dict, iterations:int, indexed:bool=False, **suiteOptions):
+        from QuerySuite import QueryRunner
+        return QueryRunner(self, iterations, **suiteOptions).run(datasets, indexed)
+
+    # Population of an empty table through the engine's fastest ingest path (BulkLoad.py). batches are raw
+    # dataset batches (lists of dicts or Arrow RecordBatches); without a native path each is prepared and inserted
+    def bulkLoad(self, tableName:str, batches):
+        for batch in batches:
+            self.bulkInsert(tableName, self.prepare(tableName, batch) if isinstance(batch, list) else self.prepareColumns(tableName, batch))
+
+    def preload(self, documentData:list[dict] | Dataset, tableName:str, rows:int=None, **runnerOptions):
+        from BulkLoad import BulkLoader
+        return BulkLoader(self, **runnerOptions).run(documentData, tableName, rows)
+
+    # Engines with a native asyncio driver override these; the rest run the blocking call in a thread, so their
+    # rangeRead must be safe to call from several threads at once (no cursor shared between calls)
+    async def asyncRangeRead(self, tableName:str, keyField:str, startID:int, endID:int) -> list:
+        return await asyncio.to_thread(self.rangeRead, tableName, keyField, startID, endID)
+
+    async def asyncClose(self):
+        pass
+
+    # Workloads shared by every engine; runnerOptions are passed on to WorkloadRunner (warmup, repetitions, ...)
+    def libraryRunTest(self, documentData:list[dict] | Dataset, tableName:str, iterations:int, **runnerOptions):
+        changes = {"ReturnDate": datetime.utcnow()}
+        return WorkloadRunner(self, iterations, **runnerOptions).runTest(documentData, tableName, changes)
+
+    def libraryRetrieveTest(self, tableName:str, sizeOfData:int, iterations:int, **runnerOptions):
+        return WorkloadRunner(self, iterations, **runnerOptions).retrieveTest(tableName, sizeOfData)
+
+    def socialMediaRunTest(self, documentData:list[dict] | Dataset, tableName:str, iterations:int, **runnerOptions):
+        fake = Faker()
+        text = fake.text(max_nb_chars=500 + 50)
+        newText = text[:500].ljust(500)
+
+        return WorkloadRunner(self, iterations, **runnerOptions).runTest(documentData, tableName, {"Content": newText})
+
+    def growTest(self, documentData:list[dict] | Dataset, tableName:str, iterations:int, **runnerOptions):
+        return WorkloadRunner(self, iterations, **runnerOptions).growTest(documentData, tableName)
+
+
+class WorkloadRunner:
+    # Each of the `iterations` data sizes is run `warmup` times untimed, then `repetitions` times timed.
+    # Sizes are equal fractions of the dataset unless explicit `sizes` (row counts) are given.
+    # telemetryInterval (seconds) samples client resources and engine counters during every timed phase;
+    # profiler ("cprofile" or "pyinstrument") profiles every timed phase; payloadCache (a PayloadCache)
+    # keeps prepared batches of streamed datasets across iterations, repetitions and runners; schema (a
+    # Schema.schemaVariants name) replaces the adapter's built-in indexes with that variant's.
+    def __init__(self, adapter:DBMSAdapter, iterations:int, warmup:int=0, repetitions:int=1, confidence:float=0.95, cvThreshold:float=0.1,
+                 sizes:list[int]=None, telemetryInterval:float=None, profiler:str=None, payloadCache=None, schema:str=None) -> None:
+        self.adapter = adapter
+        self.iterations = len(sizes) if sizes else iterations
+        self.fixedSizes = sizes
+        self.warmup = warmup
+        self.repetitions = max(1, repetitions)
+        self.confidence = confidence
+        self.cvThreshold = cvThreshold
+        self.instrument = Instrument()
+        self.telemetry = Telemetry(adapter, telemetryInterval) if telemetryInterval else None
+        self.profiler = PhaseProfiler(profiler) if profiler else None
+        self.payloadCache = payloadCache
+        self.schema = schema
+        self.schemaInfo = {}
+        self.prepNs = 0
+        self.prepRows = 0
+
+    def observed(self, phase:str):
+        # Telemetry and profiling scopes around a timed phase; the profiler is innermost so it does not see the sampler setup
+        scopes = ExitStack()
+        if self.telemetry:
+            scopes.enter_context(self.telemetry.phase(phase))
+        if self.profiler:
+            scopes.enter_context(self.profiler.phase(phase))
+        return scopes
+
+    def setupSchema(self, tableName:str):
+        # The adapter's built-in indexes, or the schema variant's, applied once per table and recorded
+        if self.schema is None:
+            # A variant applied by an earlier workload on this adapter is removed first, so the engine's own
+            # indexes are measured without leftovers and the adapter builds them again
+            if self.adapter.schemaVariant is not None:
+                for schemaTable in self.adapter.schemaTables:
+                    self.adapter.dropIndexes(schemaTable)
+                self.adapter.schemaVariant, self.adapter.schemaTables = None, ()
+            self.adapter.setupSchema(tableName)
+        elif tableName not in self.schemaInfo:
+            self.schemaInfo[tableName] = applySchema(self.adapter, tableName, self.schema)
+
+    def timed(self, phase:str, ops:int, func, *args):
+        with self.observed(phase):
+            startTime, endTime, elapsedNs = self.instrument.measure(phase, ops, func, *args)
+        return startTime, endTime, elapsedNs / 1e9
+
+    def sizes(self, sizeOfData:int):
+        if self.fixedSizes:
+            return [min(size, sizeOfData) for size in self.fixedSizes]
+        divisionFactor = sizeOfData // self.iterations
+        return [divisionFactor * (i + 1) for i in range(self.iterations)]
+
+    def prepare(self, tableName:str, batch, readStartNs:int=None):
+        # Untimed by the instrument, but the cost of reading and converting data is kept apart as dataPrep
+        startNs = time.perf_counter_ns() if readStartNs is None else readStartNs
+        prepared = self.adapter.prepare(tableName, batch) if isinstance(batch, list) else self.adapter.prepareColumns(tableName, batch)
+        self.prepNs += time.perf_counter_ns() - startNs
+        self.prepRows += len(batch)
+        return prepared
+
+    def insertBatches(self, tableName:str, documentData, payload, iterSize:int):
+        # A streamed Dataset is re-read and prepared batch by batch; an in-memory list is prepared once up front
+        if payload is not None:
+            yield payload[:iterSize]
+        elif self.payloadCache is not None:
+            yield from self.cachedBatches(tableName, documentData, iterSize)
+        else:
+            batches = documentData.batches(iterSize)
+            while True:
+                readStartNs = time.perf_counter_ns()
+                batch = next(batches, None)
+                if batch is None:
+                    return
+                yield self.prepare(tableName, batch, readStartNs)
+
+    def cachedBatches(self, tableName:str, dataset:Dataset, iterSize:int):
+        # Batch i of a prefix is rows [i * batchSize, (i + 1) * batchSize), so it can be looked up before reading;
+        # the dataset is only read (up to the first missing batch) when something is not cached yet
+        cache = self.payloadCache
+        reader, position, aligned = None, 0, True
+        for index, start in enumerate(range(0, iterSize, dataset.batchSize)):
+            readStartNs = time.perf_counter_ns()
+            length = min(dataset.batchSize, iterSize - start)
+            key = cache.key(dataset, self.adapter, tableName, index, length)
+            entry = cache.get(key)
+            if entry is not None:
+                payload, state = entry
+                self.adapter.restorePayloadState(tableName, state)
+                self.prepNs += time.perf_counter_ns() - readStartNs
+                self.prepRows += length
+                yield payload
+                continue
+
+            if reader is None:
+                reader = dataset.batches(iterSize)
+            while position <= index:
+                batch = next(reader)
+                position += 1
+            prepared = self.prepare(tableName, batch, readStartNs)
+            # A reader whose batches do not follow batchSize exactly (e.g. Parquet row group edges) is not cached
+            aligned = aligned and len(batch) == length
+            if aligned:
+                cache.put(key, prepared, self.adapter.payloadState(tableName))
+            yield prepared
+
+    def timedInsert(self, tableName:str, batches):
+        # Only the driver calls are timed; reading and preparing the next batch happens between measurements
+        startTime, endTime, totalNs = None, None, 0
+        with self.observed("insert"):
+            for batch in batches:
+                batchStartTime, endTime, elapsedNs = self.instrument.measure("insert", len(batch), self.adapter.bulkInsert, tableName, batch)
+                startTime = batchStartTime if startTime is None else startTime
+                totalNs += elapsedNs
+        return startTime, endTime, totalNs / 1e9
+
+    def aggregate(self, run:int, qSize:int, entries:list[dict], timeKeys:list[str]):
+        aggregated = {"run": run, "qSize": qSize}
+        for timeKey in timeKeys:
+            aggregated[timeKey] = describe([entry[timeKey] for entry in entries], self.confidence, self.cvThreshold)
+            if aggregated[timeKey]["noisy"]:
+                print(f"Warning: {timeKey} at qSize {qSize} is noisy (cv={aggregated[timeKey]['cv']:.2f})")
+        return aggregated
+
+    def resultInfo(self, tableName:str, operation:str, dataToStore:list[dict], aggregated:list[dict]):
+        # Results under a schema variant are labelled with it, so each engine/schema pair is its own series
+        variant = self.adapter.variant
+        if self.schema is not None:
+            variant = f"{variant}+{self.schema}" if variant else self.schema
+        resultInfo = {"saveDirectory": self.adapter.saveDataDirectory, "tableName": tableName, "dbms": self.adapter.name, "variant": variant,
+                "operation": operation, "warmup": self.warmup, "repetitions": self.repetitions,
+                "result": dataToStore, "aggregate": aggregated, "latency": self.instrument.summary(), "histograms": self.instrument.histograms()}
+        if self.schemaInfo:
+            resultInfo["schema"] = self.schemaInfo
+        if self.prepRows:
+            resultInfo["dataPrep"] = {"seconds": self.prepNs / 1e9, "rows": self.prepRows, "rowsPerSec": self.prepRows / (self.prepNs / 1e9) if self.prepNs else 0}
+        if self.payloadCache is not None:
+            resultInfo["payloadCache"] = self.payloadCache.stats()
+        if self.adapter.acquireNs is not None:
+            resultInfo["connection"] = {"acquireMs": self.adapter.acquireNs / 1e6, "poolSize": self.adapter.poolSize or 0}
+        if self.telemetry:
+            resultInfo["telemetry"] = self.telemetry.phases
+        if self.profiler:
+            resultInfo.update({"profile": self.profiler.breakdown(), "profiler": self.profiler})
+        return resultInfo
+
+    @postProcess
+    def runTest(self, documentData:list[dict] | Dataset, tableName:str, changes:dict):
+        # INSERT the growing prefix, UPDATE every row with `changes`, then DELETE everything
+        dataToStore = []
+        aggregated = []
+        payload = None if isinstance(documentData, Dataset) else self.prepare(tableName, documentData)
+        self.adapter.reset(tableName)
+        self.setupSchema(tableName)
+        self.adapter.instrument = self.instrument
+
+        for i, iterSize in enumerate(self.sizes(len(documentData))):
+            run = i + 1
+
+            for _ in range(self.warmup):
+                for batch in self.insertBatches(tableName, documentData, payload, iterSize):
+                    self.adapter.bulkInsert(tableName, batch)
+                self.adapter.bulkUpdate(tableName, changes)
+                self.adapter.bulkDelete(tableName)
+
+            entries = []
+            for repetition in range(1, self.repetitions + 1):
+                print(f"Run {run} repetition {repetition}")
+
+                inStartTime, inEndTime, inTime = self.timedInsert(tableName, self.insertBatches(tableName, documentData, payload, iterSize))
+                upStartTime, upEndTime, upTime = self.timed("update", iterSize, self.adapter.bulkUpdate, tableName, changes)
+                delStartTime, delEndTime, delTime = self.timed("delete", iterSize, self.adapter.bulkDelete, tableName)
+
+                entries.append({
+                    "run": run, "repetition": repetition, "qSize": iterSize,
+                    "inStartTime": inStartTime, "inEndTime": inEndTime, "inTime": inTime,
+                    "upStartTime": upStartTime, "upEndTime": upEndTime, "upTime": upTime,
+                    "delStartTime": delStartTime, "delEndTime": delEndTime, "delTime": delTime,
+                })
+
+            dataToStore.extend(entries)
+            aggregated.append(self.aggregate(run, iterSize, entries, ["inTime", "upTime", "delTime"]))
+
+        return self.resultInfo(tableName, "runTest", dataToStore, aggregated)
+
+    @postProcess
+    def growTest(self, documentData:list[dict] | Dataset, tableName:str):
+        # Start from an empty table and append only the next slice each step, so insert throughput is
+        # measured against a growing table (index maintenance, page splits) and no rows are re-inserted.
+        # Warmup and repetitions apply to the whole growth pass, each starting again from empty.
+        dataToStore = []
+        aggregated = []
+        sizes = self.sizes(len(documentData))
+        self.adapter.instrument = None
+        self.adapter.reset(tableName)
+        self.setupSchema(tableName)
+
+        for repetition in range(-self.warmup + 1, self.repetitions + 1):
+            stream = documentData.batches() if isinstance(documentData, Dataset) else iter([documentData])
+            pending = []
+
+            def nextRecords(count:int):
+                # Pull the next `count` records off the stream, splitting a batch that straddles the step boundary
+                nonlocal pending
+                while count > 0:
+                    if not pending:
+                        pending = next(stream, [])
+                        if not pending:
+                            return
+                    batch, pending = pending[:count], pending[count:]
+                    count -= len(batch)
+                    yield self.prepare(tableName, batch)
+
+            self.adapter.instrument = None
+            self.adapter.reset(tableName)
+            self.adapter.instrument = self.instrument
+            tableSize = 0
+
+            for i, iterSize in enumerate(sizes):
+                run = i + 1
+                stepSize = iterSize - tableSize
+
+                if repetition < 1:
+                    for batch in nextRecords(stepSize):
+                        self.adapter.bulkInsert(tableName, batch)
+                    tableSize = iterSize
+                    continue
+
+                print(f"Run {run} repetition {repetition}")
+                inStartTime, inEndTime, inTime = self.timedInsert(tableName, nextRecords(stepSize))
+
+                dataToStore.append({
+                    "run": run, "repetition": repetition, "tableSizeBefore": tableSize, "qSize": iterSize, "stepSize": stepSize,
+                    "inStartTime": inStartTime, "inEndTime": inEndTime, "inTime": inTime,
+                    "insertRate": (stepSize / inTime) if inTime else 0,
+                })
+                tableSize = iterSize
+
+        for i in range(self.iterations):
+            entries = [entry for entry in dataToStore if entry["run"] == i + 1]
+            aggregated.append(self.aggregate(i + 1, entries[0]["qSize"], entries, ["inTime", "insertRate"]))
+
+        return self.resultInfo(tableName, "growTest", dataToStore, aggregated)
+
+    @postProcess
+    def retrieveTest(self, tableName:str, sizeOfData:int):
+        # Range reads over [1, endID] with endID growing each run; assumes the table is already populated
+        dataToStore = []
+        aggregated = []
+        keyField = tableKeys[tableName]
+        startID = 1
+        self.setupSchema(tableName)
+        self.adapter.instrument = self.instrument
+
+        for i, endID in enumerate(self.sizes(sizeOfData)):
+            run = i + 1
+            print(startID, endID)
+
+            for _ in range(self.warmup):
+                self.adapter.rangeRead(tableName, keyField, startID, endID)
+
+            entries = []
+            for repetition in range(1, self.repetitions + 1):
+                print(f"Run {run} repetition {repetition}")
+
+                q1StartTime, q1EndTime, q1Time = self.timed("q1", endID - startID + 1, self.adapter.rangeRead, tableName, keyField, startID, endID)
+
+                entries.append({
+                    "run": run, "repetition": repetition, "qSize": endID,
+                    "q1StartTime": q1StartTime, "q1EndTime": q1EndTime, "q1Time": q1Time,
+                })
+
+            dataToStore.extend(entries)
+            aggregated.append(self.aggregate(run, endID, entries, ["q1Time"]))
+
+        return self.resultInfo(tableName, "search", dataToStore, aggregated)
+
+
+def compareVariants(adapterFactory, variants:dict[str, dict], workload):
+    # Runs the same workload once per variant (keyword arguments for adapterFactory) and stores
+    # each variant's throughput and tail latency side by side; full results are saved per variant.
+    # A workload returning several results (e.g. the query suite without and with indexes) gets one
+    # comparison per operation, so only like results are compared.
+    comparisons = {}
+    for label, options in variants.items():
+        print(f"Variant {label}")
+        adapter = adapterFactory(**options)
+        try:
+            results = workload(adapter)
+        finally:
+            adapter.closeConn()
+
+        for resultInfo in results if isinstance(results, list) else [results]:
+            comparison = comparisons.setdefault((resultInfo["tableName"], resultInfo["operation"]), {"resultInfo": resultInfo, "result": []})
+            comparison["result"].append({
+                "variant": label, "options": options,
+                "opsPerSec": {phase: summary["batch"]["opsPerSec"] for phase, summary in resultInfo["latency"].items()},
+                "p99": {phase: summary["request"]["p99"] for phase, summary in resultInfo["latency"].items()},
+            })
+
+    return [storeComparison(comparison["resultInfo"], comparison["result"]) for comparison in comparisons.values()]
+
+@postProcess
+def storeComparison(resultInfo:dict, comparison:list[dict]):
+    return {"saveDirectory": resultInfo["saveDirectory"], "tableName": resultInfo["tableName"], "dbms": resultInfo["dbms"],
+            "operation": f"{resultInfo['operation']}_variants", "result": comparison}
@@ -0,0 +1,161 @@
+import time, random, string
+from datetime import datetime
+from Workload import WorkloadRunner, postProcess, tableKeys
+from Datasets import Dataset
+
+# YCSB core workloads: operation proportions and the default request distribution
+coreWorkloads = {
+    "A": {"operations": {"read": 0.5, "update": 0.5}, "distribution": "zipfian"},
+    "B": {"operations": {"read": 0.95, "update": 0.05}, "distribution": "zipfian"},
+    "C": {"operations": {"read": 1.0}, "distribution": "zipfian"},
+    "D": {"operations": {"read": 0.95, "insert": 0.05}, "distribution": "latest"},
+    "E": {"operations": {"scan": 0.95, "insert": 0.05}, "distribution": "zipfian"},
+    "F": {"operations": {"read": 0.5, "readModifyWrite": 0.5}, "distribution": "zipfian"}
+}
+
+# Field rewritten by update and read-modify-write operations, per table
+def updateChanges(tableName:str, rng:random.Random):
+    if tableName == "UserPostComment":
+        return {"Content": "".join(rng.choices(string.ascii_letters + " ", k=500))}
+    return {"ReturnDate": datetime.utcnow()}
+
+
+class ZipfianGenerator:
+    # Gray et al. "Quickly generating billion-record synthetic databases", as used by YCSB.
+    # Returns ranks 0..items-1 with rank 0 the most popular; zeta is extended incrementally
+    # when the item count grows, so inserts do not trigger a full recomputation.
+    def __init__(self, items:int, rng:random.Random, theta:float=0.99) -> None:
+        self.rng = rng
+        self.theta = theta
+        self.alpha = 1 / (1 - theta)
+        self.zeta2 = 1 + 0.5 ** theta
+        self.items = 0
+        self.zetan = 0
+        self.resize(items)
+
+    def resize(self, items:int):
+        if items > self.items:
+            self.zetan += sum(1 / (i ** self.theta) for i in range(self.items + 1, items + 1))
+            self.items = items
+            self.eta = (1 - (2 / items) ** (1 - self.theta)) / (1 - self.zeta2 / self.zetan)
+
+    def next(self):
+        u = self.rng.random()
+        uz = u * self.zetan
+        if uz < 1:
+            return 0
+        if uz < self.zeta2:
+            return 1
+        return min(int(self.items * (self.eta * u - self.eta + 1) ** self.alpha), self.items - 1)
+
+
+class KeyChooser:
+    # Picks record IDs in 1..keyCount:
+    #   uniform  every key equally likely
+    #   zipfian  popular keys scattered over the key space (hashed ranks, like YCSB's scrambled zipfian)
+    #   latest   zipfian over recency, so the most recently inserted keys are the hottest
+    def __init__(self, distribution:str, keyCount:int, rng:random.Random) -> None:
+        self.distribution = distribution
+        self.keyCount = keyCount
+        self.rng = rng
+        self.zipfian = ZipfianGenerator(keyCount, rng) if distribution != "uniform" else None
+
+    def inserted(self, keyCount:int):
+        self.keyCount = keyCount
+        if self.distribution == "latest":
+            self.zipfian.resize(keyCount)
+
+    def next(self):
+        match self.distribution:
+            case "uniform":
+                return self.rng.randint(1, self.keyCount)
+            case "latest":
+                return max(self.keyCount - self.zipfian.next(), 1)
+            case _:
+                rank = self.zipfian.next()
+                return (rank * 2654435761) % self.keyCount + 1
+
+
+class YCSBRunner(WorkloadRunner):
+    # Loads the dataset once (untimed), then runs operationCount operations drawn from the workload's mix.
+    # Each operation type gets its own latency histogram; warmup runs operationCount // 10 untimed operations
+    # per warmup pass, and every repetition is a fresh run phase over the same loaded table.
+    def __init__(self, adapter, workload:str="A", distribution:str=None, operationCount:int=10000, maxScanLength:int=100, seed:int=0, **runnerOptions) -> None:
+        super().__init__(adapter, 1, **runnerOptions)
+        self.workload = workload
+        self.mix = coreWorkloads[workload]["operations"]
+        self.distribution = distribution or coreWorkloads[workload]["distribution"]
+        self.operationCount = operationCount
+        self.maxScanLength = maxScanLength
+        self.rng = random.Random(seed)
+
+    def load(self, documentData:list[dict] | Dataset, tableName:str):
+        self.adapter.reset(tableName)
+        self.setupSchema(tableName)
+        payload = None if isinstance(documentData, Dataset) else self.prepare(tableName, documentData)
+        for batch in self.insertBatches(tableName, documentData, payload, len(documentData)):
+            self.adapter.bulkInsert(tableName, batch)
+
+        # Template for inserted records: the first row of the dataset with a fresh key
+        first = next(documentData.batches(1)) if isinstance(documentData, Dataset) else documentData
+        return dict(first[0] if isinstance(first, list) else first.to_pylist()[0])
+
+    def operation(self, tableName:str, keyField:str, chooser:KeyChooser, template:dict):
+        # Returns (name, callable) with all inputs generated up front so only the database work is timed
+        name = self.rng.choices(list(self.mix), weights=list(self.mix.values()))[0]
+        adapter = self.adapter
+
+        match name:
+            case "read":
+                recordID = chooser.next()
+                return name, lambda: adapter.readRecord(tableName, keyField, recordID)
+            case "update":
+                recordID, changes = chooser.next(), updateChanges(tableName, self.rng)
+                return name, lambda: adapter.updateRecord(tableName, keyField, recordID, changes)
+            case "scan":
+                recordID, scanLength = chooser.next(), self.rng.randint(1, self.maxScanLength)
+                return name, lambda: adapter.rangeRead(tableName, keyField, recordID, recordID + scanLength - 1)
+            case "readModifyWrite":
+                recordID, changes = chooser.next(), updateChanges(tableName, self.rng)
+                return name, lambda: (adapter.readRecord(tableName, keyField, recordID), adapter.updateRecord(tableName, keyField, recordID, changes))
+            case "insert":
+                chooser.inserted(chooser.keyCount + 1)
+                rows = adapter.prepare(tableName, [{**template, keyField: chooser.keyCount}])
+                return name, lambda: adapter.bulkInsert(tableName, rows)
+
+    @postProcess
+    def run(self, documentData:list[dict] | Dataset, tableName:str):
+        keyField = tableKeys[tableName]
+        print(f"Loading {len(documentData)} records")
+        template = self.load(documentData, tableName)
+        chooser = KeyChooser(self.distribution, len(documentData), self.rng)
+
+        for _ in range(self.warmup):
+            for _ in range(self.operationCount // 10):
+                self.operation(tableName, keyField, chooser, template)[1]()
+
+        dataToStore = []
+        self.adapter.instrument = self.instrument
+        for repetition in range(1, self.repetitions + 1):
+            print(f"Run phase repetition {repetition}")
+            counts = {}
+            elapsedNs = 0
+            startTime = time.time()
+
+            with self.observed("run"):
+                for _ in range(self.operationCount):
+                    name, operation = self.operation(tableName, keyField, chooser, template)
+                    _, _, operationNs = self.instrument.measure(name, 1, operation)
+                    counts[name] = counts.get(name, 0) + 1
+                    elapsedNs += operationNs
+
+            dataToStore.append({
+                "run": 1, "repetition": repetition, "qSize": chooser.keyCount,
+                "startTime": startTime, "endTime": time.time(), "operations": counts,
+                "opTime": elapsedNs / 1e9, "throughput": self.operationCount / (elapsedNs / 1e9) if elapsedNs else 0,
+            })
+
+        aggregated = [self.aggregate(1, chooser.keyCount, dataToStore, ["opTime", "throughput"])]
+        resultInfo = self.resultInfo(tableName, f"ycsb{self.workload}_{self.distribution}", dataToStore, aggregated)
+        resultInfo.update({"workload": self.workload, "mix": self.mix, "distribution": self.distribution, "operationCount": self.operationCount})
+        return resultInfo
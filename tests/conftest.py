@@ -0,0 +1,20 @@
+import sys
+from os import path
+import pytest
+
+# The harness modules live flat in SystemFiles and import each other by name
+sys.path.insert(0, path.join(path.dirname(path.dirname(path.abspath(__file__))), "SystemFiles"))
+
+from Synthetic import SyntheticGenerator
+
+# Server-less engines from LocalDBMS.py, so the suite runs without any database installed
+standIns = ["mongomock", "sqlite", "memoryGraph", "fakeredis"]
+
+
+@pytest.fixture(scope="session")
+def dataDirectory(tmp_path_factory):
+    # Small synthetic copies of every benchmark table
+    directory = str(tmp_path_factory.mktemp("data"))
+    for tableName in ["loans", "books", "members", "UserPostComment"]:
+        SyntheticGenerator(1000, chunkSize=1000).write(tableName, directory)
+    return directory
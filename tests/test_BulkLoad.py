@@ -0,0 +1,33 @@
+import pytest
+from conftest import standIns
+from Engines import engineFactory
+from Datasets import Dataset
+
+
+@pytest.mark.parametrize("engine", standIns)
+def test_preloadKeepsOtherTables(engine, dataDirectory, tmp_path):
+    # Preloading one table empties only that table
+    adapter = engineFactory(engine, f"Preload_{engine}", str(tmp_path), dataDirectory)()
+    adapter.preload(Dataset("loans", dataDirectory, 1000), "loans", rows=500)
+    adapter.preload(Dataset("books", dataDirectory, 1000), "books", rows=300)
+
+    loans = adapter.rangeRead("loans", "LoanID", 1, 1000)
+    books = adapter.rangeRead("books", "BookID", 1, 1000)
+    adapter.closeConn()
+
+    assert len(loans) == 500
+    assert len(books) == 300
+
+
+@pytest.mark.parametrize("engine", standIns)
+def test_indexesBuiltAfterLoad(engine, dataDirectory, tmp_path):
+    # Indexes from an earlier load are gone while the rows go in and are rebuilt afterwards
+    adapter = engineFactory(engine, f"IndexAfter_{engine}", str(tmp_path), dataDirectory)()
+    adapter.preload(Dataset("loans", dataDirectory, 1000), "loans", rows=200, schema="secondary")
+    result = adapter.preload(Dataset("loans", dataDirectory, 1000), "loans", rows=200, schema="secondary")
+    after = adapter.describeSchema("loans")
+    adapter.closeConn()
+
+    secondary = lambda indexes: [index for index in indexes if index["fields"] in (["MemberID"], ["BookID"])]
+    assert not secondary(result["indexesDuringLoad"])
+    assert len(secondary(after)) == 2
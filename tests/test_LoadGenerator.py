@@ -0,0 +1,43 @@
+import pytest
+from functools import partial
+from conftest import standIns
+from Engines import engineFactory
+from Datasets import Dataset
+from LoadGenerator import LoadGenerator
+
+
+@pytest.mark.parametrize("engine", standIns)
+def test_asyncioExecutor(engine, dataDirectory, tmp_path):
+    # Every task shares one adapter, whose blocking reads run in worker threads unless the engine has an async driver
+    factory = engineFactory(engine, f"Async_{engine}", str(tmp_path), dataDirectory)
+    adapter = factory()
+    adapter.preload(Dataset("loans", dataDirectory, 500), "loans")
+    adapter.closeConn()
+
+    result = LoadGenerator(factory, "loans", 1000, executor="asyncio", duration=0.5).run([8])
+
+    level = result["result"][0]
+    assert level["requests"] > 0
+    assert level["errors"] == 0
+
+
+def failingAdapter(factory):
+    adapter = factory()
+
+    def rangeRead(tableName, keyField, startID, endID):
+        raise RuntimeError("request failed")
+
+    adapter.rangeRead = rangeRead
+    return adapter
+
+
+@pytest.mark.parametrize("executor", ["thread", "asyncio"])
+def test_failedRequestsAreNotThroughput(executor, dataDirectory, tmp_path):
+    # Requests that raise are errors only: no latency samples and no throughput
+    factory = engineFactory("null", "Failing", str(tmp_path), dataDirectory)
+    result = LoadGenerator(partial(failingAdapter, factory), "loans", 1000, executor=executor, duration=0.2).run([2])
+
+    level = result["result"][0]
+    assert level["errors"] > 0
+    assert level["requests"] == 0
+    assert level["throughput"] == 0
@@ -0,0 +1,57 @@
+import pytest
+from conftest import standIns
+from Engines import engineFactory
+from Datasets import Dataset
+from Schema import applySchema
+
+
+def rowCounts(result):
+    return [{key: value for key, value in entry.items() if key.endswith("Rows")} for entry in result["result"]]
+
+
+@pytest.mark.parametrize("engine", standIns)
+def test_indexVariantsReturnSameRows(engine, dataDirectory, tmp_path):
+    # The same seed draws the same search terms, so with and without the full-text index the same rows must match
+    adapter = engineFactory(engine, f"Queries_{engine}", str(tmp_path), dataDirectory)()
+    datasets = {"UserPostComment": Dataset("UserPostComment", dataDirectory, 1000)}
+
+    noIndex = adapter.querySuiteTest(datasets, 1, repetitions=30)
+    indexed = adapter.querySuiteTest(datasets, 1, indexed=True, repetitions=30)
+    text = adapter.querySuiteTest(datasets, 1, repetitions=30, schema="text")
+    adapter.closeConn()
+
+    assert noIndex["queries"] == ["contentSearch"]
+    assert any(entry["contentSearchRows"] for entry in noIndex["result"])
+    assert rowCounts(indexed) == rowCounts(noIndex)
+    assert rowCounts(text) == rowCounts(noIndex)
+
+
+@pytest.mark.parametrize("engine", standIns)
+def test_indexedSuiteAfterTextSchema(engine, dataDirectory, tmp_path):
+    # A run without a schema variant replaces the one an earlier run applied, so the suite's own indexes can be built and dropped
+    adapter = engineFactory(engine, f"AfterSchema_{engine}", str(tmp_path), dataDirectory)()
+    dataset = Dataset("UserPostComment", dataDirectory, 1000)
+    adapter.socialMediaRunTest(dataset, "UserPostComment", 1, repetitions=1, warmup=0, schema="text")
+
+    result = adapter.querySuiteTest({"UserPostComment": dataset}, 2, True, repetitions=2)
+    adapter.closeConn()
+
+    assert adapter.schemaVariant is None
+    assert result["indexed"]
+    assert all(entry["contentSearchRows"] is not None for entry in result["result"])
+
+
+def test_suiteKeepsSchemaTextIndex(dataDirectory, tmp_path):
+    # SQLite: the query suite's index calls leave a schema variant's trigger-maintained FTS5 table alone
+    adapter = engineFactory("sqlite", "SchemaText", str(tmp_path), dataDirectory)()
+    adapter.preload(Dataset("UserPostComment", dataDirectory, 1000), "UserPostComment", rows=500)
+    applySchema(adapter, "UserPostComment", "text")
+    adapter.createQueryIndexes("UserPostComment")
+    adapter.dropQueryIndexes("UserPostComment")
+    # Inserting fires the variant's triggers, which fail once their FTS5 table is gone
+    newRows = next(Dataset("UserPostComment", dataDirectory, 1000).batches(510))[500:]
+    adapter.bulkInsert("UserPostComment", adapter.prepare("UserPostComment", newRows))
+
+    assert "UserPostComment" in adapter.fullTextIndexed
+    assert adapter.query("contentSearch", {"term": "dolor"})
+    adapter.closeConn()
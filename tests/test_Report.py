@@ -0,0 +1,29 @@
+import statistics
+from Engines import engineFactory
+from Datasets import Dataset
+from ResultStore import ResultStore
+from Report import Report
+from Regression import Regression
+
+
+def test_growThroughputUsesStepSize(dataDirectory, tmp_path):
+    # Each grow step times only its own slice, so rows/sec must match the insertRate growTest records, not qSize / time
+    adapter = engineFactory("sqlite", "Grow", str(tmp_path), dataDirectory)()
+    result = adapter.growTest(Dataset("loans", dataDirectory, 1000), "loans", 4, repetitions=3, warmup=0)
+    adapter.closeConn()
+
+    expected = {}
+    for entry in result["result"]:
+        expected.setdefault(entry["qSize"], []).append(entry["insertRate"])
+    expected = {qSize: statistics.median(rates) for qSize, rates in expected.items()}
+
+    store = ResultStore(str(tmp_path))
+    runId = store.runs()[-1]["runId"]
+    series = Report(store).throughputBySize()[("loans", "growTest", "inTime")]
+    samples = Regression(store, runId, store, runId).throughputSamples(store, runId)
+    store.close()
+
+    for points in series.values():
+        assert points == expected
+    grown = {key[-1]: statistics.median(values) for key, values in samples.items() if key[3] == "growTest" and key[4] == "insert"}
+    assert grown == expected
@@ -0,0 +1,29 @@
+from Engines import engineFactory, engineVariants
+from Datasets import Dataset
+from Workload import compareVariants
+
+
+def test_compareVariantsPerOperation(dataDirectory, tmp_path):
+    # The query suite returns one result per index mode; each mode is compared across the variants on its own
+    factory = engineFactory("fakeredis", "Variants", str(tmp_path), dataDirectory)
+    datasets = {"UserPostComment": Dataset("UserPostComment", dataDirectory, 1000)}
+    workload = lambda system: [system.querySuiteTest(datasets, 1, indexed, repetitions=2) for indexed in [False, True]]
+
+    comparisons = compareVariants(factory, engineVariants("fakeredis", ["perKey", "pipeline"]), workload)
+
+    assert [comparison["operation"] for comparison in comparisons] == ["queries_noIndex_variants", "queries_indexed_variants"]
+    for comparison in comparisons:
+        assert [entry["variant"] for entry in comparison["result"]] == ["perKey", "pipeline"]
+        assert all(entry["opsPerSec"] for entry in comparison["result"])
+
+
+def test_compareVariantsMixedResults(dataDirectory, tmp_path):
+    # Results of different workloads in one list (a preload then reads) are compared apart, each across every variant
+    factory = engineFactory("sqlite", "Mixed", str(tmp_path), dataDirectory)
+    dataset = Dataset("loans", dataDirectory, 1000)
+    workload = lambda system: [system.preload(dataset, "loans", rows=500), system.libraryRetrieveTest("loans", 500, 2, repetitions=1)]
+
+    comparisons = compareVariants(factory, engineVariants("sqlite", ["default", "walNormal"]), workload)
+
+    assert [comparison["operation"] for comparison in comparisons] == ["bulkLoad_variants", "search_variants"]
+    assert all(len(comparison["result"]) == 2 for comparison in comparisons)